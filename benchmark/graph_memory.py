@@ -0,0 +1,56 @@
+'''
+Memory report of the incidence-list and incidence-set graphs.
+
+Compares the default representation, where every node and both directions of
+every undirected arc carry their own attribute dictionary, with the compact
+one, where nodes and arcs are slotted records and the two directions of an arc
+share a single info/status payload.
+'''
+
+from model.graph import GraphIncidenceList, GraphIncidenceSet
+from types import ClassType, FunctionType, ModuleType
+import gc
+import sys
+
+NUM_NODES = 20000
+HALF_DEGREE = 4
+SHARED = (type, ClassType, FunctionType, ModuleType)
+
+def deep_sizeof(root):
+    seen = set()
+    total = 0
+    pending = [root]
+    while pending:
+        obj = pending.pop()
+        if id(obj) in seen or isinstance(obj, SHARED): continue
+        seen.add(id(obj))
+        total += sys.getsizeof(obj)
+        pending.extend(gc.get_referents(obj))
+    return total
+
+def build_graph(graph, num_nodes, half_degree):
+    graph.add_nodes_from(range(num_nodes))
+    graph.add_arcs_from((i, (i + k) % num_nodes, float(k)) for i in xrange(num_nodes) for k in xrange(1, half_degree + 1))
+    return graph
+
+def measure(graph_class, compact):
+    empty = deep_sizeof(graph_class(compact))
+    nodes_only = deep_sizeof(build_graph(graph_class(compact), NUM_NODES, 0))
+    graph = build_graph(graph_class(compact), NUM_NODES, HALF_DEGREE)
+    total = deep_sizeof(graph)
+    per_node = float(nodes_only - empty) / NUM_NODES
+    per_arc = float(total - nodes_only) / graph.get_num_arcs()
+    return per_node, per_arc, total
+
+def bench(graph_class):
+    print "### {} ({} nodes, {} arcs)".format(graph_class.__name__, NUM_NODES, NUM_NODES * HALF_DEGREE)
+    print "{:>10} {:>12} {:>12} {:>12}".format("mode", "B/node", "B/arc", "total MB")
+    for compact in (False, True):
+        per_node, per_arc, total = measure(graph_class, compact)
+        mode = "compact" if compact else "default"
+        print "{:>10} {:>12.1f} {:>12.1f} {:>12.2f}".format(mode, per_node, per_arc, total / 2.0 ** 20)
+    print
+
+if __name__ == "__main__":
+    bench(GraphIncidenceList)
+    bench(GraphIncidenceSet)
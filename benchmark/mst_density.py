@@ -0,0 +1,41 @@
+'''
+Benchmark of the minimum spanning tree engines across graph densities.
+
+Kruskal pays for sorting all arcs, eager Prim keeps one heap entry per node
+and lazy Prim one heap entry per arc: the gap between the three grows with
+the average degree.
+'''
+
+from model.graph import GraphIncidenceMap
+from graph.mst import kruskal_mst, prim_mst
+import random
+import time
+
+NUM_NODES = 2000
+AVERAGE_DEGREES = [4, 16, 64]
+
+def build_graph(num_nodes, average_degree):
+    graph = GraphIncidenceMap()
+    graph.add_nodes_from(range(num_nodes))
+    arcs = [(i, i + 1, random.random()) for i in range(num_nodes - 1)]
+    for _ in range(num_nodes * average_degree / 2):
+        arcs.append((random.randrange(num_nodes), random.randrange(num_nodes), random.random()))
+    graph.add_arcs_from(arcs)
+    return graph
+
+def time_engine(engine, graph):
+    start = time.time()
+    mst = engine(graph)
+    return time.time() - start, sum(arc.info for arc in mst)
+
+if __name__ == "__main__":
+    random.seed(0)
+    engines = [("kruskal", kruskal_mst), ("prim eager", prim_mst), ("prim lazy", lambda graph: prim_mst(graph, lazy = True))]
+    print "### MST on {} nodes".format(NUM_NODES)
+    print "{:>8} {:>8} {:>12} {:>12} {:>12}".format("degree", "arcs", *[name for name, _ in engines])
+    for average_degree in AVERAGE_DEGREES:
+        graph = build_graph(NUM_NODES, average_degree)
+        results = [time_engine(engine, graph) for _, engine in engines]
+        weights = set(round(mst_weight, 6) for _, mst_weight in results)
+        if len(weights) != 1: print "MST weight mismatch: {}".format(str(weights))
+        print "{:>8} {:>8} {:>11.3f}s {:>11.3f}s {:>11.3f}s".format(average_degree, graph.get_num_arcs(), *[elapsed for elapsed, _ in results])
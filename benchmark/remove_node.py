@@ -0,0 +1,72 @@
+'''
+Benchmark of remove_node on the incidence-list and incidence-set graphs.
+
+The per-node cost of the mirror-based removal depends only on the degree of the
+removed node, so it stays flat while the graph grows; the former full scan of
+every incidence grows linearly with the size of the graph.
+'''
+
+from model.graph import GraphIncidenceList, GraphIncidenceSet
+from sets import Set
+import random
+import time
+
+SIZES = [1000, 4000, 16000]
+HALF_DEGREE = 4
+REMOVALS = 100
+
+def build_graph(graph, num_nodes, half_degree):
+    for i in range(num_nodes):
+        graph.add_node(i)
+    for i in range(num_nodes):
+        for k in range(1, half_degree + 1):
+            graph.add_arc(i, (i + k) % num_nodes)
+    return graph
+
+def scan_remove_node_list(graph, node_id):
+    try:
+        del graph._nodes[node_id]
+        del graph._inc[node_id]
+    except KeyError:
+        return
+    for arcs_list in graph._inc.values():
+        record = arcs_list.get_first_record()
+        while record is not None:
+            arc = record.element
+            if arc._head == node_id: arcs_list.delete_record(record)
+            record = record._next
+
+def scan_remove_node_set(graph, node_id):
+    try:
+        del graph._nodes[node_id]
+        del graph._inc[node_id]
+    except KeyError:
+        return
+    for arcs_set in graph._inc.values():
+        arcs_to_remove = Set()
+        for arc in arcs_set:
+            if arc._head == node_id: arcs_to_remove.add(arc)
+        arcs_set.difference_update(arcs_to_remove)
+
+def time_removals(graph, remove, victims):
+    start = time.time()
+    for node_id in victims:
+        remove(graph, node_id)
+    return (time.time() - start) / len(victims) * 1e6
+
+def bench(graph_class, scan_remove):
+    print "### {}".format(graph_class.__name__)
+    print "{:>8} {:>14} {:>14}".format("nodes", "mirror us/op", "scan us/op")
+    for num_nodes in SIZES:
+        victims = random.sample(range(num_nodes), REMOVALS)
+        graph = build_graph(graph_class(), num_nodes, HALF_DEGREE)
+        mirror = time_removals(graph, graph_class.remove_node, victims)
+        graph = build_graph(graph_class(), num_nodes, HALF_DEGREE)
+        scan = time_removals(graph, scan_remove, victims)
+        print "{:>8} {:>14.1f} {:>14.1f}".format(num_nodes, mirror, scan)
+    print
+
+if __name__ == "__main__":
+    random.seed(0)
+    bench(GraphIncidenceList, scan_remove_node_list)
+    bench(GraphIncidenceSet, scan_remove_node_set)
@@ -0,0 +1,48 @@
+'''
+Benchmark of the strongly connected components of random directed graphs.
+
+Tarjan's search labels every component in a single linear pass; the repeated
+dfs approach intersects, for every node not yet labelled, the sets of nodes
+reachable from it forwards and backwards, which is quadratic on graphs with
+many small components.
+'''
+
+from model.graph import DiGraph
+from graph.scc import strongly_connected_components
+import random
+import time
+
+SIZES = [500, 1000, 2000, 4000]
+DEGREE = 1.5
+
+def build_graph(num_nodes, degree):
+    graph = DiGraph()
+    graph.add_nodes_from(range(num_nodes))
+    graph.add_arcs_from((random.randrange(num_nodes), random.randrange(num_nodes)) for i in xrange(int(num_nodes * degree)))
+    return graph
+
+def repeated_dfs(graph):
+    labels = {}
+    sizes = []
+    for node in graph.get_nodes():
+        if node._id in labels: continue
+        forward = set(reached._id for reached in graph.dfs(node._id))
+        backward = set(reached._id for reached in graph.dfs(node._id, reverse = True))
+        for member_id in forward & backward: labels[member_id] = len(sizes)
+        sizes.append(len(forward & backward))
+    return labels, sizes
+
+def timed(function, graph):
+    start = time.time()
+    labels, sizes = function(graph)
+    return time.time() - start, len(sizes)
+
+if __name__ == "__main__":
+    random.seed(0)
+    print "{:>8} {:>8} {:>12} {:>12} {:>12}".format("nodes", "arcs", "components", "tarjan s", "dfs s")
+    for num_nodes in SIZES:
+        graph = build_graph(num_nodes, DEGREE)
+        tarjan, components = timed(strongly_connected_components, graph)
+        naive, naive_components = timed(repeated_dfs, graph)
+        assert components == naive_components
+        print "{:>8} {:>8} {:>12} {:>12.3f} {:>12.3f}".format(num_nodes, graph.get_num_arcs(), components, tarjan, naive)
@@ -0,0 +1,48 @@
+'''
+Benchmark of triangle counting on random graphs.
+
+The naive count tests every pair of neighbours of every node with
+are_adjacent, which scans an incidence list per test; the degree-ordered
+count intersects the sorted neighbours of the two ends of each arc, once per
+triangle.
+'''
+
+from model.graph import GraphIncidenceSet
+from graph.triangles import triangles
+import random
+import time
+
+SIZES = [250, 500, 1000, 2000]
+DEGREE = 8
+
+def build_graph(num_nodes, degree):
+    graph = GraphIncidenceSet()
+    graph.add_nodes_from(range(num_nodes))
+    graph.add_arcs_from((random.randrange(num_nodes), random.randrange(num_nodes)) for i in xrange(num_nodes * degree / 2))
+    return graph
+
+def naive_triangles(graph):
+    counts = {}
+    for node in graph.get_nodes():
+        neighbours = sorted(set(arc._head for arc in graph.get_incident_arcs(node._id) if arc._head != node._id))
+        count = 0
+        for i in xrange(len(neighbours)):
+            for j in xrange(i + 1, len(neighbours)):
+                if graph.are_adjacent(neighbours[i], neighbours[j]): count += 1
+        counts[node._id] = count
+    return counts
+
+def timed(function, graph):
+    start = time.time()
+    counts = function(graph)
+    return time.time() - start, counts
+
+if __name__ == "__main__":
+    random.seed(0)
+    print "{:>8} {:>8} {:>10} {:>12} {:>12}".format("nodes", "arcs", "triangles", "ordered s", "naive s")
+    for num_nodes in SIZES:
+        graph = build_graph(num_nodes, DEGREE)
+        ordered, counts = timed(triangles, graph)
+        naive, naive_counts = timed(naive_triangles, graph)
+        assert counts == naive_counts
+        print "{:>8} {:>8} {:>10} {:>12.3f} {:>12.3f}".format(num_nodes, graph.get_num_arcs(), sum(counts.itervalues()) / 3, ordered, naive)
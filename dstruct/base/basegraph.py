@@ -5,6 +5,8 @@ class basegraph:
     add_node(element)
     remove_node(node_id)
     add_arc(nodeA_id, nodeB_id, info)
+    add_nodes_from(elements)
+    add_arcs_from(arcs, add_missing_nodes)
     remove_arc(nodeA_id, nodeB_id)
     set_arc_status(nodeA_id, nodeB_id, status)
     get_nodes()
@@ -16,6 +18,9 @@ class basegraph:
     are_adjacent(nodeA_id, nodeB_id)
     bfs(root_node_id)
     dfs(root_node_id)
+    iter_bfs(root_node_id, max_depth, visitor, details)
+    iter_dfs(root_node_id, max_depth, visitor, details)
+    is_directed()
     """
     
     def add_node(self, element):
@@ -55,6 +60,30 @@ class basegraph:
         """
         raise NotImplementedError("add_arc: You should have implemented this method!")    
     
+    def add_nodes_from(self, elements):
+        """
+        Adds a new node in graph for each one of the specified elements.
+        
+        add_nodes_from(elements) -> None
+        
+        @type elements: iterable
+        @param elements: elements to be assigned to the new nodes.    
+        """
+        raise NotImplementedError("add_nodes_from: You should have implemented this method!")
+    
+    def add_arcs_from(self, arcs, add_missing_nodes = False):
+        """
+        Adds the specified undirected arcs in graph.
+        
+        add_arcs_from(arcs, add_missing_nodes) -> None
+        
+        @type arcs: iterable
+        @param arcs: (nodeA_id, nodeB_id) or (nodeA_id, nodeB_id, info) tuples.
+        @type add_missing_nodes: boolean
+        @param add_missing_nodes: if True, missing end nodes are added with their id as element, otherwise their arcs are skipped.
+        """
+        raise NotImplementedError("add_arcs_from: You should have implemented this method!")
+    
     def remove_arc(self, nodeA_id, nodeB_id):
         """
         Removed from graph the undirected arc between nodeA and nodeB.
@@ -196,6 +225,57 @@ class basegraph:
         @rtype: list
         @return: FIFO path from graph's root to all other nodes in graph.
         """
-        raise NotImplementedError("bfs: You should have implemented this method!")  
+        raise NotImplementedError("bfs: You should have implemented this method!")
+    
+    def iter_dfs(self, root_node_id, max_depth = None, visitor = None, details = False):
+        """
+        Lazily yields the nodes in LIFO order from graph's root.
+        
+        iter_dfs(root_node_id, max_depth, visitor, details) -> nodes
+        
+        @type root_node_id: integer
+        @param root_node_id: graph's root's id.
+        @type max_depth: integer
+        @param max_depth: nodes deeper than max_depth are not visited, None for no limit.
+        @type visitor: callable
+        @param visitor: visitor(node, depth, parent_id), the search stops after the node for which it returns True.
+        @type details: boolean
+        @param details: if True, (node, depth, parent_id) tuples are yielded instead of nodes.
+        
+        @rtype: generator
+        @return: nodes reachable from graph's root, in LIFO order.
+        """
+        raise NotImplementedError("iter_dfs: You should have implemented this method!")
     
-    
\ No newline at end of file
+    def iter_bfs(self, root_node_id, max_depth = None, visitor = None, details = False):
+        """
+        Lazily yields the nodes in FIFO order from graph's root.
+        
+        iter_bfs(root_node_id, max_depth, visitor, details) -> nodes
+        
+        @type root_node_id: integer
+        @param root_node_id: graph's root's id.
+        @type max_depth: integer
+        @param max_depth: nodes deeper than max_depth are not visited, None for no limit.
+        @type visitor: callable
+        @param visitor: visitor(node, depth, parent_id), the search stops after the node for which it returns True.
+        @type details: boolean
+        @param details: if True, (node, depth, parent_id) tuples are yielded instead of nodes.
+        
+        @rtype: generator
+        @return: nodes reachable from graph's root, in FIFO order.
+        """
+        raise NotImplementedError("iter_bfs: You should have implemented this method!")
+    
+    def is_directed(self):
+        """
+        Returns True if the arcs of the graph are directed, otherwise returns False.
+        
+        Undirected implementations can rely on this default.
+        
+        is_directed() -> True/False
+        
+        @rtype: boolean
+        @return: True if the arcs of the graph are directed, otherwise False.
+        """
+        return False
@@ -0,0 +1,636 @@
+#Interface Import
+from model.base.basegraph import basegraph
+from threading import Condition, Lock
+from contextlib import contextmanager
+import copy
+import time
+
+class LockStatistics:
+    """
+    Counters of the lock of a ConcurrentGraph.
+
+    An acquisition is contended when it has to wait for another thread. Wait
+    times run from the request of the lock to its acquisition, hold times from
+    its acquisition to its release, and the hold times of concurrent readers
+    add up.
+    """
+
+    def __init__(self):
+        self._reads = 0
+        self._writes = 0
+        self._contended_reads = 0
+        self._contended_writes = 0
+        self._read_wait_time = 0.0
+        self._write_wait_time = 0.0
+        self._read_hold_time = 0.0
+        self._write_hold_time = 0.0
+        self._max_write_hold_time = 0.0
+
+    def get_num_reads(self):
+        """
+        Returns the number of acquisitions of the lock by readers.
+
+        get_num_reads() -> number_of_reads
+
+        @rtype: integer
+        @return: number of read acquisitions.
+        """
+        return self._reads
+
+    def get_num_writes(self):
+        """
+        Returns the number of acquisitions of the lock by writers, a write batch counting once.
+
+        get_num_writes() -> number_of_writes
+
+        @rtype: integer
+        @return: number of write acquisitions.
+        """
+        return self._writes
+
+    def get_contended_reads(self):
+        """
+        Returns the number of read acquisitions which had to wait for a writer.
+
+        get_contended_reads() -> number_of_reads
+
+        @rtype: integer
+        @return: number of contended read acquisitions.
+        """
+        return self._contended_reads
+
+    def get_contended_writes(self):
+        """
+        Returns the number of write acquisitions which had to wait for readers or another writer.
+
+        get_contended_writes() -> number_of_writes
+
+        @rtype: integer
+        @return: number of contended write acquisitions.
+        """
+        return self._contended_writes
+
+    def get_read_wait_time(self):
+        """
+        Returns the total time spent by readers waiting for the lock.
+
+        get_read_wait_time() -> seconds
+
+        @rtype: float
+        @return: total read wait time, in seconds.
+        """
+        return self._read_wait_time
+
+    def get_write_wait_time(self):
+        """
+        Returns the total time spent by writers waiting for the lock.
+
+        get_write_wait_time() -> seconds
+
+        @rtype: float
+        @return: total write wait time, in seconds.
+        """
+        return self._write_wait_time
+
+    def get_read_hold_time(self):
+        """
+        Returns the total time the lock has been held by readers.
+
+        get_read_hold_time() -> seconds
+
+        @rtype: float
+        @return: total read hold time, in seconds.
+        """
+        return self._read_hold_time
+
+    def get_write_hold_time(self):
+        """
+        Returns the total time the lock has been held by writers.
+
+        get_write_hold_time() -> seconds
+
+        @rtype: float
+        @return: total write hold time, in seconds.
+        """
+        return self._write_hold_time
+
+    def get_max_write_hold_time(self):
+        """
+        Returns the longest time the lock has been held by a single writer.
+
+        get_max_write_hold_time() -> seconds
+
+        @rtype: float
+        @return: maximum write hold time, in seconds.
+        """
+        return self._max_write_hold_time
+
+    def __repr__(self):
+        return "#(reads: {} ({} contended, wait {:.6f}s, hold {:.6f}s), writes: {} ({} contended, wait {:.6f}s, hold {:.6f}s, max hold {:.6f}s))".format(
+            self._reads, self._contended_reads, self._read_wait_time, self._read_hold_time,
+            self._writes, self._contended_writes, self._write_wait_time, self._write_hold_time, self._max_write_hold_time)
+
+    def __str__(self):
+        return self.__repr__()
+
+class _ReadWriteLock:
+    # Many readers or a single writer. Waiting writers block new readers, so
+    # that a steady flow of readers cannot starve them.
+
+    def __init__(self):
+        self._cond = Condition(Lock())
+        self._readers = 0
+        self._writer = False
+        self._waiting_writers = 0
+        self._stats = LockStatistics()
+
+    def acquire_read(self):
+        requested = time.time()
+        with self._cond:
+            contended = self._writer or self._waiting_writers > 0
+            while self._writer or self._waiting_writers > 0: self._cond.wait()
+            self._readers += 1
+            acquired = time.time()
+            stats = self._stats
+            stats._reads += 1
+            if contended:
+                stats._contended_reads += 1
+                stats._read_wait_time += acquired - requested
+        return acquired
+
+    def release_read(self, acquired):
+        with self._cond:
+            self._stats._read_hold_time += time.time() - acquired
+            self._readers -= 1
+            if self._readers == 0: self._cond.notify_all()
+
+    def acquire_write(self):
+        requested = time.time()
+        with self._cond:
+            contended = self._writer or self._readers > 0
+            self._waiting_writers += 1
+            while self._writer or self._readers > 0: self._cond.wait()
+            self._waiting_writers -= 1
+            self._writer = True
+            acquired = time.time()
+            stats = self._stats
+            stats._writes += 1
+            if contended:
+                stats._contended_writes += 1
+                stats._write_wait_time += acquired - requested
+        return acquired
+
+    def release_write(self, acquired):
+        with self._cond:
+            held = time.time() - acquired
+            stats = self._stats
+            stats._write_hold_time += held
+            if held > stats._max_write_hold_time: stats._max_write_hold_time = held
+            self._writer = False
+            self._cond.notify_all()
+
+class ConcurrentGraph(basegraph):
+    """
+    Thread-safe wrapper of a graph.
+
+    Queries hold a shared read lock, so any number of threads can search the
+    graph together, while updates hold an exclusive write lock. Lazy searches
+    are run to completion under the read lock and then yielded, and incident
+    arcs are returned as copies, so that no reader ever iterates the graph
+    after releasing the lock.
+    """
+
+    def __init__(self, graph):
+        self._graph = graph
+        self._lock = _ReadWriteLock()
+
+    @contextmanager
+    def _reading(self):
+        acquired = self._lock.acquire_read()
+        try:
+            yield self._graph
+        finally:
+            self._lock.release_read(acquired)
+
+    @contextmanager
+    def write_batch(self):
+        """
+        Holds the write lock for a batch of updates.
+
+        The wrapped graph is yielded, and every update and query made on it
+        inside the with block runs without further locking. Methods of the
+        ConcurrentGraph itself must not be called inside the block: the lock
+        is not reentrant.
+
+        write_batch() -> context manager
+
+        @rtype: context manager
+        @return: context manager yielding the wrapped graph.
+        """
+        acquired = self._lock.acquire_write()
+        try:
+            yield self._graph
+        finally:
+            self._lock.release_write(acquired)
+
+    def get_graph(self):
+        """
+        Returns the wrapped graph, which is not protected by the lock.
+
+        get_graph() -> graph
+
+        @rtype: basegraph
+        @return: wrapped graph.
+        """
+        return self._graph
+
+    def get_lock_statistics(self):
+        """
+        Returns a copy of the lock counters, taken atomically.
+
+        get_lock_statistics() -> statistics
+
+        @rtype: LockStatistics
+        @return: lock counters.
+        """
+        with self._lock._cond:
+            return copy.copy(self._lock._stats)
+
+    def reset_lock_statistics(self):
+        """
+        Resets the lock counters.
+
+        reset_lock_statistics() -> None
+        """
+        with self._lock._cond:
+            self._lock._stats = LockStatistics()
+
+    def add_node(self, element, node_id = None):
+        """
+        Adds a new node in graph, with the specified element.
+
+        add_node(element) -> None
+
+        @type element: object
+        @param element: element to be assigned to the new node.
+        """
+        with self.write_batch() as graph:
+            if node_id is None: graph.add_node(element)
+            else: graph.add_node(element, node_id)
+
+    def remove_node(self, node_id):
+        """
+        Removes from graph the node with the specified id.
+
+        remove_node(node_id) -> None
+
+        @type node_id: integer
+        @param node_id: id of the node to be removed from graph.
+        """
+        with self.write_batch() as graph:
+            graph.remove_node(node_id)
+
+    def add_arc(self, nodeA_id, nodeB_id, info = None):
+        """
+        Adds a new arc in graph, between node_A and node_B with the specified id.
+
+        add_arc(nodeA_id, nodeB_id, info) -> None
+
+        @type nodeA_id: integer
+        @param nodeA_id: id of tail node.
+        @type nodeB_id: integer
+        @param nodeB_id: id of head node.
+        @type info: object
+        @param info: element to be added as info to the new arc.
+        """
+        with self.write_batch() as graph:
+            graph.add_arc(nodeA_id, nodeB_id, info)
+
+    def add_nodes_from(self, elements):
+        """
+        Adds a new node in graph for each one of the specified elements.
+
+        add_nodes_from(elements) -> None
+
+        @type elements: iterable
+        @param elements: elements to be assigned to the new nodes.
+        """
+        with self.write_batch() as graph:
+            graph.add_nodes_from(elements)
+
+    def add_arcs_from(self, arcs, add_missing_nodes = False):
+        """
+        Adds the specified arcs in graph.
+
+        add_arcs_from(arcs, add_missing_nodes) -> None
+
+        @type arcs: iterable
+        @param arcs: (nodeA_id, nodeB_id) or (nodeA_id, nodeB_id, info) tuples.
+        @type add_missing_nodes: boolean
+        @param add_missing_nodes: if True, missing end nodes are added with their id as element, otherwise their arcs are skipped.
+        """
+        with self.write_batch() as graph:
+            graph.add_arcs_from(arcs, add_missing_nodes)
+
+    def remove_arc(self, nodeA_id, nodeB_id):
+        """
+        Removes from graph the arc between nodeA and nodeB.
+
+        remove_arc(nodeA_id, nodeB_id) -> None
+
+        @type nodeA_id: integer
+        @param nodeA_id: id of tail node.
+        @type nodeB_id: integer
+        @param nodeB_id: id of head node.
+        """
+        with self.write_batch() as graph:
+            graph.remove_arc(nodeA_id, nodeB_id)
+
+    def set_arc_status(self, nodeA_id, nodeB_id, status):
+        """
+        Sets the status of the arc between nodeA and nodeB.
+
+        set_arc_status(nodeA_id, nodeB_id, status) -> None
+
+        @type nodeA_id: integer
+        @param nodeA_id: id of tail node.
+        @type nodeB_id: integer
+        @param nodeB_id: id of head node.
+        @type status: object
+        @param status: element to be added as status info to the specified arc.
+        """
+        with self.write_batch() as graph:
+            graph.set_arc_status(nodeA_id, nodeB_id, status)
+
+    def get_nodes(self):
+        """
+        Returns all nodes in graph
+        get_nodes() -> nodes_list
+
+        @rtype: list
+        @return: list of nodes in graph.
+        """
+        with self._reading() as graph:
+            return graph.get_nodes()
+
+    def get_arcs(self):
+        """
+        Returns all arcs in graph.
+
+        get_arcs() -> arcs_list
+
+        @rtype: list
+        @return: list of arcs in graph.
+        """
+        with self._reading() as graph:
+            return graph.get_arcs()
+
+    def get_num_nodes(self):
+        """
+        Returns the number of nodes in graph.
+
+        get_num_nodes() -> number_of_nodes
+
+        @rtype: integer
+        @return: number of nodes in graph.
+        """
+        with self._reading() as graph:
+            return graph.get_num_nodes()
+
+    def get_num_arcs(self):
+        """
+        Returns the number of arcs in graph.
+
+        get_num_arcs() -> number_of_arcs
+
+        @rtype: integer
+        @return: number of arcs in graph.
+        """
+        with self._reading() as graph:
+            return graph.get_num_arcs()
+
+    def is_node_in_graph(self, node_id):
+        """
+        Returns True if the node with the specified id is in graph, otherwise returns False.
+
+        is_node_in_graph(node_id) -> True/False
+
+        @type node_id: integer
+        @param node_id: id of the node to be looked up.
+
+        @rtype: boolean
+        @return: True if the node is in graph, otherwise False.
+        """
+        with self._reading() as graph:
+            return graph.is_node_in_graph(node_id)
+
+    def is_directed(self):
+        """
+        Returns True if the arcs of the wrapped graph are directed, otherwise returns False.
+
+        is_directed() -> True/False
+
+        @rtype: boolean
+        @return: True if the arcs of the wrapped graph are directed, otherwise False.
+        """
+        with self._reading() as graph:
+            return graph.is_directed()
+
+    def get_node_by_id(self, node_id):
+        """
+        Returns node in graph by id.
+
+        get_node_by_id(node_id) -> node
+
+        @type node_id: integer
+        @param node_id: id of the requested node in graph.
+
+        @rtype: node
+        @return: node corresponding to the given id.
+        """
+        with self._reading() as graph:
+            return graph.get_node_by_id(node_id)
+
+    def get_incident_arcs(self, node_id):
+        """
+        Returns a copy of the incident arcs to the specified node.
+
+        get_incident_arcs(node_id) -> list
+
+        @type node_id: integer
+        @param node_id: id of node whos incident arcs have been requested.
+
+        @rtype: list
+        @return: all arcs that are incident to the node whose id has been specified.
+        """
+        with self._reading() as graph:
+            return list(graph.get_incident_arcs(node_id))
+
+    def get_in_arcs(self, node_id):
+        """
+        Returns a copy of the arcs entering the specified node of the wrapped directed graph.
+
+        get_in_arcs(node_id) -> list
+
+        @type node_id: integer
+        @param node_id: id of node whos incoming arcs have been requested.
+
+        @rtype: list
+        @return: all arcs whose head is the node whose id has been specified.
+        """
+        with self._reading() as graph:
+            return list(graph.get_in_arcs(node_id))
+
+    def are_adjacent(self, nodeA_id, nodeB_id):
+        """
+        Returns True if nodeA and nodeB are adjacent, otherwise returns False.
+
+        are_adjacent(nodeA_id, nodeB_id) -> True/False
+
+        @type nodeA_id: integer
+        @param nodeA_id: first node's id.
+        @type nodeB_id: integer
+        @param nodeB_id: second node's id.
+
+        @rtype: boolean
+        @return: True if nodeA and nodeB are adjacent, otherwise False.
+        """
+        with self._reading() as graph:
+            return graph.are_adjacent(nodeA_id, nodeB_id)
+
+    def dfs(self, root_node_id):
+        """
+        Returns the LIFO path-as-list from graph's root to all other nodes in graph.
+
+        dfs(root_node_id) -> path
+
+        @type root_node_id: integer
+        @param root_node_id: graph's root's id.
+
+        @rtype: list
+        @return: LIFO path from graph's root to all other nodes in graph.
+        """
+        with self._reading() as graph:
+            return graph.dfs(root_node_id)
+
+    def bfs(self, root_node_id):
+        """
+        Returns the FIFO path-as-list from graph's root to all other nodes in graph.
+
+        bfs(root_node_id) -> path
+
+        @type root_node_id: integer
+        @param root_node_id: graph's root's id.
+
+        @rtype: list
+        @return: FIFO path from graph's root to all other nodes in graph.
+        """
+        with self._reading() as graph:
+            return graph.bfs(root_node_id)
+
+    def iter_dfs(self, root_node_id, max_depth = None, visitor = None, details = False):
+        """
+        Yields the nodes in LIFO order from graph's root, visited under a single read lock.
+
+        iter_dfs(root_node_id, max_depth, visitor, details) -> nodes
+
+        @type root_node_id: integer
+        @param root_node_id: graph's root's id.
+        @type max_depth: integer
+        @param max_depth: nodes deeper than max_depth are not visited, None for no limit.
+        @type visitor: callable
+        @param visitor: visitor(node, depth, parent_id), the search stops after the node for which it returns True.
+        @type details: boolean
+        @param details: if True, (node, depth, parent_id) tuples are yielded instead of nodes.
+
+        @rtype: iterator
+        @return: nodes reachable from graph's root, in LIFO order.
+        """
+        with self._reading() as graph:
+            return iter(list(graph.iter_dfs(root_node_id, max_depth, visitor, details)))
+
+    def iter_bfs(self, root_node_id, max_depth = None, visitor = None, details = False):
+        """
+        Yields the nodes in FIFO order from graph's root, visited under a single read lock.
+
+        iter_bfs(root_node_id, max_depth, visitor, details) -> nodes
+
+        @type root_node_id: integer
+        @param root_node_id: graph's root's id.
+        @type max_depth: integer
+        @param max_depth: nodes deeper than max_depth are not visited, None for no limit.
+        @type visitor: callable
+        @param visitor: visitor(node, depth, parent_id), the search stops after the node for which it returns True.
+        @type details: boolean
+        @param details: if True, (node, depth, parent_id) tuples are yielded instead of nodes.
+
+        @rtype: iterator
+        @return: nodes reachable from graph's root, in FIFO order.
+        """
+        with self._reading() as graph:
+            return iter(list(graph.iter_bfs(root_node_id, max_depth, visitor, details)))
+
+    def __repr__(self):
+        with self._reading() as graph:
+            return graph.__repr__()
+
+    def __str__(self):
+        return self.__repr__()
+
+def __test(graph):
+    """
+    Concurrent Graph Test.
+
+    __test(graph) -> None
+
+    @type graph: basegraph
+    @param graph: empty graph instance, to be wrapped.
+    """
+    print "### iPATH TEST DATA STRUCTURE"
+    print "### Data Type: Graph ({})".format(str(graph.__class__.__bases__[0].__name__))
+    print "### Implementation: ConcurrentGraph ({})".format(str(graph.__class__.__name__))
+
+    concurrent = ConcurrentGraph(graph)
+    concurrent.add_nodes_from(range(100))
+
+    print "\n*** WRITE BATCH ***\n"
+    with concurrent.write_batch() as g:
+        for i in range(99):
+            g.add_arc(i, i + 1)
+    print "numArcs after one batch of 99 add_arc: {}\n".format(str(concurrent.get_num_arcs()))
+
+    print "\n*** CONCURRENT READERS AND WRITERS ***\n"
+
+    def read(i):
+        return len(concurrent.bfs(i % 100)), concurrent.are_adjacent(i % 100, (i + 1) % 100)
+
+    def write(i):
+        with concurrent.write_batch() as g:
+            g.remove_arc(i, i + 1)
+            g.add_arc(i, i + 1)
+
+    pool = ThreadPool(8)
+    readers = pool.map_async(read, range(400))
+    pool.map(write, range(99))
+    print "reads: {}, all adjacent: {}".format(str(len(readers.get())), str(all(adjacent for size, adjacent in readers.get()[:99])))
+    pool.close()
+    pool.join()
+    print "numArcs: {}\n".format(str(concurrent.get_num_arcs()))
+
+    print "\n*** DIRECTEDNESS ***\n"
+    print "directed: {}".format(str(concurrent.is_directed()))
+    if concurrent.is_directed():
+        concurrent.add_arc(99, 50)
+        print "in arcs of 50: {}".format(str(sorted(arc._tail for arc in concurrent.get_in_arcs(50))))
+    print
+
+    print "\n*** LOCK STATISTICS ***\n"
+    print "{}\n".format(str(concurrent.get_lock_statistics()))
+
+    print "\n### END OF TEST ###\n"
+
+if __name__ == "__main__":
+    from model.graph import GraphIncidenceSet, DiGraph
+    from multiprocessing.pool import ThreadPool
+    __test(GraphIncidenceSet())
+    __test(DiGraph())
@@ -2,7 +2,18 @@ from model.base.basegraph import basegraph
 from model.linkedlist import DoubleLinkedList as LinkedList
 from model.queue import QueueLinkedList as Queue
 from model.stack import StackLinkedList as Stack    
+from model.queue import QueueDeque
+from model.stack import StackArrayList
 from sets import Set
+from array import array
+from bisect import bisect_left
+from contextlib import contextmanager
+from weakref import WeakSet
+from collections import OrderedDict
+from itertools import chain
+import gc
+#Exception Import
+from exception.exceptions import FrozenGraphError, InvalidParameterError
 
 class GraphIncidenceList(basegraph):
     
@@ -37,7 +48,8 @@ class GraphIncidenceList(basegraph):
             self._tail = tail
             self._head = head
             self.info = info
-            self.status = status        
+            self.status = status
+            self._mirror = None        
         
         def __eq__(self, other):
             return self._tail == other._tail and self._head == other._head
@@ -47,12 +59,101 @@ class GraphIncidenceList(basegraph):
         
         def __str__(self):
             return self.__repr__()
-    
-    def __init__(self):
+
+    class CompactNode(object):
+
+        __slots__ = ("_id", "_deg", "element", "status")
+
+        def __init__(self, node_id, element, status = None):
+            self._id = node_id
+            self._deg = 0
+            self.element = element
+            self.status = status
+
+        def __eq__(self, other):
+            return self.element == other.element
+
+        def __cmp__(self, other):
+            if self.element > other.element: return 1
+            elif self.element < other.element: return -1
+            else: return 0
+
+        def __hash__(self):
+            return hash(self._id)
+
+        def __repr__(self):
+            return "*(id: {}, element: {}, status: {})".format(str(self._id), str(self.element), str(self.status))
+
+        def __str__(self):
+            return self.__repr__()
+
+    class Edge(object):
+
+        __slots__ = ("info", "status")
+
+        def __init__(self, info = None, status = None):
+            self.info = info
+            self.status = status
+
+    class CompactArc(object):
+
+        __slots__ = ("_tail", "_head", "_edge", "_mirror")
+
+        def __init__(self, tail, head, edge):
+            self._tail = tail
+            self._head = head
+            self._edge = edge
+            self._mirror = None
+
+        def _get_info(self):
+            return self._edge.info
+
+        def _set_info(self, info):
+            self._edge.info = info
+
+        def _get_status(self):
+            return self._edge.status
+
+        def _set_status(self, status):
+            self._edge.status = status
+
+        info = property(_get_info, _set_info)
+        status = property(_get_status, _set_status)
+
+        def __eq__(self, other):
+            return self._tail == other._tail and self._head == other._head
+
+        def __repr__(self):
+            return "^(tail: {}, head: {}, info: {}, status: {})".format(str(self._tail), str(self._head), str(self.info), str(self.status))
+
+        def __str__(self):
+            return self.__repr__()
+
+    def __init__(self, compact = False):
+        """
+        Creates an empty graph.
+
+        In compact mode nodes and arcs are slotted records, and both directions
+        of an undirected arc share a single info/status payload: setting the
+        status of an arc also sets the status of its mirror.
+
+        @type compact: bool
+        @param compact: if True, uses the compact representation.
+        """
         self._nodes = {}
         self._inc = {}
         self._next_id = 0
-        
+        self._stats = GraphStatistics()
+        self._cache = NeighborhoodCache()
+        self._compact = compact
+        self._node_class = GraphIncidenceList.CompactNode if compact else GraphIncidenceList.Node
+
+    def _new_arcs(self, nodeA_id, nodeB_id, info):
+        if self._compact:
+            edge = GraphIncidenceList.Edge(info)
+            return GraphIncidenceList.CompactArc(nodeA_id, nodeB_id, edge), GraphIncidenceList.CompactArc(nodeB_id, nodeA_id, edge)
+        return GraphIncidenceList.Arc(nodeA_id, nodeB_id, info), GraphIncidenceList.Arc(nodeB_id, nodeA_id, info)
+
     def add_node(self, element, node_id = None):
         """
         Adds a new node in graph, with the specified element.
@@ -67,11 +168,13 @@ class GraphIncidenceList(basegraph):
             self._next_id += 1
         else:
             new_node_id = node_id
-            self._next_id = node_id + 1
+            if node_id >= self._next_id: self._next_id = node_id + 1
+            if new_node_id in self._nodes: self.remove_node(new_node_id)
             
-        new_node = GraphIncidenceList.Node(new_node_id, element)
+        new_node = self._node_class(new_node_id, element)
         self._nodes[new_node._id] = new_node
-        self._inc[new_node._id] = LinkedList()            
+        self._inc[new_node._id] = LinkedList()
+        self._stats._add_node()            
     
     def remove_node(self, node_id): 
         """
@@ -82,17 +185,26 @@ class GraphIncidenceList(basegraph):
         @type node_id: integer
         @param node_id: id of the node to be removed from graph.
         """
+        self._cache._invalidate_node(node_id)
         try:       
-            del self._nodes[node_id] 
-            del self._inc[node_id]
+            node = self._nodes.pop(node_id) 
+            arcs_list = self._inc.pop(node_id)
         except KeyError:
             return        
-        for arcs_list in self._inc.values():
-            record = arcs_list.get_first_record()
-            while record is not None:
-                arc = record.element
-                if arc._head is node_id: arcs_list.delete_record(record)
-                record = record._next       
+        stats = self._stats
+        loops = 0
+        record = arcs_list.get_first_record()
+        while record is not None:
+            arc = record.element
+            if arc._head != node_id:
+                self._inc[arc._head].delete_record(arc._mirror)
+                stats._remove_arc(node, self._nodes[arc._head])
+            else:
+                loops += 1
+            record = record._next
+        for i in xrange(loops / 2):
+            stats._remove_arc(node, node)
+        stats._remove_node()       
     
     def add_arc(self, nodeA_id, nodeB_id, info = None):
         """
@@ -108,14 +220,83 @@ class GraphIncidenceList(basegraph):
         @param info: element to be added as info to the new arc.    
         """
         try:
-            new_arc_AB = GraphIncidenceList.Arc(nodeA_id, nodeB_id, info)
-            new_arc_BA = GraphIncidenceList.Arc(nodeB_id, nodeA_id, info)
-            self._inc[nodeA_id].add_as_last(new_arc_AB)
-            self._inc[nodeB_id].add_as_last(new_arc_BA)
-            self._nodes[nodeA_id]._deg += 1
-            self._nodes[nodeB_id]._deg += 1  
+            arcs_list_A = self._inc[nodeA_id]
+            arcs_list_B = self._inc[nodeB_id]
         except KeyError:
             return 
+        self._cache._invalidate_arc(nodeA_id, nodeB_id)
+        new_arc_AB, new_arc_BA = self._new_arcs(nodeA_id, nodeB_id, info)
+        arcs_list_A.add_as_last(new_arc_AB)
+        record_AB = arcs_list_A.get_last_record()
+        arcs_list_B.add_as_last(new_arc_BA)
+        record_BA = arcs_list_B.get_last_record()
+        new_arc_AB._mirror = record_BA
+        new_arc_BA._mirror = record_AB
+        self._stats._add_arc(self._nodes[nodeA_id], self._nodes[nodeB_id])  
+    
+    def add_nodes_from(self, elements):
+        """
+        Adds a new node in graph for each one of the specified elements.
+        
+        add_nodes_from(elements) -> None
+        
+        @type elements: iterable
+        @param elements: elements to be assigned to the new nodes.    
+        """
+        with _paused_gc():
+            nodes = self._nodes
+            inc = self._inc
+            Node = self._node_class
+            node_id = self._next_id
+            for element in elements:
+                nodes[node_id] = Node(node_id, element)
+                inc[node_id] = LinkedList()
+                node_id += 1
+            self._stats._add_nodes(node_id - self._next_id)
+            self._next_id = node_id
+    
+    def add_arcs_from(self, arcs, add_missing_nodes = False):
+        """
+        Adds the specified undirected arcs in graph.
+        
+        add_arcs_from(arcs, add_missing_nodes) -> None
+        
+        @type arcs: iterable
+        @param arcs: (nodeA_id, nodeB_id) or (nodeA_id, nodeB_id, info) tuples.
+        @type add_missing_nodes: boolean
+        @param add_missing_nodes: if True, missing end nodes are added with their id as element, otherwise their arcs are skipped.
+        """
+        with _paused_gc():
+            nodes = self._nodes
+            inc = self._inc
+            new_arcs = self._new_arcs
+            add_arc = self._stats._add_arc
+            cache = self._cache if self._cache._entries else None
+            for arc in arcs:
+                nodeA_id = arc[0]
+                nodeB_id = arc[1]
+                info = arc[2] if len(arc) > 2 else None
+                if nodeA_id not in inc or nodeB_id not in inc:
+                    if not add_missing_nodes: continue
+                    self._ensure_node(nodeA_id)
+                    self._ensure_node(nodeB_id)
+                if cache is not None: cache._invalidate_arc(nodeA_id, nodeB_id)
+                arcs_list_A = inc[nodeA_id]
+                arcs_list_B = inc[nodeB_id]
+                new_arc_AB, new_arc_BA = new_arcs(nodeA_id, nodeB_id, info)
+                arcs_list_A.add_as_last(new_arc_AB)
+                record_AB = arcs_list_A._last
+                arcs_list_B.add_as_last(new_arc_BA)
+                new_arc_AB._mirror = arcs_list_B._last
+                new_arc_BA._mirror = record_AB
+                add_arc(nodes[nodeA_id], nodes[nodeB_id])
+    
+    def _ensure_node(self, node_id):
+        if node_id in self._nodes: return
+        self._nodes[node_id] = self._node_class(node_id, node_id)
+        self._inc[node_id] = LinkedList()
+        self._stats._add_node()
+        if node_id >= self._next_id: self._next_id = node_id + 1
     
     def remove_arc(self, nodeA_id, nodeB_id):
         """
@@ -133,18 +314,11 @@ class GraphIncidenceList(basegraph):
             record = arcs_list_A.get_first_record()
             while record is not None:
                 arc = record.element
-                if arc._head is nodeB_id:
-                    self._inc[nodeA_id].delete_record(record)
-                    self._nodes[nodeA_id]._deg -= 1
-                    break
-                record = record._next
-            arcs_list_B = self._inc[nodeB_id]
-            record = arcs_list_B.get_first_record()
-            while record is not None:
-                arc = record.element
-                if arc._head is nodeA_id:
-                    self._inc[nodeB_id].delete_record(record)
-                    self._nodes[nodeB_id]._deg -= 1
+                if arc._head == nodeB_id:
+                    self._cache._invalidate_arc(nodeA_id, nodeB_id)
+                    arcs_list_A.delete_record(record)
+                    self._inc[nodeB_id].delete_record(arc._mirror)
+                    self._stats._remove_arc(self._nodes[nodeA_id], self._nodes[nodeB_id])
                     break
                 record = record._next
         except KeyError:
@@ -223,9 +397,48 @@ class GraphIncidenceList(basegraph):
         @rtype: integer
         @return: number of undirected arcs in graph.    
         """
-        num_arcs = 0
-        for node in self._nodes.values(): num_arcs += node._deg
-        return (num_arcs / 2) + 1
+        return self._stats._num_arcs
+    
+    def get_statistics(self):
+        """
+        Returns the statistics of the graph, kept up to date by its mutators.
+        
+        get_statistics() -> statistics
+        
+        @rtype: GraphStatistics
+        @return: live statistics of the graph.
+        """
+        return self._stats
+
+    def neighborhood(self, node_id, k):
+        """
+        Returns the ids of the nodes within k hops of the specified node.
+        
+        Neighborhoods are cached, and the entries affected by a change of the
+        graph are invalidated by its mutators.
+        
+        neighborhood(node_id, k) -> ids_set
+        
+        @type node_id: integer
+        @param node_id: id of the root node.
+        @type k: integer
+        @param k: maximum number of hops.
+        
+        @rtype: frozenset
+        @return: ids of the nodes reachable from the root in at most k hops, root excluded; empty if the root is not in graph.
+        """
+        return _neighborhood(self, self._cache, self._heads, node_id, k)
+    
+    def get_neighborhood_cache(self):
+        """
+        Returns the cache of the neighborhoods of the graph, with its counters.
+        
+        get_neighborhood_cache() -> cache
+        
+        @rtype: NeighborhoodCache
+        @return: neighborhood cache of the graph.
+        """
+        return self._cache
     
     def is_node_in_graph(self, node_id):
         return True if node_id in self._nodes else False   
@@ -363,6 +576,63 @@ class GraphIncidenceList(basegraph):
         except KeyError:
             return []          
     
+    def iter_dfs(self, root_node_id, max_depth = None, visitor = None, details = False):
+        """
+        Lazily yields the nodes in LIFO order from graph's root.
+        
+        iter_dfs(root_node_id, max_depth, visitor, details) -> nodes
+        
+        @type root_node_id: integer
+        @param root_node_id: graph's root's id.
+        @type max_depth: integer
+        @param max_depth: nodes deeper than max_depth are not visited, None for no limit.
+        @type visitor: callable
+        @param visitor: visitor(node, depth, parent_id), the search stops after the node for which it returns True.
+        @type details: boolean
+        @param details: if True, (node, depth, parent_id) tuples are yielded instead of nodes.
+        
+        @rtype: generator
+        @return: nodes reachable from graph's root, in LIFO order.
+        """
+        return _iter_search(self, self._heads, root_node_id, max_depth, visitor, details, True)
+    
+    def iter_bfs(self, root_node_id, max_depth = None, visitor = None, details = False):
+        """
+        Lazily yields the nodes in FIFO order from graph's root.
+        
+        iter_bfs(root_node_id, max_depth, visitor, details) -> nodes
+        
+        @type root_node_id: integer
+        @param root_node_id: graph's root's id.
+        @type max_depth: integer
+        @param max_depth: nodes deeper than max_depth are not visited, None for no limit.
+        @type visitor: callable
+        @param visitor: visitor(node, depth, parent_id), the search stops after the node for which it returns True.
+        @type details: boolean
+        @param details: if True, (node, depth, parent_id) tuples are yielded instead of nodes.
+        
+        @rtype: generator
+        @return: nodes reachable from graph's root, in FIFO order.
+        """
+        return _iter_search(self, self._heads, root_node_id, max_depth, visitor, details, False)
+    
+    def _heads(self, node_id):
+        record = self._inc[node_id].get_first_record()
+        while record is not None:
+            yield record.element._head
+            record = record._next
+    
+    def freeze(self):
+        """
+        Returns an immutable compressed-sparse-row snapshot of the graph.
+        
+        freeze() -> frozen_graph
+        
+        @rtype: GraphCSR
+        @return: immutable array-backed snapshot of the graph.
+        """
+        return freeze(self)
+    
     def __repr__(self):
         s = "{"        
         for node in self._nodes.itervalues():
@@ -425,12 +695,108 @@ class GraphIncidenceSet(basegraph):
         
         def __str__(self):
             return self.__repr__()
-    
-    def __init__(self):
+
+    class CompactArc(object):
+
+        __slots__ = ("_tail", "_head", "_edge")
+
+        def __init__(self, tail, head, edge):
+            self._tail = tail
+            self._head = head
+            self._edge = edge
+
+        def _get_info(self):
+            return self._edge.info
+
+        def _set_info(self, info):
+            self._edge.info = info
+
+        def _get_status(self):
+            return self._edge.status
+
+        def _set_status(self, status):
+            self._edge.status = status
+
+        info = property(_get_info, _set_info)
+        status = property(_get_status, _set_status)
+
+        def __eq__(self, other):
+            return (self._tail == other._tail and self._head == other._head) or (self._tail == other._head and self._head == other._tail)
+
+        def __hash__(self):
+            return hash(self._tail + self._head)
+
+        def __repr__(self):
+            return "^(tail: {}, head: {}, info: {}, status: {})".format(str(self._tail), str(self._head), str(self.info), str(self.status))
+
+        def __str__(self):
+            return self.__repr__()
+
+    def __init__(self, compact = False):
+        """
+        Creates an empty graph.
+
+        In compact mode nodes and arcs are slotted records, and both directions
+        of an undirected arc share a single info/status payload: setting the
+        status of an arc also sets the status of its mirror.
+
+        @type compact: bool
+        @param compact: if True, uses the compact representation.
+        """
         self._nodes = {}
         self._inc = {}
         self._next_id = 0
-        
+        self._stats = GraphStatistics()
+        self._cache = NeighborhoodCache()
+        self._compact = compact
+        self._node_class = GraphIncidenceList.CompactNode if compact else GraphIncidenceList.Node
+        self._snapshots = WeakSet()
+        self._copied = set()
+
+    def _new_arcs(self, nodeA_id, nodeB_id, info):
+        if self._compact:
+            edge = GraphIncidenceList.Edge(info)
+            return GraphIncidenceSet.CompactArc(nodeA_id, nodeB_id, edge), GraphIncidenceSet.CompactArc(nodeB_id, nodeA_id, edge)
+        return GraphIncidenceSet.Arc(nodeA_id, nodeB_id, info), GraphIncidenceSet.Arc(nodeB_id, nodeA_id, info)
+
+    def snapshot(self):
+        """
+        Returns an immutable view of the graph as it is now.
+
+        The view shares nodes and incidence sets with the graph. While it is
+        alive, the first change to a node or to its incidence set after the
+        latest snapshot replaces them in the graph with copies, and hands the
+        originals over to the live snapshots: a snapshot only costs memory for
+        the nodes changed since it was taken, and readers can traverse it while
+        a single writer keeps changing the graph.
+
+        snapshot() -> snapshot
+
+        @rtype: GraphSnapshot
+        @return: read-only view of the current state of the graph.
+        """
+        snapshot = GraphSnapshot(self)
+        self._snapshots.add(snapshot)
+        self._copied = set()
+        return snapshot
+
+    def _copy_on_write(self, node_id):
+        if node_id in self._copied or not self._snapshots: return
+        self._copied.add(node_id)
+        node = self._nodes.get(node_id)
+        arcs_set = self._inc.get(node_id)
+        for snapshot in self._snapshots: snapshot._preserve(node_id, node, arcs_set)
+        if node is None: return
+        copy = self._node_class(node_id, node.element, node.status)
+        copy._deg = node._deg
+        self._nodes[node_id] = copy
+        self._inc[node_id] = arcs_set.copy()
+
+    def _replace_arc(self, node_id, arc):
+        arcs_set = self._inc[node_id]
+        arcs_set.discard(arc)
+        arcs_set.add(arc)
+
     def add_node(self, element, node_id = None):
         """
         Adds a new node in graph, with the specified element.
@@ -445,11 +811,14 @@ class GraphIncidenceSet(basegraph):
             self._next_id += 1
         else:
             new_node_id = node_id
-            self._next_id = node_id + 1
+            if node_id >= self._next_id: self._next_id = node_id + 1
+            if new_node_id in self._nodes: self.remove_node(new_node_id)
             
-        new_node = GraphIncidenceList.Node(new_node_id, element)
+        self._copy_on_write(new_node_id)
+        new_node = self._node_class(new_node_id, element)
         self._nodes[new_node._id] = new_node
-        self._inc[new_node._id] = Set()            
+        self._inc[new_node._id] = Set()
+        self._stats._add_node()            
     
     def remove_node(self, node_id):
         """
@@ -460,16 +829,18 @@ class GraphIncidenceSet(basegraph):
         @type node_id: integer
         @param node_id: id of the node to be removed from graph.
         """
-        try: 
-            del self._nodes[node_id] 
-            del self._inc[node_id] 
-        except KeyError:
-            return          
-        for arcs_set in self._inc.values():
-            arcs_to_remove = Set()
-            for arc in arcs_set:
-                if arc._head is node_id: arcs_to_remove.add(arc)
-            arcs_set.difference_update(arcs_to_remove)                     
+        if node_id not in self._nodes: return
+        self._cache._invalidate_node(node_id)
+        self._copy_on_write(node_id)
+        node = self._nodes.pop(node_id) 
+        arcs_set = self._inc.pop(node_id) 
+        stats = self._stats
+        for arc in arcs_set:
+            if arc._head != node_id:
+                self._copy_on_write(arc._head)
+                self._inc[arc._head].discard(GraphIncidenceSet.Arc(arc._head, node_id))
+            stats._remove_arc(node, self._nodes.get(arc._head, node))
+        stats._remove_node()                     
     
     def add_arc(self, nodeA_id, nodeB_id, info = None):
         """
@@ -484,15 +855,84 @@ class GraphIncidenceSet(basegraph):
         @type info: object
         @param info: element to be added as info to the new arc.    
         """
-        try:
-            new_arc_AB = GraphIncidenceSet.Arc(nodeA_id, nodeB_id, info)
-            new_arc_BA = GraphIncidenceSet.Arc(nodeB_id, nodeA_id, info)
-            self._inc[nodeA_id].add(new_arc_AB)
-            self._inc[nodeB_id].add(new_arc_BA)
-            self._nodes[nodeA_id]._deg += 1
-            self._nodes[nodeB_id]._deg += 1  
-        except KeyError:
-            return 
+        if nodeA_id not in self._inc or nodeB_id not in self._inc: return
+        new_arc_AB, new_arc_BA = self._new_arcs(nodeA_id, nodeB_id, info)
+        if new_arc_AB in self._inc[nodeA_id]: return
+        self._cache._invalidate_arc(nodeA_id, nodeB_id)
+        self._copy_on_write(nodeA_id)
+        self._copy_on_write(nodeB_id)
+        arcs_set_A = self._inc[nodeA_id]
+        arcs_set_B = self._inc[nodeB_id]
+        arcs_set_A.add(new_arc_AB)
+        arcs_set_B.add(new_arc_BA)
+        self._stats._add_arc(self._nodes[nodeA_id], self._nodes[nodeB_id])  
+    
+    def add_nodes_from(self, elements):
+        """
+        Adds a new node in graph for each one of the specified elements.
+        
+        add_nodes_from(elements) -> None
+        
+        @type elements: iterable
+        @param elements: elements to be assigned to the new nodes.    
+        """
+        with _paused_gc():
+            nodes = self._nodes
+            inc = self._inc
+            Node = self._node_class
+            shared = bool(self._snapshots)
+            node_id = self._next_id
+            for element in elements:
+                if shared: self._copy_on_write(node_id)
+                nodes[node_id] = Node(node_id, element)
+                inc[node_id] = Set()
+                node_id += 1
+            self._stats._add_nodes(node_id - self._next_id)
+            self._next_id = node_id
+    
+    def add_arcs_from(self, arcs, add_missing_nodes = False):
+        """
+        Adds the specified undirected arcs in graph.
+        
+        add_arcs_from(arcs, add_missing_nodes) -> None
+        
+        @type arcs: iterable
+        @param arcs: (nodeA_id, nodeB_id) or (nodeA_id, nodeB_id, info) tuples.
+        @type add_missing_nodes: boolean
+        @param add_missing_nodes: if True, missing end nodes are added with their id as element, otherwise their arcs are skipped.
+        """
+        with _paused_gc():
+            nodes = self._nodes
+            inc = self._inc
+            new_arcs = self._new_arcs
+            add_arc = self._stats._add_arc
+            shared = bool(self._snapshots)
+            cache = self._cache if self._cache._entries else None
+            for arc in arcs:
+                nodeA_id = arc[0]
+                nodeB_id = arc[1]
+                info = arc[2] if len(arc) > 2 else None
+                if nodeA_id not in inc or nodeB_id not in inc:
+                    if not add_missing_nodes: continue
+                    self._ensure_node(nodeA_id)
+                    self._ensure_node(nodeB_id)
+                new_arc_AB, new_arc_BA = new_arcs(nodeA_id, nodeB_id, info)
+                if new_arc_AB in inc[nodeA_id]: continue
+                if cache is not None: cache._invalidate_arc(nodeA_id, nodeB_id)
+                if shared:
+                    self._copy_on_write(nodeA_id)
+                    self._copy_on_write(nodeB_id)
+                inc[nodeA_id].add(new_arc_AB)
+                inc[nodeB_id].add(new_arc_BA)
+                add_arc(nodes[nodeA_id], nodes[nodeB_id])
+    
+    def _ensure_node(self, node_id):
+        if node_id in self._nodes: return
+        self._copy_on_write(node_id)
+        self._nodes[node_id] = self._node_class(node_id, node_id)
+        self._inc[node_id] = Set()
+        self._stats._add_node()
+        if node_id >= self._next_id: self._next_id = node_id + 1
     
     def remove_arc(self, nodeA_id, nodeB_id):
         """
@@ -505,23 +945,15 @@ class GraphIncidenceSet(basegraph):
         @type nodeB_id: integer
         @param nodeB_id: id of head node.    
         """
-        try:
-            arcs_set_A = self._inc[nodeA_id]
-            arcs_to_remove = Set()
-            for arc in arcs_set_A:
-                if arc._head is nodeB_id:
-                    arcs_to_remove.add(arc)
-                    self._nodes[nodeA_id]._deg -= 1
-            arcs_set_A.difference_update(arcs_to_remove)
-            arcs_set_B = self._inc[nodeB_id]
-            arcs_to_remove = Set()
-            for arc in arcs_set_B:
-                if arc._head == nodeA_id:
-                    arcs_to_remove.add(arc)
-                    self._nodes[nodeB_id]._deg -= 1
-            arcs_set_B.difference_update(arcs_to_remove)
-        except KeyError:
-            return
+        if nodeA_id not in self._inc or nodeB_id not in self._inc: return
+        arc = GraphIncidenceSet.Arc(nodeA_id, nodeB_id)
+        if arc not in self._inc[nodeA_id]: return
+        self._cache._invalidate_arc(nodeA_id, nodeB_id)
+        self._copy_on_write(nodeA_id)
+        self._copy_on_write(nodeB_id)
+        self._inc[nodeA_id].discard(arc)
+        self._inc[nodeB_id].discard(arc)
+        self._stats._remove_arc(self._nodes[nodeA_id], self._nodes[nodeB_id])
         
     def set_arc_status(self, nodeA_id, nodeB_id, status):
         """
@@ -538,12 +970,24 @@ class GraphIncidenceSet(basegraph):
         """ 
         try:
             arcs_set_A = self._inc[nodeA_id]
-            for arc in arcs_set_A:
-                if arc._head == nodeB_id:
-                    arc.status = status
-                    break
         except KeyError:
-            return   
+            return
+        for arc in arcs_set_A:
+            if arc._head == nodeB_id: break
+        else:
+            return
+        if not self._snapshots:
+            arc.status = status
+            return
+        # Arcs are shared with the snapshots: the arc is replaced, not updated.
+        self._copy_on_write(nodeA_id)
+        if self._compact:
+            self._copy_on_write(nodeB_id)
+            edge = GraphIncidenceList.Edge(arc.info, status)
+            self._replace_arc(nodeA_id, GraphIncidenceSet.CompactArc(nodeA_id, nodeB_id, edge))
+            self._replace_arc(nodeB_id, GraphIncidenceSet.CompactArc(nodeB_id, nodeA_id, edge))
+        else:
+            self._replace_arc(nodeA_id, GraphIncidenceSet.Arc(nodeA_id, nodeB_id, arc.info, status))   
         
     def get_nodes(self):
         """
@@ -589,9 +1033,48 @@ class GraphIncidenceSet(basegraph):
         @rtype: integer
         @return: number of undirected arcs in graph.    
         """
-        num_arcs = 0
-        for node in self._nodes.values(): num_arcs += node._deg
-        return (num_arcs / 2) + 1
+        return self._stats._num_arcs
+    
+    def get_statistics(self):
+        """
+        Returns the statistics of the graph, kept up to date by its mutators.
+        
+        get_statistics() -> statistics
+        
+        @rtype: GraphStatistics
+        @return: live statistics of the graph.
+        """
+        return self._stats
+
+    def neighborhood(self, node_id, k):
+        """
+        Returns the ids of the nodes within k hops of the specified node.
+        
+        Neighborhoods are cached, and the entries affected by a change of the
+        graph are invalidated by its mutators.
+        
+        neighborhood(node_id, k) -> ids_set
+        
+        @type node_id: integer
+        @param node_id: id of the root node.
+        @type k: integer
+        @param k: maximum number of hops.
+        
+        @rtype: frozenset
+        @return: ids of the nodes reachable from the root in at most k hops, root excluded; empty if the root is not in graph.
+        """
+        return _neighborhood(self, self._cache, self._heads, node_id, k)
+    
+    def get_neighborhood_cache(self):
+        """
+        Returns the cache of the neighborhoods of the graph, with its counters.
+        
+        get_neighborhood_cache() -> cache
+        
+        @rtype: NeighborhoodCache
+        @return: neighborhood cache of the graph.
+        """
+        return self._cache
     
     def is_node_in_graph(self, node_id):
         return node_id in self._nodes   
@@ -714,6 +1197,60 @@ class GraphIncidenceSet(basegraph):
         except KeyError:
             return []           
     
+    def iter_dfs(self, root_node_id, max_depth = None, visitor = None, details = False):
+        """
+        Lazily yields the nodes in LIFO order from graph's root.
+        
+        iter_dfs(root_node_id, max_depth, visitor, details) -> nodes
+        
+        @type root_node_id: integer
+        @param root_node_id: graph's root's id.
+        @type max_depth: integer
+        @param max_depth: nodes deeper than max_depth are not visited, None for no limit.
+        @type visitor: callable
+        @param visitor: visitor(node, depth, parent_id), the search stops after the node for which it returns True.
+        @type details: boolean
+        @param details: if True, (node, depth, parent_id) tuples are yielded instead of nodes.
+        
+        @rtype: generator
+        @return: nodes reachable from graph's root, in LIFO order.
+        """
+        return _iter_search(self, self._heads, root_node_id, max_depth, visitor, details, True)
+    
+    def iter_bfs(self, root_node_id, max_depth = None, visitor = None, details = False):
+        """
+        Lazily yields the nodes in FIFO order from graph's root.
+        
+        iter_bfs(root_node_id, max_depth, visitor, details) -> nodes
+        
+        @type root_node_id: integer
+        @param root_node_id: graph's root's id.
+        @type max_depth: integer
+        @param max_depth: nodes deeper than max_depth are not visited, None for no limit.
+        @type visitor: callable
+        @param visitor: visitor(node, depth, parent_id), the search stops after the node for which it returns True.
+        @type details: boolean
+        @param details: if True, (node, depth, parent_id) tuples are yielded instead of nodes.
+        
+        @rtype: generator
+        @return: nodes reachable from graph's root, in FIFO order.
+        """
+        return _iter_search(self, self._heads, root_node_id, max_depth, visitor, details, False)
+    
+    def _heads(self, node_id):
+        for arc in self._inc[node_id]: yield arc._head
+    
+    def freeze(self):
+        """
+        Returns an immutable compressed-sparse-row snapshot of the graph.
+        
+        freeze() -> frozen_graph
+        
+        @rtype: GraphCSR
+        @return: immutable array-backed snapshot of the graph.
+        """
+        return freeze(self)
+    
     def __repr__(self):
         s = "{"       
         for node in self._nodes.itervalues():
@@ -725,36 +1262,2259 @@ class GraphIncidenceSet(basegraph):
     def __str__(self):
         return self.__repr__()    
     
-def __test(graph): 
+class GraphSnapshot(basegraph):
     """
-    Graph Test.
+    Immutable copy-on-write view of a GraphIncidenceSet, as returned by its snapshot method.
     
-    __test(graph) -> None
+    The view reads the nodes and incidence sets of the graph, except for the
+    nodes changed since it was taken, whose original node and incidence set
+    the graph hands over before changing them. The graph never modifies a
+    node or an incidence set in place while snapshots are alive, so the view
+    can be read from other threads while a single writer changes the graph.
+    """
     
-    @type graph: basegraph
-    @param graph: graph instance.    
-    """   
+    def __init__(self, graph):
+        self._graph = graph
+        self._saved = {}
+        self._num_nodes = len(graph._nodes)
+        self._num_arcs = graph._stats._num_arcs
+        
+    def _preserve(self, node_id, node, arcs_set):
+        if node_id not in self._saved: self._saved[node_id] = (node, arcs_set)
     
-    if not isinstance(graph, basegraph):
-        raise TypeError("Expected type was Graph.")
+    def _lookup(self, node_id):
+        # The live records are read before the saved ones: a record replaced
+        # by the writer in between is saved before the replacement happens.
+        node = self._graph._nodes.get(node_id)
+        arcs_set = self._graph._inc.get(node_id)
+        return self._saved.get(node_id, (node, arcs_set))
+        
+    def add_node(self, element, node_id = None):
+        raise FrozenGraphError("add_node: snapshot cannot be modified.")
     
-    print "### iPATH TEST DATA STRUCTURE"
-    print "### Data Type: Graph ({})".format(str(graph.__class__.__bases__[0].__name__))
-    print "### Implementation: {}".format(str(graph.__class__.__name__))
+    def remove_node(self, node_id):
+        raise FrozenGraphError("remove_node: snapshot cannot be modified.")
     
-    print "\n*** ADD NODE ***\n"    
-    for i in range(10):
-        print "add_node({})".format(str(i))   
-        graph.add_node(i) 
+    def add_arc(self, nodeA_id, nodeB_id, info = None):
+        raise FrozenGraphError("add_arc: snapshot cannot be modified.")
     
-    print "\n*** ADD ARC ***\n"    
-    for i in range(10):
-        print "add_arc({}, {}, {})".format(str(i), str(i + 1), str(2 * (i + 1)))
-        graph.add_arc(i, i + 1, 2 * (i + 1))
-        print "add_arc({}, {}, {})".format(str(i), str(i + 2), str(2 * (i + 2)))
-        graph.add_arc(i, i + 2, 2 * (i + 2))
-        
-    print "\n*** GRAPH ***\n"    
+    def add_nodes_from(self, elements):
+        raise FrozenGraphError("add_nodes_from: snapshot cannot be modified.")
+    
+    def add_arcs_from(self, arcs, add_missing_nodes = False):
+        raise FrozenGraphError("add_arcs_from: snapshot cannot be modified.")
+    
+    def remove_arc(self, nodeA_id, nodeB_id):
+        raise FrozenGraphError("remove_arc: snapshot cannot be modified.")
+    
+    def set_arc_status(self, nodeA_id, nodeB_id, status):
+        raise FrozenGraphError("set_arc_status: snapshot cannot be modified.")
+        
+    def get_nodes(self):
+        """
+        Returns all nodes in graph        
+        get_nodes() -> nodes_list
+        
+        @rtype: list
+        @return: list of nodes in graph.    
+        """
+        ids = set(self._graph._nodes.keys())
+        ids.update(self._saved.keys())
+        nodes = []
+        for node_id in ids:
+            node = self._lookup(node_id)[0]
+            if node is not None: nodes.append(node)
+        return nodes
+    
+    def get_arcs(self):
+        """
+        Returns all undirected arcs in graph.
+        
+        get_arcs() -> arcs_list
+        
+        @rtype: list
+        @return: list of undirected arcs in graph.    
+        """
+        arcs = []
+        for node in self.get_nodes():
+            for arc in self._lookup(node._id)[1]: arcs.append(arc)
+        return arcs
+        
+    def get_num_nodes(self):
+        """
+        Returns the number of nodes in graph.
+        
+        get_num_nodes() -> number_of_nodes
+        
+        @rtype: integer
+        @return: number of nodes in graph.    
+        """
+        return self._num_nodes
+    
+    def get_num_arcs(self):
+        """
+        Returns the number of undirected arcs in graph.
+        
+        get_num_arcs() -> number_of_arcs
+        
+        @rtype: integer
+        @return: number of undirected arcs in graph.    
+        """
+        return self._num_arcs
+    
+    def is_node_in_graph(self, node_id):
+        return self._lookup(node_id)[0] is not None
+    
+    def get_node_by_id(self, node_id):
+        """
+        Returns node in graph by id.
+        
+        get_node_by_id(node_id) -> node
+        
+        @type node_id: integer
+        @param node_id: id of the requested node in graph. 
+        
+        @rtype: node
+        @return: node corresponding to the given id.
+        """
+        return self._lookup(node_id)[0]
+    
+    def get_incident_arcs(self, node_id):
+        """
+        Returns all incident arcs to the specified node.
+        
+        get_incident_arcs(node_id) -> list/set
+        
+        @type node_id: integer
+        @param node_id: id of node whos incident arcs have been requested.  
+        
+        @rtype: list/set
+        @return: all arcs that are incident to the node whose id has been specified.  
+        """
+        arcs_set = self._lookup(node_id)[1]
+        if arcs_set is None: return Set()
+        return arcs_set
+    
+    def are_adjacent(self, nodeA_id, nodeB_id):
+        """
+        Returns True if nodeA and nodeB are adjacent, otherwise returns False.
+        
+        are_adjacent(nodeA_id, nodeB_id) -> True/False
+        
+        @type nodeA_id: integer
+        @param nodeA_id: first node's id.
+        @type nodeB_id: integer
+        @param nodeB_id: second node's id.
+        
+        @rtype: boolean
+        @return: True if nodeA and nodeB are adjacent, otherwise False.    
+        """
+        return GraphIncidenceSet.Arc(nodeA_id, nodeB_id) in self.get_incident_arcs(nodeA_id)
+        
+    def dfs(self, root_node_id):
+        """
+        Returns the LIFO path-as-list from graph's root to all other nodes in graph.
+        
+        dfs(root_node_id) -> path
+        
+        @type root_node_id: integer
+        @param root_node_id: graph's root's id.
+        
+        @rtype: list
+        @return: LIFO path from graph's root to all other nodes in graph.
+        """
+        if not self.is_node_in_graph(root_node_id): return []
+        visited = set([root_node_id])
+        L = []
+        s = StackArrayList()
+        s.push(root_node_id)
+        while not s.is_empty():
+            node, arcs_set = self._lookup(s.pop())
+            L.append(node)
+            for arc in arcs_set:
+                if arc._head not in visited:
+                    visited.add(arc._head)
+                    s.push(arc._head)
+        return L
+
+    def bfs(self, root_node_id):
+        """
+        Returns the FIFO path-as-list from graph's root to all other nodes in graph.
+        
+        bfs(root_node_id) -> path
+        
+        @type root_node_id: integer
+        @param root_node_id: graph's root's id.
+        
+        @rtype: list
+        @return: FIFO path from graph's root to all other nodes in graph.
+        """
+        if not self.is_node_in_graph(root_node_id): return []
+        visited = set([root_node_id])
+        L = []
+        q = QueueDeque()
+        q.enqueue(root_node_id)
+        while not q.is_empty():
+            node, arcs_set = self._lookup(q.dequeue())
+            L.append(node)
+            for arc in arcs_set:
+                if arc._head not in visited:
+                    visited.add(arc._head)
+                    q.enqueue(arc._head)
+        return L
+    
+    def iter_dfs(self, root_node_id, max_depth = None, visitor = None, details = False):
+        """
+        Lazily yields the nodes in LIFO order from graph's root.
+        
+        iter_dfs(root_node_id, max_depth, visitor, details) -> nodes
+        
+        @type root_node_id: integer
+        @param root_node_id: graph's root's id.
+        @type max_depth: integer
+        @param max_depth: nodes deeper than max_depth are not visited, None for no limit.
+        @type visitor: callable
+        @param visitor: visitor(node, depth, parent_id), the search stops after the node for which it returns True.
+        @type details: boolean
+        @param details: if True, (node, depth, parent_id) tuples are yielded instead of nodes.
+        
+        @rtype: generator
+        @return: nodes reachable from graph's root, in LIFO order.
+        """
+        return _iter_search(self, self._heads, root_node_id, max_depth, visitor, details, True)
+    
+    def iter_bfs(self, root_node_id, max_depth = None, visitor = None, details = False):
+        """
+        Lazily yields the nodes in FIFO order from graph's root.
+        
+        iter_bfs(root_node_id, max_depth, visitor, details) -> nodes
+        
+        @type root_node_id: integer
+        @param root_node_id: graph's root's id.
+        @type max_depth: integer
+        @param max_depth: nodes deeper than max_depth are not visited, None for no limit.
+        @type visitor: callable
+        @param visitor: visitor(node, depth, parent_id), the search stops after the node for which it returns True.
+        @type details: boolean
+        @param details: if True, (node, depth, parent_id) tuples are yielded instead of nodes.
+        
+        @rtype: generator
+        @return: nodes reachable from graph's root, in FIFO order.
+        """
+        return _iter_search(self, self._heads, root_node_id, max_depth, visitor, details, False)
+    
+    def _heads(self, node_id):
+        for arc in self._lookup(node_id)[1]: yield arc._head
+    
+    def freeze(self):
+        """
+        Returns an immutable compressed-sparse-row snapshot of the graph.
+        
+        freeze() -> frozen_graph
+        
+        @rtype: GraphCSR
+        @return: immutable array-backed snapshot of the graph.
+        """
+        return freeze(self)
+    
+    def __repr__(self):
+        s = "{"
+        for node in self.get_nodes():
+            s += "{} : {}\n".format(str(node), str(self._lookup(node._id)[1]))
+        s += "}"
+        return s
+    
+    def __str__(self):
+        return self.__repr__()
+    
+class GraphIncidenceMap(basegraph):
+    """
+    Undirected graph whose incidences are dictionaries keyed by head node id.
+    
+    Arc lookup, update and removal are constant time. At most one arc is kept
+    between two nodes: adding an existing arc replaces its info.
+    """
+    
+    def __init__(self):
+        self._nodes = {}
+        self._inc = {}
+        self._next_id = 0
+        self._stats = GraphStatistics()
+        self._cache = NeighborhoodCache()
+        
+    def add_node(self, element, node_id = None):
+        """
+        Adds a new node in graph, with the specified element.
+        
+        add_node(element) -> None
+        
+        @type element: object
+        @param element: element to be assigned to the new node.    
+        """
+        if node_id is None:
+            new_node_id = self._next_id
+            self._next_id += 1
+        else:
+            new_node_id = node_id
+            if node_id >= self._next_id: self._next_id = node_id + 1
+            if new_node_id in self._nodes: self.remove_node(new_node_id)
+            
+        new_node = GraphIncidenceList.Node(new_node_id, element)
+        self._nodes[new_node._id] = new_node
+        self._inc[new_node._id] = {}
+        self._stats._add_node()
+    
+    def remove_node(self, node_id):
+        """
+        Removes from graph the node with the specified id.
+        
+        remove_node(node_id) -> None
+        
+        @type node_id: integer
+        @param node_id: id of the node to be removed from graph.
+        """
+        self._cache._invalidate_node(node_id)
+        try: 
+            node = self._nodes.pop(node_id) 
+            arcs_map = self._inc.pop(node_id)
+        except KeyError:
+            return
+        stats = self._stats
+        for head_id in arcs_map:
+            if head_id != node_id:
+                del self._inc[head_id][node_id]
+            stats._remove_arc(node, self._nodes.get(head_id, node))
+        stats._remove_node()
+    
+    def add_arc(self, nodeA_id, nodeB_id, info = None):
+        """
+        Adds a new undirected arc in graph, between node_A and node_B with the specified id.
+        
+        add_arc(nodeA_id, nodeB_id, info) -> None
+        
+        @type nodeA_id: integer
+        @param nodeA_id: id of tail node.
+        @type nodeB_id: integer
+        @param nodeB_id: id of head node.
+        @type info: object
+        @param info: element to be added as info to the new arc.    
+        """
+        try:
+            arcs_map_A = self._inc[nodeA_id]
+            arcs_map_B = self._inc[nodeB_id]
+        except KeyError:
+            return
+        if nodeB_id in arcs_map_A:
+            arcs_map_A[nodeB_id].info = info
+            arcs_map_B[nodeA_id].info = info
+            return
+        self._cache._invalidate_arc(nodeA_id, nodeB_id)
+        arcs_map_A[nodeB_id] = GraphIncidenceList.Arc(nodeA_id, nodeB_id, info)
+        arcs_map_B[nodeA_id] = GraphIncidenceList.Arc(nodeB_id, nodeA_id, info)
+        self._stats._add_arc(self._nodes[nodeA_id], self._nodes[nodeB_id])
+    
+    def add_nodes_from(self, elements):
+        """
+        Adds a new node in graph for each one of the specified elements.
+        
+        add_nodes_from(elements) -> None
+        
+        @type elements: iterable
+        @param elements: elements to be assigned to the new nodes.    
+        """
+        with _paused_gc():
+            nodes = self._nodes
+            inc = self._inc
+            Node = GraphIncidenceList.Node
+            node_id = self._next_id
+            for element in elements:
+                nodes[node_id] = Node(node_id, element)
+                inc[node_id] = {}
+                node_id += 1
+            self._stats._add_nodes(node_id - self._next_id)
+            self._next_id = node_id
+    
+    def add_arcs_from(self, arcs, add_missing_nodes = False):
+        """
+        Adds the specified undirected arcs in graph.
+        
+        add_arcs_from(arcs, add_missing_nodes) -> None
+        
+        @type arcs: iterable
+        @param arcs: (nodeA_id, nodeB_id) or (nodeA_id, nodeB_id, info) tuples.
+        @type add_missing_nodes: boolean
+        @param add_missing_nodes: if True, missing end nodes are added with their id as element, otherwise their arcs are skipped.
+        """
+        with _paused_gc():
+            nodes = self._nodes
+            inc = self._inc
+            Arc = GraphIncidenceList.Arc
+            add_arc = self._stats._add_arc
+            cache = self._cache if self._cache._entries else None
+            for arc in arcs:
+                nodeA_id = arc[0]
+                nodeB_id = arc[1]
+                info = arc[2] if len(arc) > 2 else None
+                if nodeA_id not in inc or nodeB_id not in inc:
+                    if not add_missing_nodes: continue
+                    self._ensure_node(nodeA_id)
+                    self._ensure_node(nodeB_id)
+                arcs_map_A = inc[nodeA_id]
+                arcs_map_B = inc[nodeB_id]
+                if nodeB_id in arcs_map_A:
+                    arcs_map_A[nodeB_id].info = info
+                    arcs_map_B[nodeA_id].info = info
+                    continue
+                if cache is not None: cache._invalidate_arc(nodeA_id, nodeB_id)
+                arcs_map_A[nodeB_id] = Arc(nodeA_id, nodeB_id, info)
+                arcs_map_B[nodeA_id] = Arc(nodeB_id, nodeA_id, info)
+                add_arc(nodes[nodeA_id], nodes[nodeB_id])
+    
+    def _ensure_node(self, node_id):
+        if node_id in self._nodes: return
+        self._nodes[node_id] = GraphIncidenceList.Node(node_id, node_id)
+        self._inc[node_id] = {}
+        self._stats._add_node()
+        if node_id >= self._next_id: self._next_id = node_id + 1
+    
+    def remove_arc(self, nodeA_id, nodeB_id):
+        """
+        Removed from graph the undirected arc between nodeA and nodeB.
+        
+        remove_arc(nodeA_id, nodeB_id) -> None
+        
+        @type nodeA_id: integer
+        @param nodeA_id: id of tail node.
+        @type nodeB_id: integer
+        @param nodeB_id: id of head node.    
+        """
+        try:
+            del self._inc[nodeA_id][nodeB_id]
+        except KeyError:
+            return
+        self._cache._invalidate_arc(nodeA_id, nodeB_id)
+        self._inc[nodeB_id].pop(nodeA_id, None)
+        self._stats._remove_arc(self._nodes[nodeA_id], self._nodes[nodeB_id])
+        
+    def set_arc_status(self, nodeA_id, nodeB_id, status):
+        """
+        Sets the status of the directed arc between nodeA and nodeB.
+        
+        set_arc_status(nodeA_id, nodeB_id, status) -> None
+        
+        @type nodeA_id: integer
+        @param nodeA_id: id of tail node.
+        @type nodeB_id: integer
+        @param nodeB_id: id of head node.
+        @type status: object
+        @param status: element to be added as status info to the specified arc.    
+        """ 
+        try:
+            self._inc[nodeA_id][nodeB_id].status = status
+        except KeyError:
+            return
+        
+    def get_nodes(self):
+        """
+        Returns all nodes in graph        
+        get_nodes() -> nodes_list
+        
+        @rtype: list
+        @return: list of nodes in graph.    
+        """
+        return self._nodes.values()
+    
+    def get_arcs(self):
+        """
+        Returns all undirected arcs in graph.
+        
+        get_arcs() -> arcs_list
+        
+        @rtype: list
+        @return: list of undirected arcs in graph.    
+        """
+        arcs = []
+        for arcs_map in self._inc.itervalues(): arcs.extend(arcs_map.itervalues())
+        return arcs
+        
+    def get_num_nodes(self):
+        """
+        Returns the number of nodes in graph.
+        
+        get_num_nodes() -> number_of_nodes
+        
+        @rtype: integer
+        @return: number of nodes in graph.    
+        """
+        return len(self._nodes)
+    
+    def get_num_arcs(self):
+        """
+        Returns the number of undirected arcs in graph.
+        
+        get_num_arcs() -> number_of_arcs
+        
+        @rtype: integer
+        @return: number of undirected arcs in graph.    
+        """
+        return self._stats._num_arcs
+    
+    def get_statistics(self):
+        """
+        Returns the statistics of the graph, kept up to date by its mutators.
+        
+        get_statistics() -> statistics
+        
+        @rtype: GraphStatistics
+        @return: live statistics of the graph.
+        """
+        return self._stats
+
+    def neighborhood(self, node_id, k):
+        """
+        Returns the ids of the nodes within k hops of the specified node.
+        
+        Neighborhoods are cached, and the entries affected by a change of the
+        graph are invalidated by its mutators.
+        
+        neighborhood(node_id, k) -> ids_set
+        
+        @type node_id: integer
+        @param node_id: id of the root node.
+        @type k: integer
+        @param k: maximum number of hops.
+        
+        @rtype: frozenset
+        @return: ids of the nodes reachable from the root in at most k hops, root excluded; empty if the root is not in graph.
+        """
+        return _neighborhood(self, self._cache, self._heads, node_id, k)
+    
+    def get_neighborhood_cache(self):
+        """
+        Returns the cache of the neighborhoods of the graph, with its counters.
+        
+        get_neighborhood_cache() -> cache
+        
+        @rtype: NeighborhoodCache
+        @return: neighborhood cache of the graph.
+        """
+        return self._cache
+    
+    def is_node_in_graph(self, node_id):
+        return node_id in self._nodes
+    
+    def get_node_by_id(self, node_id):
+        """
+        Returns node in graph by id.
+        
+        get_node_by_id(node_id) -> node
+        
+        @type node_id: integer
+        @param node_id: id of the requested node in graph. 
+        
+        @rtype: node
+        @return: node corresponding to the given id.
+        """
+        try:
+            return self._nodes[node_id]
+        except KeyError:
+            return None
+    
+    def get_incident_arcs(self, node_id):
+        """
+        Returns all incident arcs to the specified node.
+        
+        get_incident_arcs(node_id) -> list/set
+        
+        @type node_id: integer
+        @param node_id: id of node whos incident arcs have been requested.  
+        
+        @rtype: list/set
+        @return: all arcs that are incident to the node whose id has been specified.  
+        """
+        try:
+            return self._inc[node_id].values()
+        except KeyError:
+            return []
+    
+    def are_adjacent(self, nodeA_id, nodeB_id):
+        """
+        Returns True if nodeA and nodeB are adjacent, otherwise returns False.
+        
+        are_adjacent(nodeA_id, nodeB_id) -> True/False
+        
+        @type nodeA_id: integer
+        @param nodeA_id: first node's id.
+        @type nodeB_id: integer
+        @param nodeB_id: second node's id.
+        
+        @rtype: boolean
+        @return: True if nodeA and nodeB are adjacent, otherwise False.    
+        """
+        try:
+            return nodeB_id in self._inc[nodeA_id]
+        except KeyError:
+            return False
+        
+    def dfs(self, root_node_id):
+        """
+        Returns the LIFO path-as-list from graph's root to all other nodes in graph.
+        
+        dfs(root_node_id) -> path
+        
+        @type root_node_id: integer
+        @param root_node_id: graph's root's id.
+        
+        @rtype: list
+        @return: LIFO path from graph's root to all other nodes in graph.
+        """
+        if root_node_id not in self._nodes: return []
+        visited = set([root_node_id])
+        L = []
+        s = StackArrayList()
+        s.push(root_node_id)
+        while not s.is_empty():
+            curr_node_id = s.pop()
+            L.append(self._nodes[curr_node_id])
+            for head_id in self._inc[curr_node_id]:
+                if head_id not in visited:
+                    visited.add(head_id)
+                    s.push(head_id)
+        return L
+
+    def bfs(self, root_node_id):
+        """
+        Returns the FIFO path-as-list from graph's root to all other nodes in graph.
+        
+        bfs(root_node_id) -> path
+        
+        @type root_node_id: integer
+        @param root_node_id: graph's root's id.
+        
+        @rtype: list
+        @return: FIFO path from graph's root to all other nodes in graph.
+        """
+        if root_node_id not in self._nodes: return []
+        visited = set([root_node_id])
+        L = []
+        q = QueueDeque()
+        q.enqueue(root_node_id)
+        while not q.is_empty():
+            curr_node_id = q.dequeue()
+            L.append(self._nodes[curr_node_id])
+            for head_id in self._inc[curr_node_id]:
+                if head_id not in visited:
+                    visited.add(head_id)
+                    q.enqueue(head_id)
+        return L
+    
+    def iter_dfs(self, root_node_id, max_depth = None, visitor = None, details = False):
+        """
+        Lazily yields the nodes in LIFO order from graph's root.
+        
+        iter_dfs(root_node_id, max_depth, visitor, details) -> nodes
+        
+        @type root_node_id: integer
+        @param root_node_id: graph's root's id.
+        @type max_depth: integer
+        @param max_depth: nodes deeper than max_depth are not visited, None for no limit.
+        @type visitor: callable
+        @param visitor: visitor(node, depth, parent_id), the search stops after the node for which it returns True.
+        @type details: boolean
+        @param details: if True, (node, depth, parent_id) tuples are yielded instead of nodes.
+        
+        @rtype: generator
+        @return: nodes reachable from graph's root, in LIFO order.
+        """
+        return _iter_search(self, self._heads, root_node_id, max_depth, visitor, details, True)
+    
+    def iter_bfs(self, root_node_id, max_depth = None, visitor = None, details = False):
+        """
+        Lazily yields the nodes in FIFO order from graph's root.
+        
+        iter_bfs(root_node_id, max_depth, visitor, details) -> nodes
+        
+        @type root_node_id: integer
+        @param root_node_id: graph's root's id.
+        @type max_depth: integer
+        @param max_depth: nodes deeper than max_depth are not visited, None for no limit.
+        @type visitor: callable
+        @param visitor: visitor(node, depth, parent_id), the search stops after the node for which it returns True.
+        @type details: boolean
+        @param details: if True, (node, depth, parent_id) tuples are yielded instead of nodes.
+        
+        @rtype: generator
+        @return: nodes reachable from graph's root, in FIFO order.
+        """
+        return _iter_search(self, self._heads, root_node_id, max_depth, visitor, details, False)
+    
+    def _heads(self, node_id):
+        return self._inc[node_id].iterkeys()
+    
+    def freeze(self):
+        """
+        Returns an immutable compressed-sparse-row snapshot of the graph.
+        
+        freeze() -> frozen_graph
+        
+        @rtype: GraphCSR
+        @return: immutable array-backed snapshot of the graph.
+        """
+        return freeze(self)
+    
+    def __repr__(self):
+        s = "{"       
+        for node in self._nodes.itervalues():
+            s += "{} : {}\n".format(str(node), str(self._inc[node._id].values())) 
+        s += "}"
+        return s
+    
+    def __str__(self):
+        return self.__repr__()    
+    
+class DiGraph(basegraph):
+    """
+    Directed graph whose out- and in-incidences are dictionaries keyed by node id.
+    
+    Every arc is stored once and referenced by both the out-incidence of its
+    tail and the in-incidence of its head, so successors and predecessors are
+    both reachable in constant time per arc. At most one arc is kept from a
+    node to another: adding an existing arc replaces its info.
+    """
+    
+    class Node(GraphIncidenceList.Node):
+        
+        def __init__(self, node_id, element, status = None):
+            GraphIncidenceList.Node.__init__(self, node_id, element, status)
+            self._in_deg = 0
+    
+    def __init__(self):
+        self._nodes = {}
+        self._out = {}
+        self._in = {}
+        self._next_id = 0
+        self._stats = GraphStatistics()
+        self._cache = NeighborhoodCache(directed = True)
+        
+    def add_node(self, element, node_id = None):
+        """
+        Adds a new node in graph, with the specified element.
+        
+        add_node(element) -> None
+        
+        @type element: object
+        @param element: element to be assigned to the new node.    
+        """
+        if node_id is None:
+            new_node_id = self._next_id
+            self._next_id += 1
+        else:
+            new_node_id = node_id
+            if node_id >= self._next_id: self._next_id = node_id + 1
+            if new_node_id in self._nodes: self.remove_node(new_node_id)
+            
+        new_node = DiGraph.Node(new_node_id, element)
+        self._nodes[new_node._id] = new_node
+        self._out[new_node._id] = {}
+        self._in[new_node._id] = {}
+        self._stats._add_node()
+    
+    def remove_node(self, node_id):
+        """
+        Removes from graph the node with the specified id, with its outgoing and incoming arcs.
+        
+        remove_node(node_id) -> None
+        
+        @type node_id: integer
+        @param node_id: id of the node to be removed from graph.
+        """
+        self._cache._invalidate_node(node_id)
+        try: 
+            node = self._nodes.pop(node_id) 
+            out_map = self._out.pop(node_id)
+            in_map = self._in.pop(node_id)
+        except KeyError:
+            return
+        stats = self._stats
+        for head_id in out_map:
+            if head_id != node_id:
+                del self._in[head_id][node_id]
+            stats._remove_directed_arc(node, self._nodes.get(head_id, node))
+        for tail_id in in_map:
+            if tail_id == node_id: continue
+            del self._out[tail_id][node_id]
+            stats._remove_directed_arc(self._nodes[tail_id], node)
+        stats._remove_node()
+    
+    def add_arc(self, nodeA_id, nodeB_id, info = None):
+        """
+        Adds a new directed arc in graph, from node_A to node_B with the specified id.
+        
+        add_arc(nodeA_id, nodeB_id, info) -> None
+        
+        @type nodeA_id: integer
+        @param nodeA_id: id of tail node.
+        @type nodeB_id: integer
+        @param nodeB_id: id of head node.
+        @type info: object
+        @param info: element to be added as info to the new arc.    
+        """
+        try:
+            out_map = self._out[nodeA_id]
+            in_map = self._in[nodeB_id]
+        except KeyError:
+            return
+        if nodeB_id in out_map:
+            out_map[nodeB_id].info = info
+            return
+        self._cache._invalidate_arc(nodeA_id, nodeB_id)
+        arc = GraphIncidenceList.Arc(nodeA_id, nodeB_id, info)
+        out_map[nodeB_id] = arc
+        in_map[nodeA_id] = arc
+        self._stats._add_directed_arc(self._nodes[nodeA_id], self._nodes[nodeB_id])
+    
+    def add_nodes_from(self, elements):
+        """
+        Adds a new node in graph for each one of the specified elements.
+        
+        add_nodes_from(elements) -> None
+        
+        @type elements: iterable
+        @param elements: elements to be assigned to the new nodes.    
+        """
+        with _paused_gc():
+            nodes = self._nodes
+            out = self._out
+            inc = self._in
+            Node = DiGraph.Node
+            node_id = self._next_id
+            for element in elements:
+                nodes[node_id] = Node(node_id, element)
+                out[node_id] = {}
+                inc[node_id] = {}
+                node_id += 1
+            self._stats._add_nodes(node_id - self._next_id)
+            self._next_id = node_id
+    
+    def add_arcs_from(self, arcs, add_missing_nodes = False):
+        """
+        Adds the specified directed arcs in graph.
+        
+        add_arcs_from(arcs, add_missing_nodes) -> None
+        
+        @type arcs: iterable
+        @param arcs: (nodeA_id, nodeB_id) or (nodeA_id, nodeB_id, info) tuples, from tail to head.
+        @type add_missing_nodes: boolean
+        @param add_missing_nodes: if True, missing end nodes are added with their id as element, otherwise their arcs are skipped.
+        """
+        with _paused_gc():
+            nodes = self._nodes
+            out = self._out
+            inc = self._in
+            Arc = GraphIncidenceList.Arc
+            add_arc = self._stats._add_directed_arc
+            cache = self._cache if self._cache._entries else None
+            for arc in arcs:
+                nodeA_id = arc[0]
+                nodeB_id = arc[1]
+                info = arc[2] if len(arc) > 2 else None
+                if nodeA_id not in out or nodeB_id not in out:
+                    if not add_missing_nodes: continue
+                    self._ensure_node(nodeA_id)
+                    self._ensure_node(nodeB_id)
+                out_map = out[nodeA_id]
+                if nodeB_id in out_map:
+                    out_map[nodeB_id].info = info
+                    continue
+                if cache is not None: cache._invalidate_arc(nodeA_id, nodeB_id)
+                new_arc = Arc(nodeA_id, nodeB_id, info)
+                out_map[nodeB_id] = new_arc
+                inc[nodeB_id][nodeA_id] = new_arc
+                add_arc(nodes[nodeA_id], nodes[nodeB_id])
+    
+    def _ensure_node(self, node_id):
+        if node_id in self._nodes: return
+        self._nodes[node_id] = DiGraph.Node(node_id, node_id)
+        self._out[node_id] = {}
+        self._in[node_id] = {}
+        self._stats._add_node()
+        if node_id >= self._next_id: self._next_id = node_id + 1
+    
+    def remove_arc(self, nodeA_id, nodeB_id):
+        """
+        Removed from graph the directed arc from nodeA to nodeB.
+        
+        remove_arc(nodeA_id, nodeB_id) -> None
+        
+        @type nodeA_id: integer
+        @param nodeA_id: id of tail node.
+        @type nodeB_id: integer
+        @param nodeB_id: id of head node.    
+        """
+        try:
+            del self._out[nodeA_id][nodeB_id]
+        except KeyError:
+            return
+        self._cache._invalidate_arc(nodeA_id, nodeB_id)
+        del self._in[nodeB_id][nodeA_id]
+        self._stats._remove_directed_arc(self._nodes[nodeA_id], self._nodes[nodeB_id])
+        
+    def set_arc_status(self, nodeA_id, nodeB_id, status):
+        """
+        Sets the status of the directed arc between nodeA and nodeB.
+        
+        set_arc_status(nodeA_id, nodeB_id, status) -> None
+        
+        @type nodeA_id: integer
+        @param nodeA_id: id of tail node.
+        @type nodeB_id: integer
+        @param nodeB_id: id of head node.
+        @type status: object
+        @param status: element to be added as status info to the specified arc.    
+        """ 
+        try:
+            self._out[nodeA_id][nodeB_id].status = status
+        except KeyError:
+            return
+        
+    def get_nodes(self):
+        """
+        Returns all nodes in graph        
+        get_nodes() -> nodes_list
+        
+        @rtype: list
+        @return: list of nodes in graph.    
+        """
+        return self._nodes.values()
+    
+    def get_arcs(self):
+        """
+        Returns all directed arcs in graph.
+        
+        get_arcs() -> arcs_list
+        
+        @rtype: list
+        @return: list of directed arcs in graph.    
+        """
+        arcs = []
+        for out_map in self._out.itervalues(): arcs.extend(out_map.itervalues())
+        return arcs
+        
+    def get_num_nodes(self):
+        """
+        Returns the number of nodes in graph.
+        
+        get_num_nodes() -> number_of_nodes
+        
+        @rtype: integer
+        @return: number of nodes in graph.    
+        """
+        return len(self._nodes)
+    
+    def get_num_arcs(self):
+        """
+        Returns the number of directed arcs in graph.
+        
+        get_num_arcs() -> number_of_arcs
+        
+        @rtype: integer
+        @return: number of directed arcs in graph.    
+        """
+        return self._stats._num_arcs
+    
+    def get_statistics(self):
+        """
+        Returns the statistics of the graph, kept up to date by its mutators.
+        
+        get_statistics() -> statistics
+        
+        @rtype: GraphStatistics
+        @return: live statistics of the graph.
+        """
+        return self._stats
+
+    def neighborhood(self, node_id, k, reverse = False):
+        """
+        Returns the ids of the nodes within k hops of the specified node.
+        
+        Neighborhoods are cached, and the entries affected by a change of the
+        graph are invalidated by its mutators.
+        
+        neighborhood(node_id, k, reverse) -> ids_set
+        
+        @type node_id: integer
+        @param node_id: id of the root node.
+        @type k: integer
+        @param k: maximum number of hops.
+        @type reverse: boolean
+        @param reverse: if True, arcs are followed from head to tail.
+        
+        @rtype: frozenset
+        @return: ids of the nodes reachable from the root in at most k hops, root excluded; empty if the root is not in graph.
+        """
+        heads = self._tails if reverse else self._heads
+        return _neighborhood(self, self._cache, heads, node_id, k, reverse)
+    
+    def get_neighborhood_cache(self):
+        """
+        Returns the cache of the neighborhoods of the graph, with its counters.
+        
+        get_neighborhood_cache() -> cache
+        
+        @rtype: NeighborhoodCache
+        @return: neighborhood cache of the graph.
+        """
+        return self._cache
+    
+    def is_node_in_graph(self, node_id):
+        return node_id in self._nodes
+    
+    def get_node_by_id(self, node_id):
+        """
+        Returns node in graph by id.
+        
+        get_node_by_id(node_id) -> node
+        
+        @type node_id: integer
+        @param node_id: id of the requested node in graph. 
+        
+        @rtype: node
+        @return: node corresponding to the given id.
+        """
+        try:
+            return self._nodes[node_id]
+        except KeyError:
+            return None
+    
+    def get_incident_arcs(self, node_id):
+        """
+        Returns all arcs leaving the specified node.
+        
+        get_incident_arcs(node_id) -> list
+        
+        @type node_id: integer
+        @param node_id: id of node whos outgoing arcs have been requested.  
+        
+        @rtype: list
+        @return: all arcs whose tail is the node whose id has been specified.  
+        """
+        try:
+            return self._out[node_id].values()
+        except KeyError:
+            return []
+    
+    def is_directed(self):
+        """
+        Returns True, the arcs of the graph being directed.
+        
+        is_directed() -> True
+        
+        @rtype: boolean
+        @return: True.
+        """
+        return True
+    
+    def get_in_arcs(self, node_id):
+        """
+        Returns all arcs entering the specified node.
+        
+        get_in_arcs(node_id) -> list
+        
+        @type node_id: integer
+        @param node_id: id of node whos incoming arcs have been requested.  
+        
+        @rtype: list
+        @return: all arcs whose head is the node whose id has been specified.  
+        """
+        try:
+            return self._in[node_id].values()
+        except KeyError:
+            return []
+    
+    def get_successors(self, node_id):
+        """
+        Returns the ids of the heads of the arcs leaving the specified node.
+        
+        get_successors(node_id) -> ids_list
+        
+        @type node_id: integer
+        @param node_id: node's id.
+        
+        @rtype: list
+        @return: ids of the successors of the node.
+        """
+        try:
+            return self._out[node_id].keys()
+        except KeyError:
+            return []
+    
+    def get_predecessors(self, node_id):
+        """
+        Returns the ids of the tails of the arcs entering the specified node.
+        
+        get_predecessors(node_id) -> ids_list
+        
+        @type node_id: integer
+        @param node_id: node's id.
+        
+        @rtype: list
+        @return: ids of the predecessors of the node.
+        """
+        try:
+            return self._in[node_id].keys()
+        except KeyError:
+            return []
+    
+    def out_degree(self, node_id):
+        """
+        Returns the number of arcs leaving the specified node.
+        
+        out_degree(node_id) -> degree
+        
+        @type node_id: integer
+        @param node_id: node's id.
+        
+        @rtype: integer
+        @return: out-degree of the node, None if the node is not in graph.
+        """
+        try:
+            return self._nodes[node_id]._deg
+        except KeyError:
+            return None
+    
+    def in_degree(self, node_id):
+        """
+        Returns the number of arcs entering the specified node.
+        
+        in_degree(node_id) -> degree
+        
+        @type node_id: integer
+        @param node_id: node's id.
+        
+        @rtype: integer
+        @return: in-degree of the node, None if the node is not in graph.
+        """
+        try:
+            return self._nodes[node_id]._in_deg
+        except KeyError:
+            return None
+    
+    def are_adjacent(self, nodeA_id, nodeB_id):
+        """
+        Returns True if there is an arc from nodeA to nodeB, otherwise returns False.
+        
+        are_adjacent(nodeA_id, nodeB_id) -> True/False
+        
+        @type nodeA_id: integer
+        @param nodeA_id: tail node's id.
+        @type nodeB_id: integer
+        @param nodeB_id: head node's id.
+        
+        @rtype: boolean
+        @return: True if there is an arc from nodeA to nodeB, otherwise False.    
+        """
+        try:
+            return nodeB_id in self._out[nodeA_id]
+        except KeyError:
+            return False
+        
+    def dfs(self, root_node_id, reverse = False):
+        """
+        Returns the LIFO path-as-list from graph's root to all other nodes in graph.
+        
+        dfs(root_node_id, reverse) -> path
+        
+        @type root_node_id: integer
+        @param root_node_id: graph's root's id.
+        @type reverse: boolean
+        @param reverse: if True, arcs are followed backwards, from head to tail.
+        
+        @rtype: list
+        @return: LIFO path from graph's root to all other nodes in graph.
+        """
+        if root_node_id not in self._nodes: return []
+        inc = self._in if reverse else self._out
+        visited = set([root_node_id])
+        L = []
+        s = StackArrayList()
+        s.push(root_node_id)
+        while not s.is_empty():
+            curr_node_id = s.pop()
+            L.append(self._nodes[curr_node_id])
+            for head_id in inc[curr_node_id]:
+                if head_id not in visited:
+                    visited.add(head_id)
+                    s.push(head_id)
+        return L
+
+    def bfs(self, root_node_id, reverse = False):
+        """
+        Returns the FIFO path-as-list from graph's root to all other nodes in graph.
+        
+        bfs(root_node_id, reverse) -> path
+        
+        @type root_node_id: integer
+        @param root_node_id: graph's root's id.
+        @type reverse: boolean
+        @param reverse: if True, arcs are followed backwards, from head to tail.
+        
+        @rtype: list
+        @return: FIFO path from graph's root to all other nodes in graph.
+        """
+        if root_node_id not in self._nodes: return []
+        inc = self._in if reverse else self._out
+        visited = set([root_node_id])
+        L = []
+        q = QueueDeque()
+        q.enqueue(root_node_id)
+        while not q.is_empty():
+            curr_node_id = q.dequeue()
+            L.append(self._nodes[curr_node_id])
+            for head_id in inc[curr_node_id]:
+                if head_id not in visited:
+                    visited.add(head_id)
+                    q.enqueue(head_id)
+        return L
+    
+    def iter_dfs(self, root_node_id, max_depth = None, visitor = None, details = False, reverse = False):
+        """
+        Lazily yields the nodes in LIFO order from graph's root.
+        
+        iter_dfs(root_node_id, max_depth, visitor, details, reverse) -> nodes
+        
+        @type root_node_id: integer
+        @param root_node_id: graph's root's id.
+        @type max_depth: integer
+        @param max_depth: nodes deeper than max_depth are not visited, None for no limit.
+        @type visitor: callable
+        @param visitor: visitor(node, depth, parent_id), the search stops after the node for which it returns True.
+        @type details: boolean
+        @param details: if True, (node, depth, parent_id) tuples are yielded instead of nodes.
+        @type reverse: boolean
+        @param reverse: if True, arcs are followed backwards, from head to tail.
+        
+        @rtype: generator
+        @return: nodes reachable from graph's root, in LIFO order.
+        """
+        heads = self._tails if reverse else self._heads
+        return _iter_search(self, heads, root_node_id, max_depth, visitor, details, True)
+    
+    def iter_bfs(self, root_node_id, max_depth = None, visitor = None, details = False, reverse = False):
+        """
+        Lazily yields the nodes in FIFO order from graph's root.
+        
+        iter_bfs(root_node_id, max_depth, visitor, details, reverse) -> nodes
+        
+        @type root_node_id: integer
+        @param root_node_id: graph's root's id.
+        @type max_depth: integer
+        @param max_depth: nodes deeper than max_depth are not visited, None for no limit.
+        @type visitor: callable
+        @param visitor: visitor(node, depth, parent_id), the search stops after the node for which it returns True.
+        @type details: boolean
+        @param details: if True, (node, depth, parent_id) tuples are yielded instead of nodes.
+        @type reverse: boolean
+        @param reverse: if True, arcs are followed backwards, from head to tail.
+        
+        @rtype: generator
+        @return: nodes reachable from graph's root, in FIFO order.
+        """
+        heads = self._tails if reverse else self._heads
+        return _iter_search(self, heads, root_node_id, max_depth, visitor, details, False)
+    
+    def _heads(self, node_id):
+        return self._out[node_id].iterkeys()
+    
+    def _tails(self, node_id):
+        return self._in[node_id].iterkeys()
+    
+    def freeze(self):
+        """
+        Returns an immutable compressed-sparse-row snapshot of the graph, with directed arcs.
+        
+        freeze() -> frozen_graph
+        
+        @rtype: GraphCSR
+        @return: immutable array-backed snapshot of the graph.
+        """
+        return freeze(self)
+    
+    def __repr__(self):
+        s = "{"       
+        for node in self._nodes.itervalues():
+            s += "{} : {}\n".format(str(node), str(self._out[node._id].values())) 
+        s += "}"
+        return s
+    
+    def __str__(self):
+        return self.__repr__()    
+    
+class NeighborhoodCache:
+    """
+    Bounded LRU cache of the k-hop neighborhoods of a graph.
+    
+    The graph invalidates entries precisely: an inverted index maps every node
+    to the entries whose region (root and neighborhood) contains it, and each
+    entry keeps the interior of its region, the nodes closer than k hops whose
+    arcs were followed. Adding or removing an arc can only change the entries
+    having one of its ends in their interior (on directed graphs the tail, or
+    the head for reverse neighborhoods), and removing a node the entries
+    having it in their region.
+    """
+    
+    def __init__(self, capacity = 1024, directed = False):
+        self._capacity = capacity
+        self._directed = directed
+        self._entries = OrderedDict()
+        self._index = {}
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._invalidations = 0
+        
+    def get_capacity(self):
+        """
+        Returns the maximum number of cached neighborhoods.
+        
+        get_capacity() -> capacity
+        
+        @rtype: integer
+        @return: maximum number of entries.
+        """
+        return self._capacity
+    
+    def set_capacity(self, capacity):
+        """
+        Sets the maximum number of cached neighborhoods, evicting the least recently used ones in excess.
+        
+        set_capacity(capacity) -> None
+        
+        @type capacity: integer
+        @param capacity: maximum number of entries, 0 to disable caching.
+        """
+        self._capacity = capacity
+        self._evict()
+        
+    def get_size(self):
+        """
+        Returns the number of cached neighborhoods.
+        
+        get_size() -> size
+        
+        @rtype: integer
+        @return: number of entries.
+        """
+        return len(self._entries)
+    
+    def get_hits(self):
+        """
+        Returns the number of queries answered from the cache.
+        
+        get_hits() -> hits
+        
+        @rtype: integer
+        @return: number of hits.
+        """
+        return self._hits
+    
+    def get_misses(self):
+        """
+        Returns the number of queries which had to search the graph.
+        
+        get_misses() -> misses
+        
+        @rtype: integer
+        @return: number of misses.
+        """
+        return self._misses
+    
+    def get_evictions(self):
+        """
+        Returns the number of entries evicted to respect the capacity.
+        
+        get_evictions() -> evictions
+        
+        @rtype: integer
+        @return: number of evictions.
+        """
+        return self._evictions
+    
+    def get_invalidations(self):
+        """
+        Returns the number of entries invalidated by changes of the graph.
+        
+        get_invalidations() -> invalidations
+        
+        @rtype: integer
+        @return: number of invalidations.
+        """
+        return self._invalidations
+    
+    def clear(self):
+        """
+        Removes all entries, keeping the counters.
+        
+        clear() -> None
+        """
+        self._entries.clear()
+        self._index.clear()
+        
+    def _get(self, key):
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            self._misses += 1
+            return None
+        self._entries[key] = entry
+        self._hits += 1
+        return entry[0]
+    
+    def _put(self, key, neighborhood, interior):
+        if self._capacity <= 0: return
+        self._entries[key] = (neighborhood, interior)
+        index = self._index
+        index.setdefault(key[0], set()).add(key)
+        for node_id in neighborhood: index.setdefault(node_id, set()).add(key)
+        self._evict()
+        
+    def _evict(self):
+        while len(self._entries) > max(self._capacity, 0):
+            self._discard(next(iter(self._entries)))
+            self._evictions += 1
+        
+    def _discard(self, key):
+        neighborhood, interior = self._entries.pop(key)
+        index = self._index
+        for node_id in chain((key[0],), neighborhood):
+            keys = index.get(node_id)
+            if keys is None: continue
+            keys.discard(key)
+            if not keys: del index[node_id]
+        
+    def _invalidate_node(self, node_id):
+        keys = self._index.get(node_id)
+        if not keys: return
+        for key in list(keys):
+            self._discard(key)
+            self._invalidations += 1
+            
+    def _invalidate_arc(self, nodeA_id, nodeB_id):
+        index = self._index
+        if not index: return
+        keys = set(index.get(nodeA_id, ()))
+        keys.update(index.get(nodeB_id, ()))
+        for key in keys:
+            interior = self._entries[key][1]
+            if self._directed: affected = (nodeB_id if key[2] else nodeA_id) in interior
+            else: affected = nodeA_id in interior or nodeB_id in interior
+            if affected:
+                self._discard(key)
+                self._invalidations += 1
+        
+    def __repr__(self):
+        return "#(size: {}, capacity: {}, hits: {}, misses: {}, evictions: {}, invalidations: {})".format(str(len(self._entries)), str(self._capacity), str(self._hits), str(self._misses), str(self._evictions), str(self._invalidations))
+    
+    def __str__(self):
+        return self.__repr__()
+    
+class GraphStatistics:
+    """
+    Counters of a graph, kept up to date by its mutators.
+    
+    Node, arc and self-loop counts, the degree histogram and the maximum and
+    minimum degree are read in constant time. A self-loop adds 2 to the degree
+    of its node and, on directed graphs, the degree of a node is the sum of its
+    in-degree and out-degree. The node degrees themselves are updated here, so
+    that the histogram never drifts from them.
+    """
+    
+    def __init__(self):
+        self._num_nodes = 0
+        self._num_arcs = 0
+        self._num_self_loops = 0
+        self._histogram = {}
+        self._max_degree = None
+        self._min_degree = None
+        
+    def get_num_nodes(self):
+        """
+        Returns the number of nodes in graph.
+        
+        get_num_nodes() -> number_of_nodes
+        
+        @rtype: integer
+        @return: number of nodes in graph.
+        """
+        return self._num_nodes
+    
+    def get_num_arcs(self):
+        """
+        Returns the number of arcs in graph, self-loops included.
+        
+        get_num_arcs() -> number_of_arcs
+        
+        @rtype: integer
+        @return: number of arcs in graph.
+        """
+        return self._num_arcs
+    
+    def get_num_self_loops(self):
+        """
+        Returns the number of self-loops in graph.
+        
+        get_num_self_loops() -> number_of_self_loops
+        
+        @rtype: integer
+        @return: number of arcs whose tail is also their head.
+        """
+        return self._num_self_loops
+    
+    def get_max_degree(self):
+        """
+        Returns the maximum node degree.
+        
+        get_max_degree() -> degree
+        
+        @rtype: integer
+        @return: maximum degree, None if the graph is empty.
+        """
+        return self._max_degree
+    
+    def get_min_degree(self):
+        """
+        Returns the minimum node degree.
+        
+        get_min_degree() -> degree
+        
+        @rtype: integer
+        @return: minimum degree, None if the graph is empty.
+        """
+        return self._min_degree
+    
+    def get_degree_histogram(self):
+        """
+        Returns the number of nodes with each degree.
+        
+        get_degree_histogram() -> histogram
+        
+        @rtype: dict
+        @return: copy of the histogram, as degree -> number of nodes with that degree (absent degrees have no nodes).
+        """
+        return dict(self._histogram)
+    
+    def get_average_degree(self):
+        """
+        Returns the average node degree.
+        
+        get_average_degree() -> degree
+        
+        @rtype: float
+        @return: average degree, None if the graph is empty.
+        """
+        if self._num_nodes == 0: return None
+        return 2.0 * self._num_arcs / self._num_nodes
+    
+    def _add_node(self):
+        self._num_nodes += 1
+        self._insert(0)
+        
+    def _add_nodes(self, count):
+        if count <= 0: return
+        self._num_nodes += count
+        self._histogram[0] = self._histogram.get(0, 0) + count
+        self._min_degree = 0
+        if self._max_degree is None: self._max_degree = 0
+    
+    def _remove_node(self):
+        self._num_nodes -= 1
+        self._delete(0)
+        
+    def _add_arc(self, nodeA, nodeB):
+        self._num_arcs += 1
+        if nodeA is nodeB:
+            self._num_self_loops += 1
+            self._shift(nodeA._deg, nodeA._deg + 2)
+            nodeA._deg += 2
+            return
+        self._shift(nodeA._deg, nodeA._deg + 1)
+        nodeA._deg += 1
+        self._shift(nodeB._deg, nodeB._deg + 1)
+        nodeB._deg += 1
+        
+    def _remove_arc(self, nodeA, nodeB):
+        self._num_arcs -= 1
+        if nodeA is nodeB:
+            self._num_self_loops -= 1
+            self._shift(nodeA._deg, nodeA._deg - 2)
+            nodeA._deg -= 2
+            return
+        self._shift(nodeA._deg, nodeA._deg - 1)
+        nodeA._deg -= 1
+        self._shift(nodeB._deg, nodeB._deg - 1)
+        nodeB._deg -= 1
+        
+    def _add_directed_arc(self, tail, head):
+        self._num_arcs += 1
+        if tail is head:
+            self._num_self_loops += 1
+            degree = tail._deg + tail._in_deg
+            self._shift(degree, degree + 2)
+        else:
+            degree = tail._deg + tail._in_deg
+            self._shift(degree, degree + 1)
+            degree = head._deg + head._in_deg
+            self._shift(degree, degree + 1)
+        tail._deg += 1
+        head._in_deg += 1
+        
+    def _remove_directed_arc(self, tail, head):
+        self._num_arcs -= 1
+        if tail is head:
+            self._num_self_loops -= 1
+            degree = tail._deg + tail._in_deg
+            self._shift(degree, degree - 2)
+        else:
+            degree = tail._deg + tail._in_deg
+            self._shift(degree, degree - 1)
+            degree = head._deg + head._in_deg
+            self._shift(degree, degree - 1)
+        tail._deg -= 1
+        head._in_deg -= 1
+        
+    def _shift(self, old_degree, new_degree):
+        self._insert(new_degree)
+        self._delete(old_degree)
+        
+    def _insert(self, degree):
+        self._histogram[degree] = self._histogram.get(degree, 0) + 1
+        if self._max_degree is None or degree > self._max_degree: self._max_degree = degree
+        if self._min_degree is None or degree < self._min_degree: self._min_degree = degree
+        
+    def _delete(self, degree):
+        histogram = self._histogram
+        count = histogram[degree] - 1
+        if count > 0:
+            histogram[degree] = count
+            return
+        del histogram[degree]
+        if not histogram:
+            self._max_degree = None
+            self._min_degree = None
+            return
+        if degree == self._max_degree:
+            while self._max_degree not in histogram: self._max_degree -= 1
+        if degree == self._min_degree:
+            while self._min_degree not in histogram: self._min_degree += 1
+    
+    def __repr__(self):
+        return "#(nodes: {}, arcs: {}, self-loops: {}, min degree: {}, max degree: {}, histogram: {})".format(str(self._num_nodes), str(self._num_arcs), str(self._num_self_loops), str(self._min_degree), str(self._max_degree), str(self._histogram))
+    
+    def __str__(self):
+        return self.__repr__()
+    
+class GraphCSR(basegraph):
+    """
+    Immutable compressed-sparse-row snapshot of an undirected graph.
+    
+    Nodes are renumbered into dense indices (ordered by id). The arcs leaving
+    the node with index i are stored in the slice [offsets[i], offsets[i + 1])
+    of the targets, info and status columns, sorted by target index. A frozen
+    DiGraph keeps its arcs directed: the arcs entering each node are indexed
+    by a transposed copy of the rows, built on the first get_in_arcs.
+    Columns may be arrays, NumPy arrays or any other indexable sequence, and
+    Node and Arc objects are only materialized when they are returned.
+    """
+    
+    def __init__(self, ids, elements, node_status, offsets, targets, info, status, directed = False):
+        self._ids = ids
+        self._elements = elements
+        self._node_status = node_status
+        self._offsets = offsets
+        self._targets = targets
+        self._info = info
+        self._status = status
+        self._directed = directed
+        self._index = _IdIndex(ids)
+        self._in_offsets = None
+        self._in_arcs = None
+        self._sources = None
+        
+    def add_node(self, element, node_id = None):
+        raise FrozenGraphError("add_node: frozen graph cannot be modified.")
+    
+    def remove_node(self, node_id):
+        raise FrozenGraphError("remove_node: frozen graph cannot be modified.")
+    
+    def add_arc(self, nodeA_id, nodeB_id, info = None):
+        raise FrozenGraphError("add_arc: frozen graph cannot be modified.")
+    
+    def add_nodes_from(self, elements):
+        raise FrozenGraphError("add_nodes_from: frozen graph cannot be modified.")
+    
+    def add_arcs_from(self, arcs, add_missing_nodes = False):
+        raise FrozenGraphError("add_arcs_from: frozen graph cannot be modified.")
+    
+    def remove_arc(self, nodeA_id, nodeB_id):
+        raise FrozenGraphError("remove_arc: frozen graph cannot be modified.")
+    
+    def set_arc_status(self, nodeA_id, nodeB_id, status):
+        raise FrozenGraphError("set_arc_status: frozen graph cannot be modified.")
+        
+    def get_nodes(self):
+        """
+        Returns all nodes in graph        
+        get_nodes() -> nodes_list
+        
+        @rtype: list
+        @return: list of nodes in graph.    
+        """
+        return [self._make_node(i) for i in xrange(len(self._ids))]
+    
+    def get_arcs(self):
+        """
+        Returns all undirected arcs in graph.
+        
+        get_arcs() -> arcs_list
+        
+        @rtype: list
+        @return: list of undirected arcs in graph.    
+        """
+        arcs = []
+        for i in xrange(len(self._ids)):
+            for k in xrange(self._offsets[i], self._offsets[i + 1]): arcs.append(self._make_arc(i, k))
+        return arcs
+        
+    def get_num_nodes(self):
+        """
+        Returns the number of nodes in graph.
+        
+        get_num_nodes() -> number_of_nodes
+        
+        @rtype: integer
+        @return: number of nodes in graph.    
+        """
+        return len(self._ids)
+    
+    def get_num_arcs(self):
+        """
+        Returns the number of arcs in graph, undirected arcs being stored in both directions.
+        
+        get_num_arcs() -> number_of_arcs
+        
+        @rtype: integer
+        @return: number of arcs in graph.    
+        """
+        if self._directed: return len(self._targets)
+        return len(self._targets) / 2
+    
+    def is_node_in_graph(self, node_id):
+        return node_id in self._index
+    
+    def get_node_by_id(self, node_id):
+        """
+        Returns node in graph by id.
+        
+        get_node_by_id(node_id) -> node
+        
+        @type node_id: integer
+        @param node_id: id of the requested node in graph. 
+        
+        @rtype: node
+        @return: node corresponding to the given id.
+        """
+        try:
+            return self._make_node(self._index[node_id])
+        except KeyError:
+            return None
+    
+    def get_incident_arcs(self, node_id):
+        """
+        Returns all incident arcs to the specified node.
+        
+        get_incident_arcs(node_id) -> list/set
+        
+        @type node_id: integer
+        @param node_id: id of node whos incident arcs have been requested.  
+        
+        @rtype: list/set
+        @return: all arcs that are incident to the node whose id has been specified.  
+        """
+        try:
+            i = self._index[node_id]
+        except KeyError:
+            return []
+        return [self._make_arc(i, k) for k in xrange(self._offsets[i], self._offsets[i + 1])]
+    
+    def get_in_arcs(self, node_id):
+        """
+        Returns all arcs entering the specified node.
+        
+        get_in_arcs(node_id) -> list
+        
+        @type node_id: integer
+        @param node_id: id of node whos incoming arcs have been requested.  
+        
+        @rtype: list
+        @return: all arcs whose head is the node whose id has been specified.  
+        """
+        try:
+            i = self._index[node_id]
+        except KeyError:
+            return []
+        if self._in_offsets is None: self._transpose()
+        return [self._make_arc(self._sources[k], k) for k in self._in_arcs[self._in_offsets[i]:self._in_offsets[i + 1]]]
+    
+    def is_directed(self):
+        """
+        Returns True if the arcs of the graph are directed, otherwise returns False.
+        
+        is_directed() -> True/False
+        
+        @rtype: boolean
+        @return: True if the frozen graph was directed, otherwise False.
+        """
+        return self._directed
+    
+    def _transpose(self):
+        num_nodes = len(self._ids)
+        offsets = self._offsets
+        targets = self._targets
+        sources = array("l", [0]) * len(targets)
+        in_offsets = array("l", [0]) * (num_nodes + 1)
+        for i in xrange(num_nodes):
+            for k in xrange(offsets[i], offsets[i + 1]):
+                sources[k] = i
+                in_offsets[targets[k] + 1] += 1
+        for i in xrange(num_nodes): in_offsets[i + 1] += in_offsets[i]
+        position = array("l", in_offsets)
+        in_arcs = array("l", [0]) * len(targets)
+        for k in xrange(len(targets)):
+            in_arcs[position[targets[k]]] = k
+            position[targets[k]] += 1
+        self._sources = sources
+        self._in_arcs = in_arcs
+        self._in_offsets = in_offsets
+    
+    def are_adjacent(self, nodeA_id, nodeB_id):
+        """
+        Returns True if nodeA and nodeB are adjacent, otherwise returns False.
+        
+        are_adjacent(nodeA_id, nodeB_id) -> True/False
+        
+        @type nodeA_id: integer
+        @param nodeA_id: first node's id.
+        @type nodeB_id: integer
+        @param nodeB_id: second node's id.
+        
+        @rtype: boolean
+        @return: True if nodeA and nodeB are adjacent, otherwise False.    
+        """
+        try:
+            i = self._index[nodeA_id]
+            j = self._index[nodeB_id]
+        except KeyError:
+            return False
+        hi = self._offsets[i + 1]
+        k = bisect_left(self._targets, j, self._offsets[i], hi)
+        return k < hi and self._targets[k] == j
+        
+    def dfs(self, root_node_id):
+        """
+        Returns the LIFO path-as-list from graph's root to all other nodes in graph.
+        
+        dfs(root_node_id) -> path
+        
+        @type root_node_id: integer
+        @param root_node_id: graph's root's id.
+        
+        @rtype: list
+        @return: LIFO path from graph's root to all other nodes in graph.
+        """
+        try:
+            root = self._index[root_node_id]
+        except KeyError:
+            return []
+        offsets = self._offsets
+        targets = self._targets
+        status = bytearray(len(self._ids))
+        status[root] = 1
+        L = []
+        s = StackArrayList()
+        s.push(root)
+        while not s.is_empty():
+            curr = s.pop()
+            L.append(self._make_node(curr))
+            for k in xrange(offsets[curr], offsets[curr + 1]):
+                head = targets[k]
+                if status[head] == 0:
+                    status[head] = 1
+                    s.push(head)
+        return L
+
+    def bfs(self, root_node_id):
+        """
+        Returns the FIFO path-as-list from graph's root to all other nodes in graph.
+        
+        bfs(root_node_id) -> path
+        
+        @type root_node_id: integer
+        @param root_node_id: graph's root's id.
+        
+        @rtype: list
+        @return: FIFO path from graph's root to all other nodes in graph.
+        """
+        try:
+            root = self._index[root_node_id]
+        except KeyError:
+            return []
+        offsets = self._offsets
+        targets = self._targets
+        status = bytearray(len(self._ids))
+        status[root] = 1
+        L = []
+        q = QueueDeque()
+        q.enqueue(root)
+        while not q.is_empty():
+            curr = q.dequeue()
+            L.append(self._make_node(curr))
+            for k in xrange(offsets[curr], offsets[curr + 1]):
+                head = targets[k]
+                if status[head] == 0:
+                    status[head] = 1
+                    q.enqueue(head)
+        return L
+    
+    def iter_dfs(self, root_node_id, max_depth = None, visitor = None, details = False):
+        """
+        Lazily yields the nodes in LIFO order from graph's root.
+        
+        iter_dfs(root_node_id, max_depth, visitor, details) -> nodes
+        
+        @type root_node_id: integer
+        @param root_node_id: graph's root's id.
+        @type max_depth: integer
+        @param max_depth: nodes deeper than max_depth are not visited, None for no limit.
+        @type visitor: callable
+        @param visitor: visitor(node, depth, parent_id), the search stops after the node for which it returns True.
+        @type details: boolean
+        @param details: if True, (node, depth, parent_id) tuples are yielded instead of nodes.
+        
+        @rtype: generator
+        @return: nodes reachable from graph's root, in LIFO order.
+        """
+        return _iter_search(self, self._heads, root_node_id, max_depth, visitor, details, True)
+    
+    def iter_bfs(self, root_node_id, max_depth = None, visitor = None, details = False):
+        """
+        Lazily yields the nodes in FIFO order from graph's root.
+        
+        iter_bfs(root_node_id, max_depth, visitor, details) -> nodes
+        
+        @type root_node_id: integer
+        @param root_node_id: graph's root's id.
+        @type max_depth: integer
+        @param max_depth: nodes deeper than max_depth are not visited, None for no limit.
+        @type visitor: callable
+        @param visitor: visitor(node, depth, parent_id), the search stops after the node for which it returns True.
+        @type details: boolean
+        @param details: if True, (node, depth, parent_id) tuples are yielded instead of nodes.
+        
+        @rtype: generator
+        @return: nodes reachable from graph's root, in FIFO order.
+        """
+        return _iter_search(self, self._heads, root_node_id, max_depth, visitor, details, False)
+    
+    def _heads(self, node_id):
+        i = self._index[node_id]
+        ids = self._ids
+        targets = self._targets
+        for k in xrange(self._offsets[i], self._offsets[i + 1]): yield ids[targets[k]]
+    
+    def _make_node(self, i):
+        node = GraphIncidenceList.Node(self._ids[i], self._elements[i], self._node_status[i])
+        node._deg = self._offsets[i + 1] - self._offsets[i]
+        return node
+    
+    def _make_arc(self, i, k):
+        return GraphIncidenceList.Arc(self._ids[i], self._ids[self._targets[k]], self._info[k], self._status[k])
+    
+    def __repr__(self):
+        s = "{"
+        for i in xrange(len(self._ids)):
+            arcs_list = [self._make_arc(i, k) for k in xrange(self._offsets[i], self._offsets[i + 1])]
+            s += "{} : {}\n".format(str(self._make_node(i)), str(arcs_list))
+        s += "}"
+        return s
+    
+    def __str__(self):
+        return self.__repr__()
+    
+class _IdIndex:
+    # Maps the sorted node ids of a GraphCSR to their dense indices without
+    # building a dictionary: by offset when ids are contiguous, otherwise by
+    # binary search.
+    
+    def __init__(self, ids):
+        self._ids = ids
+        self._first = ids[0] if len(ids) > 0 else 0
+        self._dense = len(ids) == 0 or ids[len(ids) - 1] - self._first == len(ids) - 1
+    
+    def __contains__(self, node_id):
+        try:
+            self[node_id]
+        except KeyError:
+            return False
+        return True
+    
+    def __getitem__(self, node_id):
+        n = len(self._ids)
+        if self._dense:
+            i = node_id - self._first
+            if 0 <= i < n: return i
+        else:
+            i = bisect_left(self._ids, node_id)
+            if i < n and self._ids[i] == node_id: return i
+        raise KeyError(node_id)
+    
+def _iter_search(graph, heads, root_node_id, max_depth, visitor, details, lifo):
+    if not graph.is_node_in_graph(root_node_id): return
+    visited = set([root_node_id])
+    if lifo:
+        frontier = StackArrayList()
+        put, take = frontier.push, frontier.pop
+    else:
+        frontier = QueueDeque()
+        put, take = frontier.enqueue, frontier.dequeue
+    put((root_node_id, 0, None))
+    while not frontier.is_empty():
+        node_id, depth, parent_id = take()
+        node = graph.get_node_by_id(node_id)
+        stop = visitor is not None and visitor(node, depth, parent_id)
+        yield (node, depth, parent_id) if details else node
+        if stop: return
+        if max_depth is not None and depth >= max_depth: continue
+        for head_id in heads(node_id):
+            if head_id not in visited:
+                visited.add(head_id)
+                put((head_id, depth + 1, node_id))
+    
+def _neighborhood(graph, cache, heads, node_id, k, reverse = False):
+    if k < 0: raise InvalidParameterError("neighborhood: k must be non-negative.")
+    if not graph.is_node_in_graph(node_id): return frozenset()
+    key = (node_id, k, reverse)
+    neighborhood = cache._get(key)
+    if neighborhood is not None: return neighborhood
+    reached = set([node_id])
+    interior = set()
+    frontier = [node_id]
+    for depth in xrange(k):
+        next_frontier = []
+        for curr_node_id in frontier:
+            interior.add(curr_node_id)
+            for head_id in heads(curr_node_id):
+                if head_id not in reached:
+                    reached.add(head_id)
+                    next_frontier.append(head_id)
+        if not next_frontier: break
+        frontier = next_frontier
+    reached.discard(node_id)
+    neighborhood = frozenset(reached)
+    cache._put(key, neighborhood, frozenset(interior))
+    return neighborhood
+    
+@contextmanager
+def _paused_gc():
+    # Bulk loads allocate millions of long-lived objects: the cyclic collector
+    # would repeatedly traverse all of them without ever finding garbage.
+    gc_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        yield
+    finally:
+        if gc_enabled: gc.enable()
+    
+def freeze(graph):
+    """
+    Builds the immutable compressed-sparse-row snapshot of the specified graph.
+    
+    freeze(graph) -> frozen_graph
+    
+    @type graph: basegraph
+    @param graph: graph to be frozen.
+    
+    @rtype: GraphCSR
+    @return: immutable array-backed snapshot of the graph.
+    """
+    nodes = sorted(graph.get_nodes(), key = lambda node: node._id)
+    index = dict((nodes[i]._id, i) for i in xrange(len(nodes)))
+    ids = array("l", [node._id for node in nodes])
+    elements = [node.element for node in nodes]
+    node_status = [node.status for node in nodes]
+    offsets = array("l", [0])
+    targets = array("l")
+    info = []
+    status = []
+    for node in nodes:
+        row = []
+        for arc in graph.get_incident_arcs(node._id):
+            if arc._head in index: row.append((index[arc._head], arc.info, arc.status))
+        row.sort(key = lambda entry: entry[0])
+        for head, arc_info, arc_status in row:
+            targets.append(head)
+            info.append(arc_info)
+            status.append(arc_status)
+        offsets.append(len(targets))
+    return GraphCSR(ids, elements, node_status, offsets, targets, info, status, graph.is_directed())
+    
+def __test_frozen(graph):
+    """
+    Frozen Graph Test.
+    
+    __test_frozen(graph) -> None
+    
+    @type graph: basegraph
+    @param graph: graph instance to be frozen.    
+    """
+    frozen = graph.freeze()
+    
+    print "### iPATH TEST DATA STRUCTURE"
+    print "### Data Type: Graph ({})".format(str(frozen.__class__.__bases__[0].__name__))
+    print "### Implementation: {} (frozen {})".format(str(frozen.__class__.__name__), str(graph.__class__.__name__))
+    
+    print "\n*** GRAPH ***\n"    
+    print "\n{}\n".format(str(frozen))
+    
+    print "\n*** ADJACENCY ***\n"    
+    for i in range(10):
+        for j in range(10):
+            if frozen.are_adjacent(i, j) != graph.are_adjacent(i, j):
+                print "Adjacency Mismatch ({}, {})\n".format(str(i), str(j))
+    
+    if graph.is_directed():
+        print "\n*** IN ARCS ***\n"
+        for i in range(10):
+            if sorted(arc._tail for arc in frozen.get_in_arcs(i)) != sorted(arc._tail for arc in graph.get_in_arcs(i)):
+                print "In Arcs Mismatch ({})\n".format(str(i))
+    
+    print "\n*** NODES/ARCS ***\n"
+    print "directed: {}\n".format(str(frozen.is_directed()))
+    print "numNodes: {}\n".format(str(frozen.get_num_nodes()))
+    print "numArcs: {}\n".format(str(frozen.get_num_arcs()))
+    
+    print "\n*** SEARCH BFS/DFS ***\n"           
+    for i in range(10):        
+        print "bfs({}): {}".format(str(i), str([node._id for node in frozen.bfs(i)]))
+        print "dfs({}): {}\n".format(str(i), str([node._id for node in frozen.dfs(i)]))
+    
+    print "\n*** ADD NODE ***\n"
+    try:
+        frozen.add_node(10)
+    except FrozenGraphError as err:
+        print "add_node(10): {}\n".format(err.message)
+        
+    print "\n### END OF TEST ###\n"
+    
+def __test_directed(graph):
+    """
+    Directed Graph Test.
+    
+    __test_directed(graph) -> None
+    
+    @type graph: DiGraph
+    @param graph: directed graph instance, as left by __test.    
+    """
+    print "### iPATH TEST DATA STRUCTURE"
+    print "### Data Type: Graph ({})".format(str(graph.__class__.__bases__[0].__name__))
+    print "### Implementation: {} (directed)".format(str(graph.__class__.__name__))
+    
+    print "\n*** IN/OUT DEGREE ***\n"
+    for node in graph.get_nodes():
+        print "{}: in {} out {}".format(str(node._id), str(graph.in_degree(node._id)), str(graph.out_degree(node._id)))
+    
+    print "\n*** PREDECESSORS/SUCCESSORS ***\n"
+    for node in graph.get_nodes():
+        print "{}: predecessors {} successors {}".format(str(node._id), str(graph.get_predecessors(node._id)), str(graph.get_successors(node._id)))
+    
+    print "\n*** REVERSE SEARCH BFS/DFS ***\n"
+    for i in range(10):
+        print "bfs({}, reverse = True): {}".format(str(i), str([node._id for node in graph.bfs(i, reverse = True)]))
+        print "dfs({}, reverse = True): {}\n".format(str(i), str([node._id for node in graph.dfs(i, reverse = True)]))
+    print "iter_bfs(9, max_depth = 2, reverse = True): {}\n".format(str([node._id for node in graph.iter_bfs(9, max_depth = 2, reverse = True)]))
+        
+    print "\n### END OF TEST ###\n"
+    
+def __test_snapshot(graph):
+    """
+    Graph Snapshot Test.
+    
+    __test_snapshot(graph) -> None
+    
+    @type graph: GraphIncidenceSet
+    @param graph: graph instance, as left by __test.    
+    """
+    print "### iPATH TEST DATA STRUCTURE"
+    print "### Data Type: Graph ({})".format(str(graph.__class__.__bases__[0].__name__))
+    print "### Implementation: {} (snapshot)".format(str(graph.__class__.__name__))
+    
+    print "\n*** SNAPSHOT ***\n"
+    snapshot = graph.snapshot()
+    print "snapshot(): {} nodes, {} arcs\n".format(str(snapshot.get_num_nodes()), str(snapshot.get_num_arcs()))
+    
+    print "\n*** CHANGES AFTER SNAPSHOT ***\n"
+    print "remove_node(0)"
+    graph.remove_node(0)
+    print "add_node(10)"
+    graph.add_node(10)
+    print "add_arc(10, 1, 22)"
+    graph.add_arc(10, 1, 22)
+    print "set_arc_status(1, 2, 'visited')"
+    graph.set_arc_status(1, 2, "visited")
+    print "nodes copied on write: {}\n".format(str(sorted(snapshot._saved.keys())))
+    
+    print "\n*** GRAPH/SNAPSHOT ***\n"
+    for i in (0, 1, 10):
+        print "graph incident arcs of {}: {}".format(str(i), str(sorted(graph.get_incident_arcs(i), key = lambda arc: arc._head)))
+        print "snapshot incident arcs of {}: {}\n".format(str(i), str(sorted(snapshot.get_incident_arcs(i), key = lambda arc: arc._head)))
+    print "graph bfs(1): {}".format(str([node._id for node in graph.bfs(1)]))
+    print "snapshot bfs(1): {}\n".format(str([node._id for node in snapshot.bfs(1)]))
+    
+    print "\n*** READ-ONLY ***\n"
+    try:
+        snapshot.add_node(11)
+    except FrozenGraphError as err:
+        print "{}\n".format(err.message)
+        
+    print "\n### END OF TEST ###\n"
+    
+def __test(graph): 
+    """
+    Graph Test.
+    
+    __test(graph) -> None
+    
+    @type graph: basegraph
+    @param graph: graph instance.    
+    """   
+    
+    if not isinstance(graph, basegraph):
+        raise TypeError("Expected type was Graph.")
+    
+    print "### iPATH TEST DATA STRUCTURE"
+    print "### Data Type: Graph ({})".format(str(graph.__class__.__bases__[0].__name__))
+    print "### Implementation: {}".format(str(graph.__class__.__name__))
+    
+    print "\n*** ADD NODE ***\n"    
+    for i in range(10):
+        print "add_node({})".format(str(i))   
+        graph.add_node(i) 
+    
+    print "\n*** ADD ARC ***\n"    
+    for i in range(10):
+        print "add_arc({}, {}, {})".format(str(i), str(i + 1), str(2 * (i + 1)))
+        graph.add_arc(i, i + 1, 2 * (i + 1))
+        print "add_arc({}, {}, {})".format(str(i), str(i + 2), str(2 * (i + 2)))
+        graph.add_arc(i, i + 2, 2 * (i + 2))
+        
+    print "\n*** GRAPH ***\n"    
     print "\n{}\n".format(str(graph))
     
     print "\n*** REMOVE NODE ***\n"    
@@ -789,6 +3549,9 @@ def __test(graph):
     print "numArcs: {}\n".format(str(graph.get_num_arcs()))      
     print "Arcs: {}\n".format(str(graph.get_arcs()))   
     
+    print "\n*** STATISTICS ***\n" 
+    print "{}\n".format(str(graph.get_statistics()))
+    
     print "\n*** SEARCH BFS ***\n"           
     for i in range(10):        
         print "bfs({})".format(str(i))
@@ -805,10 +3568,33 @@ def __test(graph):
             print "{}\n".format(str(n))
         print "\n"
         
+    print "\n*** LAZY SEARCH BFS/DFS ***\n"
+    print "iter_bfs(0, max_depth = 2): {}".format(str([(node._id, depth, parent_id) for node, depth, parent_id in graph.iter_bfs(0, max_depth = 2, details = True)]))
+    print "iter_dfs(0, max_depth = 2): {}".format(str([(node._id, depth, parent_id) for node, depth, parent_id in graph.iter_dfs(0, max_depth = 2, details = True)]))
+    print "iter_bfs(0) until 8: {}\n".format(str([node._id for node in graph.iter_bfs(0, visitor = lambda node, depth, parent_id: node._id == 8)]))
+    
+    print "\n*** NEIGHBORHOOD ***\n"
+    for k in (1, 2, 2, 3):
+        print "neighborhood(0, {}): {}".format(str(k), str(sorted(graph.neighborhood(0, k))))
+    print "add_arc(0, 9)"
+    graph.add_arc(0, 9)
+    print "neighborhood(0, 2): {}".format(str(sorted(graph.neighborhood(0, 2))))
+    print "{}\n".format(str(graph.get_neighborhood_cache()))
+        
     print "\n### END OF TEST ###\n"
 
 if __name__ == "__main__":    
     graph = GraphIncidenceList()
     __test(graph)   
+    __test_frozen(graph)
     graph = GraphIncidenceSet()
     __test(graph)   
+    __test_frozen(graph)
+    __test_snapshot(graph)
+    graph = GraphIncidenceMap()
+    __test(graph)   
+    __test_frozen(graph)
+    graph = DiGraph()
+    __test(graph)
+    __test_directed(graph)
+    __test_frozen(graph)
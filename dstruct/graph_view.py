@@ -0,0 +1,413 @@
+#Interface Import
+from model.base.basegraph import basegraph
+#Support Data-Structures Imports
+from model.graph import freeze, _iter_search
+from model.queue import QueueDeque
+from model.stack import StackArrayList
+#Exception Import
+from exception.exceptions import FrozenGraphError
+
+class GraphView(basegraph):
+    """
+    Read-only filtered view of a graph.
+
+    The view keeps the nodes of the graph whose id is in a given set and the
+    arcs between them accepted by a given predicate. Nothing is copied: every
+    query filters the graph on the fly, so a search costs only the region it
+    visits. The view reflects later changes of the graph, and views can be
+    stacked.
+    """
+
+    def __init__(self, graph, node_ids = None, arc_filter = None):
+        self._graph = graph
+        self._node_ids = node_ids
+        self._arc_filter = arc_filter
+
+    def add_node(self, element, node_id = None):
+        raise FrozenGraphError("add_node: graph view cannot be modified.")
+
+    def remove_node(self, node_id):
+        raise FrozenGraphError("remove_node: graph view cannot be modified.")
+
+    def add_arc(self, nodeA_id, nodeB_id, info = None):
+        raise FrozenGraphError("add_arc: graph view cannot be modified.")
+
+    def add_nodes_from(self, elements):
+        raise FrozenGraphError("add_nodes_from: graph view cannot be modified.")
+
+    def add_arcs_from(self, arcs, add_missing_nodes = False):
+        raise FrozenGraphError("add_arcs_from: graph view cannot be modified.")
+
+    def remove_arc(self, nodeA_id, nodeB_id):
+        raise FrozenGraphError("remove_arc: graph view cannot be modified.")
+
+    def set_arc_status(self, nodeA_id, nodeB_id, status):
+        raise FrozenGraphError("set_arc_status: graph view cannot be modified.")
+
+    def get_graph(self):
+        """
+        Returns the viewed graph.
+
+        get_graph() -> graph
+
+        @rtype: basegraph
+        @return: viewed graph.
+        """
+        return self._graph
+
+    def get_nodes(self):
+        """
+        Returns all nodes in graph
+        get_nodes() -> nodes_list
+
+        @rtype: list
+        @return: list of nodes in graph.
+        """
+        if self._node_ids is None: return self._graph.get_nodes()
+        graph = self._graph
+        return [graph.get_node_by_id(node_id) for node_id in self._node_ids if graph.is_node_in_graph(node_id)]
+
+    def get_arcs(self):
+        """
+        Returns all arcs in graph.
+
+        get_arcs() -> arcs_list
+
+        @rtype: list
+        @return: list of arcs in graph.
+        """
+        arcs = []
+        for node in self.get_nodes(): arcs.extend(self.get_incident_arcs(node._id))
+        return arcs
+
+    def get_num_nodes(self):
+        """
+        Returns the number of nodes in graph, counted by scanning the node set.
+
+        get_num_nodes() -> number_of_nodes
+
+        @rtype: integer
+        @return: number of nodes in graph.
+        """
+        if self._node_ids is None: return self._graph.get_num_nodes()
+        return len(self.get_nodes())
+
+    def get_num_arcs(self):
+        """
+        Returns the number of arcs in graph, counted by scanning the incident arcs.
+
+        get_num_arcs() -> number_of_arcs
+
+        @rtype: integer
+        @return: number of arcs in graph.
+        """
+        if self._node_ids is None and self._arc_filter is None: return self._graph.get_num_arcs()
+        if self.is_directed(): return len(self.get_arcs())
+        # An undirected arc is stored at both its ends but its status is set at
+        # one end only: an arc counts when either end is accepted.
+        forward = {}
+        backward = {}
+        for arc in self.get_arcs():
+            if arc._tail <= arc._head: forward[(arc._tail, arc._head)] = forward.get((arc._tail, arc._head), 0) + 1
+            else: backward[(arc._head, arc._tail)] = backward.get((arc._head, arc._tail), 0) + 1
+        num_arcs = sum(max(count, backward.get(pair, 0)) for pair, count in forward.iteritems())
+        return num_arcs + sum(count for pair, count in backward.iteritems() if pair not in forward)
+
+    def is_directed(self):
+        """
+        Returns True if the arcs of the viewed graph are directed, otherwise returns False.
+
+        is_directed() -> True/False
+
+        @rtype: boolean
+        @return: True if the arcs of the viewed graph are directed, otherwise False.
+        """
+        return self._graph.is_directed()
+
+    def is_node_in_graph(self, node_id):
+        return (self._node_ids is None or node_id in self._node_ids) and self._graph.is_node_in_graph(node_id)
+
+    def get_node_by_id(self, node_id):
+        """
+        Returns node in graph by id.
+
+        get_node_by_id(node_id) -> node
+
+        @type node_id: integer
+        @param node_id: id of the requested node in graph.
+
+        @rtype: node
+        @return: node corresponding to the given id.
+        """
+        if self._node_ids is not None and node_id not in self._node_ids: return None
+        return self._graph.get_node_by_id(node_id)
+
+    def get_incident_arcs(self, node_id):
+        """
+        Returns all incident arcs to the specified node.
+
+        get_incident_arcs(node_id) -> list
+
+        @type node_id: integer
+        @param node_id: id of node whos incident arcs have been requested.
+
+        @rtype: list
+        @return: all arcs that are incident to the node whose id has been specified.
+        """
+        if self._node_ids is not None and node_id not in self._node_ids: return []
+        node_ids = self._node_ids
+        arc_filter = self._arc_filter
+        return [arc for arc in self._graph.get_incident_arcs(node_id)
+                if (node_ids is None or arc._head in node_ids) and (arc_filter is None or arc_filter(arc))]
+
+    def get_in_arcs(self, node_id):
+        """
+        Returns all arcs entering the specified node of the viewed directed graph.
+
+        get_in_arcs(node_id) -> list
+
+        @type node_id: integer
+        @param node_id: id of node whos incoming arcs have been requested.
+
+        @rtype: list
+        @return: all arcs whose head is the node whose id has been specified.
+        """
+        if self._node_ids is not None and node_id not in self._node_ids: return []
+        node_ids = self._node_ids
+        arc_filter = self._arc_filter
+        return [arc for arc in self._graph.get_in_arcs(node_id)
+                if (node_ids is None or arc._tail in node_ids) and (arc_filter is None or arc_filter(arc))]
+
+    def are_adjacent(self, nodeA_id, nodeB_id):
+        """
+        Returns True if nodeA and nodeB are adjacent, otherwise returns False.
+
+        are_adjacent(nodeA_id, nodeB_id) -> True/False
+
+        @type nodeA_id: integer
+        @param nodeA_id: first node's id.
+        @type nodeB_id: integer
+        @param nodeB_id: second node's id.
+
+        @rtype: boolean
+        @return: True if nodeA and nodeB are adjacent, otherwise False.
+        """
+        if self._node_ids is not None and (nodeA_id not in self._node_ids or nodeB_id not in self._node_ids): return False
+        if self._arc_filter is None: return self._graph.are_adjacent(nodeA_id, nodeB_id)
+        for arc in self._graph.get_incident_arcs(nodeA_id):
+            if arc._head == nodeB_id and self._arc_filter(arc): return True
+        return False
+
+    def dfs(self, root_node_id):
+        """
+        Returns the LIFO path-as-list from graph's root to all other nodes in graph.
+
+        dfs(root_node_id) -> path
+
+        @type root_node_id: integer
+        @param root_node_id: graph's root's id.
+
+        @rtype: list
+        @return: LIFO path from graph's root to all other nodes in graph.
+        """
+        if not self.is_node_in_graph(root_node_id): return []
+        visited = set([root_node_id])
+        L = []
+        s = StackArrayList()
+        s.push(root_node_id)
+        while not s.is_empty():
+            curr_node_id = s.pop()
+            L.append(self._graph.get_node_by_id(curr_node_id))
+            for head_id in self._heads(curr_node_id):
+                if head_id not in visited:
+                    visited.add(head_id)
+                    s.push(head_id)
+        return L
+
+    def bfs(self, root_node_id):
+        """
+        Returns the FIFO path-as-list from graph's root to all other nodes in graph.
+
+        bfs(root_node_id) -> path
+
+        @type root_node_id: integer
+        @param root_node_id: graph's root's id.
+
+        @rtype: list
+        @return: FIFO path from graph's root to all other nodes in graph.
+        """
+        if not self.is_node_in_graph(root_node_id): return []
+        visited = set([root_node_id])
+        L = []
+        q = QueueDeque()
+        q.enqueue(root_node_id)
+        while not q.is_empty():
+            curr_node_id = q.dequeue()
+            L.append(self._graph.get_node_by_id(curr_node_id))
+            for head_id in self._heads(curr_node_id):
+                if head_id not in visited:
+                    visited.add(head_id)
+                    q.enqueue(head_id)
+        return L
+
+    def iter_dfs(self, root_node_id, max_depth = None, visitor = None, details = False):
+        """
+        Lazily yields the nodes in LIFO order from graph's root.
+
+        iter_dfs(root_node_id, max_depth, visitor, details) -> nodes
+
+        @type root_node_id: integer
+        @param root_node_id: graph's root's id.
+        @type max_depth: integer
+        @param max_depth: nodes deeper than max_depth are not visited, None for no limit.
+        @type visitor: callable
+        @param visitor: visitor(node, depth, parent_id), the search stops after the node for which it returns True.
+        @type details: boolean
+        @param details: if True, (node, depth, parent_id) tuples are yielded instead of nodes.
+
+        @rtype: generator
+        @return: nodes reachable from graph's root, in LIFO order.
+        """
+        return _iter_search(self, self._heads, root_node_id, max_depth, visitor, details, True)
+
+    def iter_bfs(self, root_node_id, max_depth = None, visitor = None, details = False):
+        """
+        Lazily yields the nodes in FIFO order from graph's root.
+
+        iter_bfs(root_node_id, max_depth, visitor, details) -> nodes
+
+        @type root_node_id: integer
+        @param root_node_id: graph's root's id.
+        @type max_depth: integer
+        @param max_depth: nodes deeper than max_depth are not visited, None for no limit.
+        @type visitor: callable
+        @param visitor: visitor(node, depth, parent_id), the search stops after the node for which it returns True.
+        @type details: boolean
+        @param details: if True, (node, depth, parent_id) tuples are yielded instead of nodes.
+
+        @rtype: generator
+        @return: nodes reachable from graph's root, in FIFO order.
+        """
+        return _iter_search(self, self._heads, root_node_id, max_depth, visitor, details, False)
+
+    def _heads(self, node_id):
+        node_ids = self._node_ids
+        arc_filter = self._arc_filter
+        for arc in self._graph.get_incident_arcs(node_id):
+            if (node_ids is None or arc._head in node_ids) and (arc_filter is None or arc_filter(arc)): yield arc._head
+
+    def freeze(self):
+        """
+        Returns an immutable compressed-sparse-row copy of the view.
+
+        freeze() -> frozen_graph
+
+        @rtype: GraphCSR
+        @return: immutable array-backed copy of the view.
+        """
+        return freeze(self)
+
+    def __repr__(self):
+        s = "{"
+        for node in self.get_nodes():
+            s += "{} : {}\n".format(str(node), str(self.get_incident_arcs(node._id)))
+        s += "}"
+        return s
+
+    def __str__(self):
+        return self.__repr__()
+
+def induced_subgraph(graph, node_ids):
+    """
+    Returns the view of the subgraph induced by the specified nodes.
+
+    induced_subgraph(graph, node_ids) -> view
+
+    @type graph: basegraph
+    @param graph: graph to be viewed.
+    @type node_ids: iterable
+    @param node_ids: ids of the nodes of the subgraph; sets and frozensets are used as they are, without copying.
+
+    @rtype: GraphView
+    @return: view with the specified nodes and all the arcs of graph between them.
+    """
+    if not isinstance(node_ids, (set, frozenset)): node_ids = frozenset(node_ids)
+    return GraphView(graph, node_ids)
+
+def filtered_graph(graph, arc_filter = None, status = None):
+    """
+    Returns the view of the graph restricted to the accepted arcs.
+
+    filtered_graph(graph, arc_filter, status) -> view
+
+    @type graph: basegraph
+    @param graph: graph to be viewed.
+    @type arc_filter: callable
+    @param arc_filter: arc_filter(arc), True for the arcs to be kept, None to keep all arcs.
+    @type status: object
+    @param status: if not None, only arcs with this status are kept.
+
+    @rtype: GraphView
+    @return: view with all the nodes of graph and its accepted arcs.
+    """
+    if status is not None:
+        if arc_filter is None: arc_filter = lambda arc: arc.status == status
+        else: arc_filter = (lambda accept: lambda arc: arc.status == status and accept(arc))(arc_filter)
+    return GraphView(graph, None, arc_filter)
+
+def __test(graph):
+    """
+    Graph View Test.
+
+    __test(graph) -> None
+
+    @type graph: basegraph
+    @param graph: empty graph instance.
+    """
+    print "### iPATH TEST DATA STRUCTURE"
+    print "### Data Type: Graph ({})".format(str(graph.__class__.__bases__[0].__name__))
+    print "### Implementation: GraphView ({})".format(str(graph.__class__.__name__))
+
+    graph.add_nodes_from(range(10))
+    for i in range(10):
+        graph.add_arc(i, (i + 1) % 10, i)
+        graph.add_arc(i, (i + 3) % 10, i)
+    for i in range(0, 10, 2): graph.set_arc_status(i, (i + 1) % 10, "red")
+
+    print "\n*** INDUCED SUBGRAPH ***\n"
+    view = induced_subgraph(graph, range(5))
+    print "nodes: {}".format(str(sorted(node._id for node in view.get_nodes())))
+    print "numNodes: {}, numArcs: {}".format(str(view.get_num_nodes()), str(view.get_num_arcs()))
+    print "bfs(0): {}".format(str([node._id for node in view.bfs(0)]))
+    print "bfs(7): {}\n".format(str([node._id for node in view.bfs(7)]))
+
+    print "\n*** FILTERED GRAPH ***\n"
+    view = filtered_graph(graph, status = "red")
+    print "numArcs with status red: {}".format(str(view.get_num_arcs()))
+    print "dfs(0): {}".format(str([node._id for node in view.dfs(0)]))
+    view = filtered_graph(graph, lambda arc: arc.info < 5)
+    print "iter_bfs(0) with info < 5: {}\n".format(str([node._id for node in view.iter_bfs(0)]))
+
+    print "\n*** STACKED VIEWS ***\n"
+    view = induced_subgraph(filtered_graph(graph, lambda arc: arc.info < 5), range(6))
+    print "are_adjacent(0, 3): {}, are_adjacent(5, 8): {}".format(str(view.are_adjacent(0, 3)), str(view.are_adjacent(5, 8)))
+    print "{}\n".format(str(view.freeze()))
+
+    if view.is_directed():
+        print "\n*** IN ARCS ***\n"
+        print "in arcs of 3: {}\n".format(str(sorted(arc._tail for arc in view.get_in_arcs(3))))
+
+    print "\n*** READ-ONLY ***\n"
+    try:
+        view.add_arc(0, 1)
+    except FrozenGraphError as err:
+        print "{}\n".format(err.message)
+
+    print "\n### END OF TEST ###\n"
+
+if __name__ == "__main__":
+    from model.graph import GraphIncidenceList, GraphIncidenceSet, GraphIncidenceMap, DiGraph
+    __test(GraphIncidenceList())
+    __test(GraphIncidenceSet())
+    __test(GraphIncidenceMap())
+    __test(DiGraph())
@@ -3,7 +3,9 @@ from model.base.baselinkedlist import baselinkedlist
 
 class SimpleLinkedList(baselinkedlist):
     
-    class Record:
+    class Record(object):
+        
+        __slots__ = ("element", "_next")
     
         def __init__(self, element):
             self.element = element
@@ -202,6 +204,8 @@ class SimpleLinkedList(baselinkedlist):
 class DoubleLinkedList(SimpleLinkedList, baselinkedlist):
     
     class Record(SimpleLinkedList.Record):
+        
+        __slots__ = ("_prev",)
     
         def __init__(self, element):
             SimpleLinkedList.Record.__init__(self, element)
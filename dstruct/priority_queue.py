@@ -111,6 +111,15 @@ class DHeap(basepriorityqueue):
         if new_key < node._key: raise PriorityQueueInvalidKeyError()
         self._increase_key(node, new_key)
         
+    def clear(self):
+        """
+        Deletes all nodes from the Priority-Queue, keeping it ready for reuse.
+        
+        clear() -> None
+        """
+        del self._heap[:]
+        self._node_map.clear()
+        
     def _increase_key(self, node, new_key):        
         node._key = new_key
         self._move_down(node)
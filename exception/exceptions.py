@@ -45,4 +45,26 @@ class PriorityQueueInvalidKeyError(Exception):
     Exception raised when invalid decrease/increase key operation is executed.
     """
     def __init__(self, message):
-        self.message = message  
\ No newline at end of file
+        self.message = message  
+
+class FrozenGraphError(Exception): 
+    """
+    Exception raised when a frozen graph is modified.
+    """
+    def __init__(self, message):
+        self.message = message
+
+class GraphCycleError(Exception): 
+    """
+    Exception raised when an acyclic graph is expected and a cycle is found.
+    """
+    def __init__(self, message, cycle = None):
+        self.message = message
+        self.cycle = cycle
+
+class ConvergenceError(Exception): 
+    """
+    Exception raised when an iterative method does not converge within its iterations limit.
+    """
+    def __init__(self, message):
+        self.message = message
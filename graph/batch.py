@@ -0,0 +1,119 @@
+#Support Data-Structures Imports
+from model.graph import GraphCSR
+from functools import partial
+import multiprocessing
+
+_shared_graph = None
+
+def map_roots(graph, roots, task, processes = None, chunksize = 16):
+    """
+    Runs a traversal task from each one of the specified roots across a pool of worker processes.
+    
+    The graph is frozen once and handed to every worker when the pool starts:
+    with the fork start method the CSR arrays are shared copy-on-write and
+    never pickled, otherwise they are pickled once per worker. Only the roots
+    and the results travel per task.
+    
+    map_roots(graph, roots, task, processes, chunksize) -> results
+    
+    @type graph: basegraph
+    @param graph: graph to be traversed, frozen first if it is not a GraphCSR.
+    @type roots: iterable
+    @param roots: ids of the root nodes.
+    @type task: callable
+    @param task: module-level function task(graph, root_id) executed by the workers.
+    @type processes: integer
+    @param processes: number of worker processes, None for one per CPU, 1 to run in the calling process.
+    @type chunksize: integer
+    @param chunksize: number of roots sent to a worker at once.
+    
+    @rtype: generator
+    @return: (root_id, result) tuples, in completion order.
+    """
+    csr = graph if isinstance(graph, GraphCSR) else graph.freeze()
+    if processes == 1:
+        for root_id in roots: yield root_id, task(csr, root_id)
+        return
+    pool = multiprocessing.Pool(processes, _init_worker, (csr,))
+    try:
+        for result in pool.imap_unordered(partial(_run_task, task), roots, chunksize): yield result
+        pool.close()
+    finally:
+        pool.terminate()
+        pool.join()
+
+def batch_bfs(graph, roots, max_depth = None, processes = None, chunksize = 16):
+    """
+    Computes hop distances from each one of the specified roots across a pool of worker processes.
+    
+    batch_bfs(graph, roots, max_depth, processes, chunksize) -> results
+    
+    @type graph: basegraph
+    @param graph: graph to be traversed.
+    @type roots: iterable
+    @param roots: ids of the root nodes.
+    @type max_depth: integer
+    @param max_depth: nodes farther than max_depth are not reached, None for no limit.
+    @type processes: integer
+    @param processes: number of worker processes, None for one per CPU, 1 to run in the calling process.
+    @type chunksize: integer
+    @param chunksize: number of roots sent to a worker at once.
+    
+    @rtype: generator
+    @return: (root_id, {node_id: hops}) tuples, in completion order.
+    """
+    return map_roots(graph, roots, partial(hop_distances, max_depth = max_depth), processes, chunksize)
+
+def hop_distances(graph, root_id, max_depth = None):
+    """
+    Returns the hop distance of every node reachable from the specified root.
+    
+    hop_distances(graph, root_id, max_depth) -> distances
+    
+    @type graph: basegraph
+    @param graph: graph to be traversed.
+    @type root_id: integer
+    @param root_id: root node's id.
+    @type max_depth: integer
+    @param max_depth: nodes farther than max_depth are not reached, None for no limit.
+    
+    @rtype: dict
+    @return: node_id -> hops dictionary.
+    """
+    return dict((node._id, depth) for node, depth, parent_id in graph.iter_bfs(root_id, max_depth, details = True))
+
+def _init_worker(graph):
+    global _shared_graph
+    _shared_graph = graph
+
+def _run_task(task, root_id):
+    return root_id, task(_shared_graph, root_id)
+
+def __test(graph):
+    """
+    Batch Traversal Test.
+    
+    __test(graph) -> None
+    
+    @type graph: basegraph
+    @param graph: empty graph instance.    
+    """
+    print "### iPATH TEST ALGORITHM"
+    print "### Algorithm: Batch BFS ({})".format(str(graph.__class__.__name__))
+    
+    graph.add_nodes_from(range(10))
+    for i in range(10): graph.add_arc(i, (i + 1) % 10)
+    
+    print "\n*** BATCH BFS ***\n"
+    for root_id, distances in sorted(batch_bfs(graph, range(10), processes = 2, chunksize = 2)):
+        print "hops({}): {}".format(str(root_id), str([distances[node_id] for node_id in sorted(distances)]))
+    
+    print "\n*** BATCH BFS (MAX DEPTH 2) ***\n"
+    for root_id, distances in sorted(batch_bfs(graph, [0, 5], max_depth = 2, processes = 1)):
+        print "hops({}): {}".format(str(root_id), str(distances))
+    
+    print "\n### END OF TEST ###\n"
+
+if __name__ == "__main__":
+    from model.graph import GraphIncidenceList
+    __test(GraphIncidenceList())
@@ -0,0 +1,159 @@
+#Support Data-Structures Imports
+from model.graph import GraphCSR, freeze
+from model.queue import QueueDeque
+from model.stack import StackArrayList
+from array import array
+import multiprocessing
+import random
+#Exception Import
+from exception.exceptions import InvalidParameterError
+
+_shared_csr = None
+
+def betweenness_centrality(graph, normalized = True, samples = None, seed = None, processes = None, chunksize = 64):
+    """
+    Computes the betweenness centrality of the nodes of the specified graph with Brandes' algorithm.
+
+    Every source contributes a partial score, computed by a breadth-first
+    search counting shortest paths and a backward sweep accumulating the
+    dependencies, so sources are split in chunks across a pool of worker
+    processes and their partial scores summed. With samples, only that many
+    random sources are searched and the scores are scaled up accordingly,
+    which estimates the exact scores in a fraction of the time.
+
+    betweenness_centrality(graph, normalized, samples, seed, processes, chunksize) -> scores
+
+    @type graph: basegraph
+    @param graph: unweighted graph, frozen first if it is not a GraphCSR.
+    @type normalized: boolean
+    @param normalized: if True, scores are divided by the number of pairs of other nodes, otherwise they are the expected number of shortest paths crossing a node.
+    @type samples: integer
+    @param samples: number of sampled sources, None for the exact scores.
+    @type seed: object
+    @param seed: seed of the sampling of sources, None for a random one.
+    @type processes: integer
+    @param processes: number of worker processes, None for one per CPU, 1 to run in the calling process.
+    @type chunksize: integer
+    @param chunksize: number of sources sent to a worker at once.
+
+    @rtype: dict
+    @return: node_id -> betweenness centrality.
+
+    @raise InvalidParameterError: if samples is not between 1 and the number of nodes.
+    """
+    directed = graph.is_directed()
+    csr = graph if isinstance(graph, GraphCSR) else freeze(graph)
+    num_nodes = len(csr._ids)
+    if num_nodes == 0: return {}
+    if samples is None:
+        sources = range(num_nodes)
+    else:
+        if samples < 1 or samples > num_nodes: raise InvalidParameterError("betweenness_centrality: samples must be between 1 and {}.".format(str(num_nodes)))
+        sources = random.Random(seed).sample(xrange(num_nodes), samples)
+    if processes == 1:
+        scores = brandes_scores(csr._offsets, csr._targets, sources)
+    else:
+        chunks = [sources[i:i + chunksize] for i in xrange(0, len(sources), chunksize)]
+        scores = array("d", [0.0]) * num_nodes
+        pool = multiprocessing.Pool(processes, _init_worker, ((csr._offsets, csr._targets),))
+        try:
+            for partial_scores in pool.imap_unordered(_run_chunk, chunks):
+                for i in xrange(num_nodes): scores[i] += partial_scores[i]
+            pool.close()
+        finally:
+            pool.terminate()
+            pool.join()
+    scale = float(num_nodes) / len(sources)
+    if normalized:
+        if num_nodes > 2: scale /= (num_nodes - 1) * (num_nodes - 2)
+    elif not directed:
+        # Each path of an undirected graph is found from both its ends.
+        scale /= 2
+    return dict((csr._ids[i], scores[i] * scale) for i in xrange(num_nodes))
+
+def brandes_scores(offsets, targets, sources):
+    """
+    Computes the partial betweenness scores of the specified sources on CSR arrays, indexed by dense node index.
+
+    brandes_scores(offsets, targets, sources) -> scores
+
+    @type offsets: sequence
+    @param offsets: CSR row offsets, one more than the number of nodes.
+    @type targets: sequence
+    @param targets: CSR target indices.
+    @type sources: iterable
+    @param sources: dense indices of the source nodes.
+
+    @rtype: array
+    @return: sum over the sources of the dependency of each node, indexed by dense index.
+    """
+    num_nodes = len(offsets) - 1
+    scores = array("d", [0.0]) * num_nodes
+    for source in sources:
+        distance = [-1] * num_nodes
+        paths = [0] * num_nodes
+        distance[source] = 0
+        paths[source] = 1
+        order = StackArrayList()
+        q = QueueDeque()
+        q.enqueue(source)
+        while not q.is_empty():
+            node = q.dequeue()
+            order.push(node)
+            for k in xrange(offsets[node], offsets[node + 1]):
+                head = targets[k]
+                if distance[head] < 0:
+                    distance[head] = distance[node] + 1
+                    q.enqueue(head)
+                if distance[head] == distance[node] + 1: paths[head] += paths[node]
+        # Nodes are popped farthest first, so the dependency of every node is
+        # complete before it is passed back to the nodes one hop closer.
+        dependency = [0.0] * num_nodes
+        while not order.is_empty():
+            node = order.pop()
+            for k in xrange(offsets[node], offsets[node + 1]):
+                head = targets[k]
+                if distance[head] == distance[node] + 1:
+                    dependency[node] += float(paths[node]) / paths[head] * (1.0 + dependency[head])
+            if node != source: scores[node] += dependency[node]
+    return scores
+
+def _init_worker(arrays):
+    global _shared_csr
+    _shared_csr = arrays
+
+def _run_chunk(sources):
+    offsets, targets = _shared_csr
+    return brandes_scores(offsets, targets, sources)
+
+def __test(graph):
+    """
+    Betweenness Centrality Test.
+
+    __test(graph) -> None
+
+    @type graph: basegraph
+    @param graph: empty graph instance.
+    """
+    print "### iPATH TEST ALGORITHM"
+    print "### Algorithm: Brandes Betweenness Centrality ({})".format(str(graph.__class__.__name__))
+
+    graph.add_nodes_from(range(8))
+    graph.add_arcs_from([(0, 1), (1, 2), (2, 0), (2, 3), (3, 4), (4, 5), (5, 6), (6, 4), (6, 7)])
+
+    print "\n*** EXACT ***\n"
+    scores = betweenness_centrality(graph, processes = 1)
+    print "{}".format(str(dict((node_id, round(score, 4)) for node_id, score in scores.iteritems())))
+    scores = betweenness_centrality(graph, normalized = False, processes = 2, chunksize = 2)
+    print "not normalized, 2 processes: {}\n".format(str(dict((node_id, round(score, 4)) for node_id, score in scores.iteritems())))
+
+    print "\n*** SAMPLED ***\n"
+    scores = betweenness_centrality(graph, samples = 4, seed = 0, processes = 1)
+    print "4 sources: {}\n".format(str(dict((node_id, round(score, 4)) for node_id, score in scores.iteritems())))
+
+    print "\n### END OF TEST ###\n"
+
+if __name__ == "__main__":
+    from model.graph import GraphIncidenceSet, DiGraph
+    __test(GraphIncidenceSet())
+    __test(DiGraph())
@@ -0,0 +1,205 @@
+#Support Data-Structures Imports
+from model.graph import GraphCSR, freeze
+from graph.frontier import as_numpy
+#Exception Import
+from exception.exceptions import UnsupportedAlgorithmError, InvalidParameterError, ConvergenceError
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+def pagerank(graph, alpha = 0.85, personalization = None, dangling = None, weighted = False, tolerance = 1e-6, max_iterations = 100):
+    """
+    Computes the PageRank of the nodes of the specified graph by power iteration on its CSR arrays.
+
+    The graph is frozen once; each iteration then spreads the scores along all
+    the arcs with a few vectorized operations. The rank of dangling nodes,
+    which have no outgoing arcs, is redistributed according to the dangling
+    distribution.
+
+    pagerank(graph, alpha, personalization, dangling, weighted, tolerance, max_iterations) -> scores
+
+    @type graph: basegraph
+    @param graph: graph to be ranked, frozen first if it is not a GraphCSR (undirected arcs are followed both ways).
+    @type alpha: float
+    @param alpha: damping factor, the probability of following an arc rather than teleporting.
+    @type personalization: dict
+    @param personalization: node_id -> non-negative teleport weight (missing nodes weigh 0), None for uniform teleports.
+    @type dangling: dict
+    @param dangling: node_id -> non-negative weight of the redistribution of dangling rank, None to follow personalization.
+    @type weighted: boolean
+    @param weighted: if True, arcs are followed in proportion to their numeric info, otherwise uniformly.
+    @type tolerance: float
+    @param tolerance: iteration stops when the L1 change of the scores is below number of nodes * tolerance.
+    @type max_iterations: integer
+    @param max_iterations: maximum number of iterations.
+
+    @rtype: dict
+    @return: node_id -> score, the scores summing to 1.
+
+    @raise ConvergenceError: if the scores do not converge within max_iterations.
+    """
+    if np is None: raise UnsupportedAlgorithmError("pagerank: numpy is required.")
+    csr = graph if isinstance(graph, GraphCSR) else freeze(graph)
+    ids = as_numpy(csr._ids)
+    if len(ids) == 0: return {}
+    offsets = as_numpy(csr._offsets)
+    targets = as_numpy(csr._targets)
+    weights = _weights(csr, weighted)
+    teleport = _distribution(csr, personalization, "personalization")
+    redistribution = teleport if dangling is None else _distribution(csr, dangling, "dangling")
+    scores = power_pagerank(offsets, targets, weights, alpha, teleport, redistribution, tolerance, max_iterations)
+    return dict(zip(ids.tolist(), scores.tolist()))
+
+def eigenvector_centrality(graph, weighted = False, tolerance = 1e-6, max_iterations = 100):
+    """
+    Computes the eigenvector centrality of the nodes of the specified graph by power iteration on its CSR arrays.
+
+    eigenvector_centrality(graph, weighted, tolerance, max_iterations) -> scores
+
+    @type graph: basegraph
+    @param graph: graph to be ranked, frozen first if it is not a GraphCSR; on directed graphs a node's score comes from its predecessors.
+    @type weighted: boolean
+    @param weighted: if True, arcs count with their numeric info, otherwise 1.
+    @type tolerance: float
+    @param tolerance: iteration stops when the L1 change of the scores is below number of nodes * tolerance.
+    @type max_iterations: integer
+    @param max_iterations: maximum number of iterations.
+
+    @rtype: dict
+    @return: node_id -> score, the scores having unit euclidean norm.
+
+    @raise ConvergenceError: if the scores do not converge within max_iterations.
+    """
+    if np is None: raise UnsupportedAlgorithmError("eigenvector_centrality: numpy is required.")
+    csr = graph if isinstance(graph, GraphCSR) else freeze(graph)
+    ids = as_numpy(csr._ids)
+    if len(ids) == 0: return {}
+    scores = power_eigenvector(as_numpy(csr._offsets), as_numpy(csr._targets), _weights(csr, weighted), tolerance, max_iterations)
+    return dict(zip(ids.tolist(), scores.tolist()))
+
+def power_pagerank(offsets, targets, weights, alpha, teleport, redistribution, tolerance, max_iterations):
+    """
+    Computes PageRank on CSR arrays, indexed by dense node index.
+
+    power_pagerank(offsets, targets, weights, alpha, teleport, redistribution, tolerance, max_iterations) -> scores
+
+    @type offsets: numpy.ndarray
+    @param offsets: CSR row offsets, one more than the number of nodes.
+    @type targets: numpy.ndarray
+    @param targets: CSR target indices.
+    @type weights: numpy.ndarray
+    @param weights: arc weights, None for unweighted arcs.
+    @type alpha: float
+    @param alpha: damping factor.
+    @type teleport: numpy.ndarray
+    @param teleport: teleport distribution, summing to 1.
+    @type redistribution: numpy.ndarray
+    @param redistribution: distribution of the rank of dangling nodes, summing to 1.
+    @type tolerance: float
+    @param tolerance: iteration stops when the L1 change of the scores is below number of nodes * tolerance.
+    @type max_iterations: integer
+    @param max_iterations: maximum number of iterations.
+
+    @rtype: numpy.ndarray
+    @return: scores, summing to 1.
+    """
+    num_nodes = len(offsets) - 1
+    sources = np.repeat(np.arange(num_nodes), np.diff(offsets))
+    if weights is None: weights = np.ones(len(targets))
+    out_weights = np.bincount(sources, weights = weights, minlength = num_nodes)
+    dangling = out_weights == 0
+    # Share of its rank that each node sends along each one of its arcs.
+    shares = weights / np.where(dangling, 1.0, out_weights)[sources]
+    scores = np.full(num_nodes, 1.0 / num_nodes)
+    for i in xrange(max_iterations):
+        previous = scores
+        scores = np.bincount(targets, weights = previous[sources] * shares, minlength = num_nodes)
+        scores = alpha * (scores + previous[dangling].sum() * redistribution) + (1.0 - alpha) * teleport
+        if np.abs(scores - previous).sum() < num_nodes * tolerance: return scores
+    raise ConvergenceError("pagerank: no convergence in {} iterations.".format(str(max_iterations)))
+
+def power_eigenvector(offsets, targets, weights, tolerance, max_iterations):
+    """
+    Computes the eigenvector centrality on CSR arrays, indexed by dense node index.
+
+    The iteration multiplies by the adjacency matrix plus the identity, which
+    has the same leading eigenvector but converges on bipartite graphs too.
+
+    power_eigenvector(offsets, targets, weights, tolerance, max_iterations) -> scores
+
+    @type offsets: numpy.ndarray
+    @param offsets: CSR row offsets, one more than the number of nodes.
+    @type targets: numpy.ndarray
+    @param targets: CSR target indices.
+    @type weights: numpy.ndarray
+    @param weights: arc weights, None for unweighted arcs.
+    @type tolerance: float
+    @param tolerance: iteration stops when the L1 change of the scores is below number of nodes * tolerance.
+    @type max_iterations: integer
+    @param max_iterations: maximum number of iterations.
+
+    @rtype: numpy.ndarray
+    @return: scores, with unit euclidean norm.
+    """
+    num_nodes = len(offsets) - 1
+    sources = np.repeat(np.arange(num_nodes), np.diff(offsets))
+    if weights is None: weights = np.ones(len(targets))
+    scores = np.full(num_nodes, 1.0 / num_nodes)
+    for i in xrange(max_iterations):
+        previous = scores
+        scores = previous + np.bincount(targets, weights = previous[sources] * weights, minlength = num_nodes)
+        norm = np.sqrt(np.dot(scores, scores))
+        if norm == 0: return scores
+        scores = scores / norm
+        if np.abs(scores - previous).sum() < num_nodes * tolerance: return scores
+    raise ConvergenceError("eigenvector_centrality: no convergence in {} iterations.".format(str(max_iterations)))
+
+def _weights(csr, weighted):
+    if not weighted: return None
+    weights = np.asarray(csr._info, dtype = np.float64)
+    if (weights < 0).any(): raise InvalidParameterError("centrality: negative arc weight.")
+    return weights
+
+def _distribution(csr, weights, name):
+    num_nodes = len(csr._ids)
+    if weights is None: return np.full(num_nodes, 1.0 / num_nodes)
+    distribution = np.zeros(num_nodes)
+    for node_id, weight in weights.iteritems():
+        if weight < 0: raise InvalidParameterError("pagerank: negative {} weight for node {}.".format(name, str(node_id)))
+        if node_id in csr._index: distribution[csr._index[node_id]] = weight
+    total = distribution.sum()
+    if total <= 0: raise InvalidParameterError("pagerank: {} weights sum to zero.".format(name))
+    return distribution / total
+
+def __test(graph):
+    """
+    Centrality Test.
+
+    __test(graph) -> None
+
+    @type graph: basegraph
+    @param graph: empty graph instance.
+    """
+    print "### iPATH TEST ALGORITHM"
+    print "### Algorithm: PageRank/Eigenvector Centrality ({})".format(str(graph.__class__.__name__))
+
+    graph.add_nodes_from(range(6))
+    graph.add_arcs_from([(0, 1, 1.0), (1, 2, 1.0), (2, 0, 1.0), (2, 3, 2.0), (3, 4, 1.0), (4, 2, 1.0)])
+
+    print "\n*** PAGERANK ***\n"
+    for name, scores in (("uniform", pagerank(graph)),
+                         ("weighted", pagerank(graph, weighted = True)),
+                         ("personalized on 0", pagerank(graph, personalization = {0: 1}))):
+        print "{}: {}".format(name, str(dict((node_id, round(score, 4)) for node_id, score in scores.iteritems())))
+
+    print "\n*** EIGENVECTOR CENTRALITY ***\n"
+    scores = eigenvector_centrality(graph)
+    print "{}\n".format(str(dict((node_id, round(score, 4)) for node_id, score in scores.iteritems())))
+
+    print "\n### END OF TEST ###\n"
+
+if __name__ == "__main__":
+    from model.graph import GraphIncidenceSet, DiGraph
+    __test(GraphIncidenceSet())
+    __test(DiGraph())
@@ -0,0 +1,223 @@
+#Support Data-Structures Imports
+from model.union_find import QuickUnionCompressed
+#Exception Import
+from exception.exceptions import InvalidParameterError
+
+def connected_components(graph):
+    """
+    Labels the connected components of the specified graph in a single sweep over its arcs.
+    
+    Every arc is merged from whichever end lists it, so arcs stored at one
+    end only, as in a DiGraph or a view filtering on a status set at one end,
+    still join their nodes; merging two nodes already joined costs a lookup.
+    
+    connected_components(graph) -> (labels, sizes)
+    
+    @type graph: basegraph
+    @param graph: graph to be labelled; arc directions are ignored, giving the weakly connected components of a directed graph.
+    
+    @rtype: tuple
+    @return: node_id -> component_id dictionary and list of component sizes, indexed by component_id.
+    """
+    union_find = QuickUnionCompressed()
+    sets = {}
+    for node in graph.get_nodes(): sets[node._id] = union_find.makeset(node._id)
+    for node_id in sets:
+        for arc in graph.get_incident_arcs(node_id):
+            root_A = union_find.findRoot(sets[arc._tail])
+            root_B = union_find.findRoot(sets[arc._head])
+            if root_A is not root_B: union_find.union(root_A, root_B)
+    return _label(union_find, sets)
+
+class IncrementalComponents:
+    """
+    Connected components of a graph, kept up to date while nodes and arcs are added through it.
+    
+    Union-find cannot split components: nodes and arcs must not be removed
+    from the wrapped graph while it is tracked.
+    """
+    
+    def __init__(self, graph):
+        self._graph = graph
+        self._union_find = QuickUnionCompressed()
+        self._sets = {}
+        self._num_components = 0
+        self._next_id = 0
+        for node in graph.get_nodes(): self._makeset(node._id)
+        for node_id in self._sets.keys():
+            for arc in graph.get_incident_arcs(node_id): self._union(arc._tail, arc._head)
+    
+    def add_node(self, element, node_id = None):
+        """
+        Adds a new node in graph, with the specified element, as a new component.
+        
+        add_node(element, node_id) -> node_id
+        
+        @type element: object
+        @param element: element to be assigned to the new node.
+        @type node_id: integer
+        @param node_id: id of the new node, None for one above every tracked id.
+        
+        @rtype: integer
+        @return: id of the new node.
+        
+        @raise InvalidParameterError: if the node is already in graph.
+        """
+        if node_id is None: node_id = self._next_id
+        if node_id in self._sets or self._graph.is_node_in_graph(node_id):
+            raise InvalidParameterError("add_node: node {} is already in graph.".format(str(node_id)))
+        self._graph.add_node(element, node_id)
+        self._makeset(node_id)
+        return node_id
+    
+    def add_arc(self, nodeA_id, nodeB_id, info = None):
+        """
+        Adds a new undirected arc in graph, merging the components of its end nodes.
+        
+        add_arc(nodeA_id, nodeB_id, info) -> None
+        
+        @type nodeA_id: integer
+        @param nodeA_id: id of tail node.
+        @type nodeB_id: integer
+        @param nodeB_id: id of head node.
+        @type info: object
+        @param info: element to be added as info to the new arc.
+        """
+        if nodeA_id not in self._sets or nodeB_id not in self._sets: return
+        self._graph.add_arc(nodeA_id, nodeB_id, info)
+        self._union(nodeA_id, nodeB_id)
+    
+    def find(self, node_id):
+        """
+        Returns the id of the representative node of the component of the specified node.
+        
+        find(node_id) -> representative_id
+        
+        @type node_id: integer
+        @param node_id: node's id.
+        
+        @rtype: integer
+        @return: id of the component's representative node.
+        """
+        return self._union_find.find(self._sets[node_id])
+    
+    def are_connected(self, nodeA_id, nodeB_id):
+        """
+        Returns True if nodeA and nodeB are in the same component, otherwise returns False.
+        
+        are_connected(nodeA_id, nodeB_id) -> True/False
+        
+        @type nodeA_id: integer
+        @param nodeA_id: first node's id.
+        @type nodeB_id: integer
+        @param nodeB_id: second node's id.
+        
+        @rtype: boolean
+        @return: True if nodeA and nodeB are connected, otherwise False.
+        """
+        return self.find(nodeA_id) == self.find(nodeB_id)
+    
+    def get_component_size(self, node_id):
+        """
+        Returns the number of nodes in the component of the specified node.
+        
+        get_component_size(node_id) -> size
+        
+        @type node_id: integer
+        @param node_id: node's id.
+        
+        @rtype: integer
+        @return: size of the node's component.
+        """
+        return self._union_find.findRoot(self._sets[node_id])._size
+    
+    def get_num_components(self):
+        """
+        Returns the number of connected components.
+        
+        get_num_components() -> number_of_components
+        
+        @rtype: integer
+        @return: number of connected components.
+        """
+        return self._num_components
+    
+    def get_labels(self):
+        """
+        Returns the compact labelling of the current components.
+        
+        get_labels() -> (labels, sizes)
+        
+        @rtype: tuple
+        @return: node_id -> component_id dictionary and list of component sizes, indexed by component_id.
+        """
+        return _label(self._union_find, self._sets)
+    
+    def _makeset(self, node_id):
+        self._sets[node_id] = self._union_find.makeset(node_id)
+        self._num_components += 1
+        if node_id >= self._next_id: self._next_id = node_id + 1
+    
+    def _union(self, nodeA_id, nodeB_id):
+        root_A = self._union_find.findRoot(self._sets[nodeA_id])
+        root_B = self._union_find.findRoot(self._sets[nodeB_id])
+        if root_A is root_B: return
+        self._union_find.union(root_A, root_B)
+        self._num_components -= 1
+
+def _label(union_find, sets):
+    labels = {}
+    sizes = []
+    root_labels = {}
+    for node_id, node in sets.iteritems():
+        root_id = union_find.findRoot(node).element
+        if root_id not in root_labels:
+            root_labels[root_id] = len(sizes)
+            sizes.append(0)
+        label = root_labels[root_id]
+        labels[node_id] = label
+        sizes[label] += 1
+    return labels, sizes
+
+def __test(graph):
+    """
+    Connected Components Test.
+    
+    __test(graph) -> None
+    
+    @type graph: basegraph
+    @param graph: empty graph instance.    
+    """
+    print "### iPATH TEST ALGORITHM"
+    print "### Algorithm: Connected Components ({})".format(str(graph.__class__.__name__))
+    
+    graph.add_nodes_from(range(10))
+    graph.add_arcs_from([(0, 1), (1, 2), (3, 4), (5, 6), (6, 7), (7, 5)])
+    
+    print "\n*** CONNECTED COMPONENTS ***\n"
+    labels, sizes = connected_components(graph)
+    print "labels: {}".format(str(labels))
+    print "sizes: {}\n".format(str(sizes))
+    
+    print "\n*** INCREMENTAL ***\n"
+    components = IncrementalComponents(graph)
+    print "components: {}".format(str(components.get_num_components()))
+    for nodeA_id, nodeB_id in ((2, 3), (8, 9), (4, 5), (0, 7)):
+        components.add_arc(nodeA_id, nodeB_id)
+        print "add_arc({}, {}): {} components, size({}) = {}".format(str(nodeA_id), str(nodeB_id), str(components.get_num_components()), str(nodeA_id), str(components.get_component_size(nodeA_id)))
+    node_id = components.add_node(10)
+    print "add_node(10): {} components, id {}".format(str(components.get_num_components()), str(node_id))
+    try:
+        components.add_node(0, 0)
+    except InvalidParameterError as err:
+        print err.message
+    print "labels: {}\n".format(str(components.get_labels()))
+    
+    print "\n### END OF TEST ###\n"
+
+if __name__ == "__main__":
+    from model.graph import GraphIncidenceList, GraphIncidenceSet, GraphIncidenceMap, DiGraph
+    __test(GraphIncidenceList())
+    __test(GraphIncidenceSet())
+    __test(GraphIncidenceMap())
+    __test(DiGraph())
@@ -0,0 +1,251 @@
+#Support Data-Structures Imports
+from array import array
+import struct
+import sys
+#Exception Import
+from exception.exceptions import InvalidSourceError
+
+BINARY_MAGIC = "PYME"
+BINARY_VERSION = 1
+BINARY_HEADER = struct.Struct("<4sBBxxQ")
+BINARY_WEIGHTED = 1
+CHUNK_SIZE = 1 << 16
+
+def read_edgelist(path, delimiter = None, info_type = None, comment = "#"):
+    """
+    Streams the arcs of a text edge-list file, one "nodeA nodeB [info]" arc per line.
+    
+    read_edgelist(path, delimiter, info_type, comment) -> arcs
+    
+    @type path: string
+    @param path: edge-list file path.
+    @type delimiter: string
+    @param delimiter: field delimiter (e.g. "," for CSV), None for any whitespace.
+    @type info_type: callable
+    @param info_type: converter applied to the third field, None to ignore it.
+    @type comment: string
+    @param comment: prefix of the lines to be skipped.
+    
+    @rtype: generator
+    @return: (nodeA_id, nodeB_id) or (nodeA_id, nodeB_id, info) tuples.
+    """
+    with open(path, "r") as f:
+        for line in f:
+            if line.startswith(comment): continue
+            fields = line.split(delimiter)
+            if len(fields) < 2: continue
+            if info_type is None or len(fields) < 3:
+                yield (int(fields[0]), int(fields[1]))
+            else:
+                yield (int(fields[0]), int(fields[1]), info_type(fields[2]))
+
+def write_edgelist(graph, path, delimiter = " "):
+    """
+    Writes every undirected arc of the specified graph once, as a text edge-list file.
+    
+    write_edgelist(graph, path, delimiter) -> None
+    
+    @type graph: basegraph
+    @param graph: graph to be written.
+    @type path: string
+    @param path: edge-list file path.
+    @type delimiter: string
+    @param delimiter: field delimiter.
+    """
+    with open(path, "w") as f:
+        for arc in _undirected_arcs(graph):
+            if arc.info is None:
+                f.write("{}{}{}\n".format(arc._tail, delimiter, arc._head))
+            else:
+                info = repr(arc.info) if isinstance(arc.info, float) else arc.info
+                f.write("{}{}{}{}{}\n".format(arc._tail, delimiter, arc._head, delimiter, info))
+
+def read_binary_edges(path):
+    """
+    Streams the arcs of a binary edge file.
+    
+    The file is a header (magic, version, flags, number of arcs) followed by the
+    int32 (nodeA_id, nodeB_id) pairs and, if weighted, by the float64 infos.
+    
+    read_binary_edges(path) -> arcs
+    
+    @type path: string
+    @param path: binary edge file path.
+    
+    @rtype: generator
+    @return: (nodeA_id, nodeB_id) or (nodeA_id, nodeB_id, info) tuples.
+    """
+    with open(path, "rb") as f:
+        num_arcs, weighted = _read_binary_header(f)
+        weights_file = None
+        if weighted:
+            weights_file = open(path, "rb")
+            weights_file.seek(BINARY_HEADER.size + 8 * num_arcs)
+        try:
+            remaining = num_arcs
+            while remaining > 0:
+                n = min(remaining, CHUNK_SIZE)
+                pairs = _read_array(f, "i", 2 * n)
+                if weighted:
+                    weights = _read_array(weights_file, "d", n)
+                    for k in xrange(n): yield (pairs[2 * k], pairs[2 * k + 1], weights[k])
+                else:
+                    for k in xrange(n): yield (pairs[2 * k], pairs[2 * k + 1])
+                remaining -= n
+        finally:
+            if weights_file is not None: weights_file.close()
+
+def write_binary_edges(graph, path, weighted = False):
+    """
+    Writes every undirected arc of the specified graph once, as a binary edge file.
+    
+    write_binary_edges(graph, path, weighted) -> None
+    
+    @type graph: basegraph
+    @param graph: graph to be written.
+    @type path: string
+    @param path: binary edge file path.
+    @type weighted: boolean
+    @param weighted: if True, arcs info are written as float64 weights.
+    """
+    pairs = array("i")
+    weights = array("d")
+    for arc in _undirected_arcs(graph):
+        pairs.append(arc._tail)
+        pairs.append(arc._head)
+        if weighted: weights.append(float(arc.info))
+    with open(path, "wb") as f:
+        f.write(BINARY_HEADER.pack(BINARY_MAGIC, BINARY_VERSION, BINARY_WEIGHTED if weighted else 0, len(pairs) / 2))
+        _write_array(f, pairs)
+        if weighted: _write_array(f, weights)
+
+def load_edgelist(graph, path, delimiter = None, info_type = None):
+    """
+    Adds to the specified graph all nodes and arcs of a text edge-list file.
+    
+    load_edgelist(graph, path, delimiter, info_type) -> graph
+    
+    @type graph: basegraph
+    @param graph: graph to be filled.
+    @type path: string
+    @param path: edge-list file path.
+    @type delimiter: string
+    @param delimiter: field delimiter (e.g. "," for CSV), None for any whitespace.
+    @type info_type: callable
+    @param info_type: converter applied to the third field, None to ignore it.
+    
+    @rtype: basegraph
+    @return: the filled graph.
+    """
+    graph.add_arcs_from(read_edgelist(path, delimiter, info_type), add_missing_nodes = True)
+    return graph
+
+def load_binary_edges(graph, path):
+    """
+    Adds to the specified graph all nodes and arcs of a binary edge file.
+    
+    load_binary_edges(graph, path) -> graph
+    
+    @type graph: basegraph
+    @param graph: graph to be filled.
+    @type path: string
+    @param path: binary edge file path.
+    
+    @rtype: basegraph
+    @return: the filled graph.
+    """
+    graph.add_arcs_from(read_binary_edges(path), add_missing_nodes = True)
+    return graph
+
+def _undirected_arcs(graph):
+    # An undirected self-loop is stored either once or, by GraphIncidenceList,
+    # as two records with the same info: a loop matching one already written
+    # at its node is taken as that one's second record and skipped.
+    loops = {}
+    directed = graph.is_directed()
+    for arc in graph.get_arcs():
+        if directed or arc._tail < arc._head:
+            yield arc
+        elif arc._tail == arc._head:
+            written = loops.setdefault(arc._tail, [])
+            if arc.info in written:
+                written.remove(arc.info)
+                continue
+            written.append(arc.info)
+            yield arc
+
+def _read_binary_header(f):
+    header = f.read(BINARY_HEADER.size)
+    if len(header) < BINARY_HEADER.size:
+        raise InvalidSourceError("read_binary_edges: truncated header.")
+    magic, version, flags, num_arcs = BINARY_HEADER.unpack(header)
+    if magic != BINARY_MAGIC:
+        raise InvalidSourceError("read_binary_edges: not a binary edge file.")
+    if version != BINARY_VERSION:
+        raise InvalidSourceError("read_binary_edges: unsupported version {}.".format(version))
+    return num_arcs, (flags & BINARY_WEIGHTED) != 0
+
+def _read_array(f, typecode, n):
+    a = array(typecode)
+    try:
+        a.fromfile(f, n)
+    except EOFError:
+        raise InvalidSourceError("read_binary_edges: truncated file.")
+    if sys.byteorder == "big": a.byteswap()
+    return a
+
+def _write_array(f, a):
+    if sys.byteorder == "big":
+        a = array(a.typecode, a)
+        a.byteswap()
+    a.tofile(f)
+
+def __test(graph_class):
+    """
+    Edge-List Test.
+    
+    __test(graph_class) -> None
+    
+    @type graph_class: class
+    @param graph_class: basegraph implementation to be loaded.    
+    """
+    import os
+    import tempfile
+    
+    print "### iPATH TEST EDGE LIST"
+    print "### Implementation: {}".format(str(graph_class.__name__))
+    
+    graph = graph_class()
+    graph.add_nodes_from(range(10))
+    graph.add_arcs_from((i, (i + 1) % 10, i / 10.0 + 0.2) for i in range(10))
+    graph.add_arc(0, 0, 10.0)
+    print "\n{}\n".format(str(graph))
+    
+    directory = tempfile.mkdtemp()
+    text_path = os.path.join(directory, "graph.csv")
+    binary_path = os.path.join(directory, "graph.bin")
+    
+    print "\n*** TEXT EDGE LIST ***\n"
+    write_edgelist(graph, text_path, ",")
+    loaded = load_edgelist(graph_class(), text_path, ",", float)
+    print "\n{}\n".format(str(loaded))
+    print "round trip: {} arcs -> {} arcs".format(str(graph.get_num_arcs()), str(loaded.get_num_arcs()))
+    print "weights kept: {}\n".format(str(sorted(arc.info for arc in graph.get_arcs()) == sorted(arc.info for arc in loaded.get_arcs())))
+    
+    print "\n*** BINARY EDGE FILE ***\n"
+    write_binary_edges(graph, binary_path, weighted = True)
+    loaded = load_binary_edges(graph_class(), binary_path)
+    print "\n{}\n".format(str(loaded))
+    print "round trip: {} arcs -> {} arcs\n".format(str(graph.get_num_arcs()), str(loaded.get_num_arcs()))
+    
+    os.remove(text_path)
+    os.remove(binary_path)
+    os.rmdir(directory)
+    
+    print "\n### END OF TEST ###\n"
+
+if __name__ == "__main__":
+    from model.graph import GraphIncidenceList, GraphIncidenceSet, GraphIncidenceMap
+    __test(GraphIncidenceList)
+    __test(GraphIncidenceSet)
+    __test(GraphIncidenceMap)
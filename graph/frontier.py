@@ -0,0 +1,138 @@
+#Support Data-Structures Imports
+from model.graph import GraphCSR
+#Exception Import
+from exception.exceptions import UnsupportedAlgorithmError
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+def bfs_distances(graph, sources, max_depth = None):
+    """
+    Computes hop distances from one or many sources with level-synchronous frontier expansions.
+    
+    Each level gathers the neighbours of the whole frontier from the CSR
+    arrays at once and keeps those not yet reached, so the per-node Python
+    loop of bfs is replaced by a few vectorized operations per level.
+    
+    bfs_distances(graph, sources, max_depth) -> distances
+    
+    @type graph: basegraph
+    @param graph: graph to be searched, frozen first if it is not a GraphCSR.
+    @type sources: iterable
+    @param sources: ids of the source nodes, all at distance 0.
+    @type max_depth: integer
+    @param max_depth: nodes farther than max_depth are not reached, None for no limit.
+    
+    @rtype: numpy.ndarray
+    @return: hop distance of each node indexed by node id, -1 for unreached nodes and unused ids.
+    """
+    if np is None: raise UnsupportedAlgorithmError("bfs_distances: numpy is required.")
+    csr = graph if isinstance(graph, GraphCSR) else graph.freeze()
+    ids = as_numpy(csr._ids)
+    roots = [csr._index[source_id] for source_id in sources if source_id in csr._index]
+    distances = frontier_bfs(as_numpy(csr._offsets), as_numpy(csr._targets), roots, max_depth)
+    by_id = np.full(int(ids.max()) + 1 if len(ids) else 0, -1, dtype = np.int32)
+    by_id[ids] = distances
+    return by_id
+
+def frontier_bfs(offsets, targets, roots, max_depth = None):
+    """
+    Computes hop distances on CSR arrays, from the specified dense node indices.
+    
+    frontier_bfs(offsets, targets, roots, max_depth) -> distances
+    
+    @type offsets: numpy.ndarray
+    @param offsets: CSR row offsets, one more than the number of nodes.
+    @type targets: numpy.ndarray
+    @param targets: CSR target indices.
+    @type roots: iterable
+    @param roots: dense indices of the source nodes.
+    @type max_depth: integer
+    @param max_depth: nodes farther than max_depth are not reached, None for no limit.
+    
+    @rtype: numpy.ndarray
+    @return: hop distance of each node indexed by dense index, -1 for unreached nodes.
+    """
+    distances = np.full(len(offsets) - 1, -1, dtype = np.int32)
+    frontier = np.unique(np.asarray(roots, dtype = np.int64))
+    distances[frontier] = 0
+    depth = 0
+    while frontier.size and (max_depth is None or depth < max_depth):
+        neighbours = gather(offsets, targets, frontier)
+        neighbours = np.unique(neighbours[distances[neighbours] < 0])
+        depth += 1
+        distances[neighbours] = depth
+        frontier = neighbours
+    return distances
+
+def gather(offsets, targets, rows):
+    """
+    Returns the concatenation of the CSR rows of the specified nodes.
+    
+    gather(offsets, targets, rows) -> neighbours
+    
+    @type offsets: numpy.ndarray
+    @param offsets: CSR row offsets.
+    @type targets: numpy.ndarray
+    @param targets: CSR target indices.
+    @type rows: numpy.ndarray
+    @param rows: dense indices of the nodes whose rows are gathered.
+    
+    @rtype: numpy.ndarray
+    @return: target indices of all the specified rows.
+    """
+    starts = offsets[rows]
+    counts = offsets[rows + 1] - starts
+    total = int(counts.sum())
+    if total == 0: return targets[:0]
+    # Position k of the output belongs to row r: its source index is
+    # starts[r] + (k - first output position of r).
+    shifts = np.repeat(starts - (np.cumsum(counts) - counts), counts)
+    return targets[shifts + np.arange(total)]
+
+def as_numpy(column):
+    """
+    Returns a NumPy view of a CSR column, without copying it.
+    
+    as_numpy(column) -> view
+    
+    @type column: array/numpy.ndarray
+    @param column: CSR column.
+    
+    @rtype: numpy.ndarray
+    @return: NumPy array sharing the column's memory.
+    """
+    if isinstance(column, np.ndarray): return column
+    return np.frombuffer(column, dtype = np.dtype(column.typecode))
+
+def __test(graph):
+    """
+    Frontier BFS Test.
+    
+    __test(graph) -> None
+    
+    @type graph: basegraph
+    @param graph: empty graph instance.    
+    """
+    print "### iPATH TEST ALGORITHM"
+    print "### Algorithm: Frontier BFS ({})".format(str(graph.__class__.__name__))
+    
+    graph.add_nodes_from(range(10))
+    for i in range(9): graph.add_arc(i, i + 1)
+    graph.remove_node(5)
+    
+    print "\n*** SINGLE SOURCE ***\n"
+    print "bfs_distances(0): {}".format(str(bfs_distances(graph, [0])))
+    print "bfs(0): {}\n".format(str([node._id for node in graph.bfs(0)]))
+    
+    print "\n*** MULTIPLE SOURCES ***\n"
+    print "bfs_distances(0, 9): {}".format(str(bfs_distances(graph, [0, 9])))
+    print "bfs_distances(0, 9, max_depth = 2): {}\n".format(str(bfs_distances(graph, [0, 9], 2)))
+    
+    print "\n### END OF TEST ###\n"
+
+if __name__ == "__main__":
+    from model.graph import GraphIncidenceList, GraphIncidenceMap
+    __test(GraphIncidenceList())
+    __test(GraphIncidenceMap())
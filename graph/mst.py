@@ -0,0 +1,165 @@
+#Support Data-Structures Imports
+from model.priority_queue import DHeap
+from model.union_find import QuickUnionCompressed
+from model.graph import GraphIncidenceMap
+#Algorithm Imports
+from sort.MergeSort import mergeSort
+from graph.shortest_path import arc_info
+
+def kruskal_mst(graph, weight = arc_info):
+    """
+    Computes a minimum spanning forest with Kruskal's algorithm.
+    
+    Arcs are sorted by weight with merge sort, and components are tracked with
+    a path-compressed, balanced union-find.
+    
+    kruskal_mst(graph, weight) -> arcs
+    
+    @type graph: basegraph
+    @param graph: undirected graph.
+    @type weight: callable
+    @param weight: weight(arc) returns the weight of the arc.
+    
+    @rtype: list
+    @return: arcs of the minimum spanning forest, one per undirected arc.
+    """
+    arcs = [arc for arc in graph.get_arcs() if arc._tail < arc._head]
+    entries = [(weight(arcs[k]), k) for k in xrange(len(arcs))]
+    mergeSort(entries)
+    union_find = QuickUnionCompressed()
+    sets = {}
+    for node in graph.get_nodes(): sets[node._id] = union_find.makeset(node._id)
+    mst = []
+    for arc_weight, k in entries:
+        arc = arcs[k]
+        root_A = union_find.findRoot(sets[arc._tail])
+        root_B = union_find.findRoot(sets[arc._head])
+        if root_A is root_B: continue
+        union_find.union(root_A, root_B)
+        mst.append(arc)
+    return mst
+
+def prim_mst(graph, weight = arc_info, lazy = False, deg = 4):
+    """
+    Computes a minimum spanning forest with Prim's algorithm on a d-ary heap.
+    
+    The eager variant keeps one heap entry per node, keyed by its cheapest
+    arc towards the tree, and lowers it with decrease_key. The lazy variant
+    pushes every arc leaving the tree and discards stale ones when popped.
+    
+    prim_mst(graph, weight, lazy, deg) -> arcs
+    
+    @type graph: basegraph
+    @param graph: undirected graph.
+    @type weight: callable
+    @param weight: weight(arc) returns the weight of the arc.
+    @type lazy: boolean
+    @param lazy: if True, the lazy variant is used, otherwise the eager one.
+    @type deg: integer
+    @param deg: degree of the d-ary heap.
+    
+    @rtype: list
+    @return: arcs of the minimum spanning forest, one per undirected arc.
+    """
+    grow = _grow_lazy if lazy else _grow_eager
+    in_tree = set()
+    mst = []
+    heap = DHeap(deg)
+    for node in graph.get_nodes():
+        if node._id not in in_tree: grow(graph, weight, node._id, in_tree, mst, heap)
+    return mst
+
+def build_forest(graph, arcs, graph_class = GraphIncidenceMap):
+    """
+    Builds a new graph with all nodes of the specified graph and only the specified arcs.
+    
+    build_forest(graph, arcs, graph_class) -> forest
+    
+    @type graph: basegraph
+    @param graph: original graph.
+    @type arcs: list
+    @param arcs: arcs to be added to the new graph (e.g. a minimum spanning forest).
+    @type graph_class: class
+    @param graph_class: basegraph implementation of the new graph.
+    
+    @rtype: basegraph
+    @return: graph with the nodes of the original one and the specified arcs.
+    """
+    forest = graph_class()
+    for node in graph.get_nodes(): forest.add_node(node.element, node._id)
+    forest.add_arcs_from((arc._tail, arc._head, arc.info) for arc in arcs)
+    return forest
+
+def _grow_eager(graph, weight, root_id, in_tree, mst, heap):
+    best_arcs = {root_id: None}
+    best_weights = {root_id: 0}
+    heap.insert(root_id, 0)
+    while not heap.is_empty():
+        node_id = heap.delete_min().element
+        in_tree.add(node_id)
+        if best_arcs[node_id] is not None: mst.append(best_arcs[node_id])
+        for arc in graph.get_incident_arcs(node_id):
+            head_id = arc._head
+            if head_id in in_tree: continue
+            arc_weight = weight(arc)
+            if head_id not in best_arcs:
+                heap.insert(head_id, arc_weight)
+            elif arc_weight < best_weights[head_id]:
+                heap.decrease_key(head_id, arc_weight)
+            else:
+                continue
+            best_arcs[head_id] = arc
+            best_weights[head_id] = arc_weight
+
+def _grow_lazy(graph, weight, root_id, in_tree, mst, heap):
+    pending = {}
+    next_entry = 0
+    node_id = root_id
+    while True:
+        in_tree.add(node_id)
+        for arc in graph.get_incident_arcs(node_id):
+            if arc._head in in_tree: continue
+            pending[next_entry] = arc
+            heap.insert(next_entry, weight(arc))
+            next_entry += 1
+        node_id = None
+        while not heap.is_empty():
+            arc = pending.pop(heap.delete_min().element)
+            if arc._head not in in_tree:
+                mst.append(arc)
+                node_id = arc._head
+                break
+        if node_id is None: return
+
+def __test(graph):
+    """
+    Minimum Spanning Tree Test.
+    
+    __test(graph) -> None
+    
+    @type graph: basegraph
+    @param graph: empty graph instance.    
+    """
+    print "### iPATH TEST ALGORITHM"
+    print "### Algorithm: Minimum Spanning Tree ({})".format(str(graph.__class__.__name__))
+    
+    graph.add_nodes_from(range(10))
+    for i in range(10):
+        graph.add_arc(i, (i + 1) % 10, (7 * i) % 10)
+        graph.add_arc(i, (i + 3) % 10, (3 * i) % 10)
+    
+    for name, mst in (("kruskal_mst", kruskal_mst(graph)), ("prim_mst (eager)", prim_mst(graph)), ("prim_mst (lazy)", prim_mst(graph, lazy = True))):
+        print "\n*** {} ***\n".format(name.upper())
+        print "weight: {}".format(str(sum(arc.info for arc in mst)))
+        print "arcs: {}\n".format(str(sorted((min(arc._tail, arc._head), max(arc._tail, arc._head)) for arc in mst)))
+    
+    print "\n*** FOREST ***\n"
+    print "{}\n".format(str(build_forest(graph, kruskal_mst(graph))))
+    
+    print "\n### END OF TEST ###\n"
+
+if __name__ == "__main__":
+    from model.graph import GraphIncidenceList, GraphIncidenceSet
+    __test(GraphIncidenceList())
+    __test(GraphIncidenceSet())
+    __test(GraphIncidenceMap())
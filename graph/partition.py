@@ -0,0 +1,437 @@
+#Support Data-Structures Imports
+from model.graph import GraphIncidenceMap, DiGraph
+from model.queue import QueueDeque
+from functools import partial
+import multiprocessing
+#Exception Import
+from exception.exceptions import InvalidParameterError
+
+_shared_shards = None
+
+class Partition:
+    """
+    Assignment of the nodes of a graph to shards, with its boundary and ghost tables.
+
+    The boundary of a shard holds its nodes with arcs to other shards, and the
+    ghosts of a shard are the nodes of other shards those arcs lead to, with
+    the shard that owns them.
+    """
+
+    def __init__(self, graph, labels, num_shards):
+        self._labels = labels
+        self._num_shards = num_shards
+        self._members = [[] for shard in xrange(num_shards)]
+        self._boundary = [set() for shard in xrange(num_shards)]
+        self._ghosts = [{} for shard in xrange(num_shards)]
+        self._num_arcs = 0
+        self._edge_cut = 0
+        for node_id, shard in labels.iteritems():
+            self._members[shard].append(node_id)
+            for arc in graph.get_incident_arcs(node_id):
+                head_shard = labels.get(arc._head)
+                if head_shard is None: continue
+                self._num_arcs += 1
+                if head_shard == shard: continue
+                self._edge_cut += 1
+                self._boundary[shard].add(node_id)
+                self._ghosts[shard][arc._head] = head_shard
+        if not graph.is_directed():
+            self._num_arcs /= 2
+            self._edge_cut /= 2
+
+    def get_num_shards(self):
+        """
+        Returns the number of shards.
+
+        get_num_shards() -> number_of_shards
+
+        @rtype: integer
+        @return: number of shards.
+        """
+        return self._num_shards
+
+    def get_labels(self):
+        """
+        Returns the shard of every node.
+
+        get_labels() -> labels
+
+        @rtype: dict
+        @return: node_id -> shard dictionary.
+        """
+        return self._labels
+
+    def get_shard(self, node_id):
+        """
+        Returns the shard owning the specified node.
+
+        get_shard(node_id) -> shard
+
+        @type node_id: integer
+        @param node_id: node's id.
+
+        @rtype: integer
+        @return: shard of the node, None if the node is not partitioned.
+        """
+        return self._labels.get(node_id)
+
+    def get_members(self, shard):
+        """
+        Returns the ids of the nodes of the specified shard.
+
+        get_members(shard) -> ids_list
+
+        @type shard: integer
+        @param shard: shard's index.
+
+        @rtype: list
+        @return: ids of the nodes owned by the shard.
+        """
+        return self._members[shard]
+
+    def get_boundary(self, shard):
+        """
+        Returns the ids of the nodes of the specified shard with arcs to other shards.
+
+        get_boundary(shard) -> ids_set
+
+        @type shard: integer
+        @param shard: shard's index.
+
+        @rtype: set
+        @return: ids of the boundary nodes of the shard.
+        """
+        return self._boundary[shard]
+
+    def get_ghosts(self, shard):
+        """
+        Returns the nodes of other shards reached by the arcs of the specified shard.
+
+        get_ghosts(shard) -> ghosts
+
+        @type shard: integer
+        @param shard: shard's index.
+
+        @rtype: dict
+        @return: ghost node_id -> owner shard dictionary.
+        """
+        return self._ghosts[shard]
+
+    def get_edge_cut(self):
+        """
+        Returns the number of arcs between different shards.
+
+        get_edge_cut() -> edge_cut
+
+        @rtype: integer
+        @return: number of arcs whose end nodes are in different shards.
+        """
+        return self._edge_cut
+
+    def get_balance(self):
+        """
+        Returns the ratio between the size of the largest shard and the average size.
+
+        get_balance() -> balance
+
+        @rtype: float
+        @return: 1.0 for a perfectly balanced partition, None if no node is partitioned.
+        """
+        if not self._labels: return None
+        return max(len(members) for members in self._members) * float(self._num_shards) / len(self._labels)
+
+    def get_report(self):
+        """
+        Returns a summary of the quality of the partition.
+
+        get_report() -> report
+
+        @rtype: dict
+        @return: number of shards, shard sizes, edge cut, cut ratio over all arcs, balance and number of ghost entries.
+        """
+        return {"shards": self._num_shards,
+                "sizes": [len(members) for members in self._members],
+                "edge_cut": self._edge_cut,
+                "cut_ratio": float(self._edge_cut) / self._num_arcs if self._num_arcs else 0.0,
+                "balance": self.get_balance(),
+                "ghosts": sum(len(ghosts) for ghosts in self._ghosts)}
+
+    def __repr__(self):
+        return "%(shards: {}, edge cut: {}, balance: {})".format(str(self._num_shards), str(self._edge_cut), str(self.get_balance()))
+
+    def __str__(self):
+        return self.__repr__()
+
+class Shard:
+    """
+    Subgraph of a shard: its nodes, the arcs leaving them and the ghost nodes those arcs reach.
+    """
+
+    def __init__(self, shard_id, graph, members, boundary, ghosts):
+        self._id = shard_id
+        self._graph = graph
+        self._members = members
+        self._boundary = boundary
+        self._ghosts = ghosts
+
+    def get_id(self):
+        return self._id
+
+    def get_graph(self):
+        return self._graph
+
+    def get_members(self):
+        return self._members
+
+    def get_boundary(self):
+        return self._boundary
+
+    def get_ghosts(self):
+        return self._ghosts
+
+    def is_ghost(self, node_id):
+        return node_id in self._ghosts
+
+    def __repr__(self):
+        return "%(shard: {}, members: {}, ghosts: {})".format(str(self._id), str(len(self._members)), str(len(self._ghosts)))
+
+    def __str__(self):
+        return self.__repr__()
+
+def partition_graph(graph, num_shards, imbalance = 0.05, rounds = 4):
+    """
+    Splits the specified graph into balanced shards with few arcs between them.
+
+    Shards are first grown as BFS regions of ceil(n / num_shards) nodes, then
+    refined by label propagation: each node moves to the shard holding most of
+    its neighbours, as long as no shard grows beyond (1 + imbalance) times the
+    average size or shrinks below (1 - imbalance) times it.
+
+    partition_graph(graph, num_shards, imbalance, rounds) -> partition
+
+    @type graph: basegraph
+    @param graph: graph to be partitioned.
+    @type num_shards: integer
+    @param num_shards: number of shards.
+    @type imbalance: float
+    @param imbalance: tolerated relative deviation of the shard sizes from the average.
+    @type rounds: integer
+    @param rounds: maximum number of label propagation rounds.
+
+    @rtype: Partition
+    @return: partition of the graph.
+    """
+    if num_shards < 1: raise InvalidParameterError("partition_graph: num_shards must be positive.")
+    ids = sorted(node._id for node in graph.get_nodes())
+    capacity = -(-len(ids) // num_shards)
+    labels = _grow_regions(graph, ids, capacity)
+    sizes = [0] * num_shards
+    for shard in labels.itervalues(): sizes[shard] += 1
+    average = float(len(ids)) / num_shards
+    max_size = max(capacity, int(average * (1 + imbalance)))
+    min_size = int(average * (1 - imbalance))
+    for i in xrange(rounds):
+        if _propagate(graph, ids, labels, sizes, min_size, max_size) == 0: break
+    return Partition(graph, labels, num_shards)
+
+def build_shards(graph, partition):
+    """
+    Builds the subgraph of every shard of the specified partition.
+
+    build_shards(graph, partition) -> shards
+
+    @type graph: basegraph
+    @param graph: partitioned graph.
+    @type partition: Partition
+    @param partition: partition of graph.
+
+    @rtype: list
+    @return: Shard of each shard index, whose graph is a DiGraph if graph is directed, a GraphIncidenceMap otherwise.
+    """
+    shards = []
+    for shard in xrange(partition.get_num_shards()):
+        members = partition.get_members(shard)
+        ghosts = partition.get_ghosts(shard)
+        subgraph = DiGraph() if graph.is_directed() else GraphIncidenceMap()
+        for node_id in members: subgraph.add_node(graph.get_node_by_id(node_id).element, node_id)
+        for node_id in ghosts: subgraph.add_node(graph.get_node_by_id(node_id).element, node_id)
+        subgraph.add_arcs_from((arc._tail, arc._head, arc.info) for node_id in members for arc in graph.get_incident_arcs(node_id))
+        shards.append(Shard(shard, subgraph, set(members), partition.get_boundary(shard), ghosts))
+    return shards
+
+def run_shards(graph, partition, step, states = None, max_supersteps = 100, processes = None):
+    """
+    Runs a bulk-synchronous computation on the shards of the specified partition across a pool of worker processes.
+
+    The shard subgraphs are handed to every worker once, when the pool starts.
+    In every superstep each shard runs step(shard, state, inbox), which returns
+    its new state and an outbox of messages addressed to nodes; the messages
+    are delivered to the shards owning those nodes at the next superstep. The
+    computation stops after a superstep which sends no message.
+
+    run_shards(graph, partition, step, states, max_supersteps, processes) -> (states, supersteps)
+
+    @type graph: basegraph
+    @param graph: partitioned graph.
+    @type partition: Partition
+    @param partition: partition of graph.
+    @type step: callable
+    @param step: module-level function step(shard, state, inbox) -> (state, outbox), where inbox and outbox are node_id -> messages_list dictionaries.
+    @type states: list
+    @param states: initial state of each shard, None for None states.
+    @type max_supersteps: integer
+    @param max_supersteps: maximum number of supersteps.
+    @type processes: integer
+    @param processes: number of worker processes, None for one per CPU, 1 to run in the calling process.
+
+    @rtype: tuple
+    @return: final state of each shard and number of supersteps run.
+    """
+    shards = build_shards(graph, partition)
+    states = [None] * len(shards) if states is None else list(states)
+    inboxes = [{} for shard in shards]
+    pool = None if processes == 1 else multiprocessing.Pool(processes, _init_worker, (shards,))
+    try:
+        superstep = 0
+        while superstep < max_supersteps:
+            superstep += 1
+            tasks = [(shard.get_id(), states[shard.get_id()], inboxes[shard.get_id()]) for shard in shards]
+            if pool is None: results = [step(shards[shard_id], state, inbox) for shard_id, state, inbox in tasks]
+            else: results = pool.map(partial(_run_step, step), tasks)
+            inboxes = [{} for shard in shards]
+            sent = False
+            for shard_id in xrange(len(shards)):
+                states[shard_id], outbox = results[shard_id]
+                for node_id, messages in outbox.iteritems():
+                    owner = partition.get_shard(node_id)
+                    if owner is None or not messages: continue
+                    inboxes[owner].setdefault(node_id, []).extend(messages)
+                    sent = True
+            if not sent: break
+        if pool is not None: pool.close()
+    finally:
+        if pool is not None:
+            pool.terminate()
+            pool.join()
+    return states, superstep
+
+def _grow_regions(graph, ids, capacity):
+    labels = {}
+    shard = 0
+    size = 0
+    q = QueueDeque()
+    for seed_id in ids:
+        if seed_id in labels: continue
+        labels[seed_id] = shard
+        size += 1
+        q.enqueue(seed_id)
+        while size < capacity and not q.is_empty():
+            for arc in graph.get_incident_arcs(q.dequeue()):
+                if arc._head in labels: continue
+                labels[arc._head] = shard
+                size += 1
+                q.enqueue(arc._head)
+                if size == capacity: break
+        if size == capacity:
+            shard += 1
+            size = 0
+            q = QueueDeque()
+    return labels
+
+def _propagate(graph, ids, labels, sizes, min_size, max_size):
+    moved = 0
+    for node_id in ids:
+        shard = labels[node_id]
+        if sizes[shard] <= min_size: continue
+        counts = {}
+        for arc in graph.get_incident_arcs(node_id):
+            head_shard = labels.get(arc._head)
+            if head_shard is not None: counts[head_shard] = counts.get(head_shard, 0) + 1
+        best = shard
+        best_count = counts.get(shard, 0)
+        for head_shard, count in counts.iteritems():
+            if count > best_count and sizes[head_shard] < max_size:
+                best = head_shard
+                best_count = count
+        if best == shard: continue
+        labels[node_id] = best
+        sizes[shard] -= 1
+        sizes[best] += 1
+        moved += 1
+    return moved
+
+def _init_worker(shards):
+    global _shared_shards
+    _shared_shards = shards
+
+def _run_step(step, task):
+    shard_id, state, inbox = task
+    return step(_shared_shards[shard_id], state, inbox)
+
+def _min_label_step(shard, labels, inbox):
+    # Connected components by minimum label propagation: labels settle inside
+    # the shard, then changed boundary labels are sent to the ghosts.
+    graph = shard.get_graph()
+    members = shard.get_members()
+    if labels is None:
+        labels = dict((node_id, node_id) for node_id in members)
+        changed = list(members)
+    else:
+        changed = []
+        for node_id, messages in inbox.iteritems():
+            if min(messages) < labels[node_id]:
+                labels[node_id] = min(messages)
+                changed.append(node_id)
+    updated = set(changed)
+    while changed:
+        node_id = changed.pop()
+        for arc in graph.get_incident_arcs(node_id):
+            head_id = arc._head
+            if head_id in members and labels[node_id] < labels[head_id]:
+                labels[head_id] = labels[node_id]
+                updated.add(head_id)
+                changed.append(head_id)
+    outbox = {}
+    for node_id in updated & shard.get_boundary():
+        for arc in graph.get_incident_arcs(node_id):
+            if shard.is_ghost(arc._head): outbox.setdefault(arc._head, []).append(labels[node_id])
+    return labels, outbox
+
+def __test(graph):
+    """
+    Graph Partitioning Test.
+
+    __test(graph) -> None
+
+    @type graph: basegraph
+    @param graph: empty graph instance.
+    """
+    print "### iPATH TEST ALGORITHM"
+    print "### Algorithm: Graph Partitioning ({})".format(str(graph.__class__.__name__))
+
+    graph.add_nodes_from(range(40))
+    for i in range(40):
+        if i % 10 != 9: graph.add_arc(i, i + 1)
+        if i % 10 < 5 and i + 10 < 40: graph.add_arc(i, i + 10)
+    graph.remove_arc(24, 34)
+    for i in range(20, 25): graph.remove_arc(i, i + 10)
+
+    print "\n*** PARTITION ***\n"
+    for num_shards in (2, 4):
+        partition = partition_graph(graph, num_shards)
+        print "{}: {}".format(str(partition), str(partition.get_report()))
+        for shard in range(num_shards):
+            print "shard {}: members {} ghosts {}".format(str(shard), str(sorted(partition.get_members(shard))), str(partition.get_ghosts(shard)))
+        print
+
+    print "\n*** RUN SHARDS (CONNECTED COMPONENTS) ***\n"
+    states, supersteps = run_shards(graph, partition, _min_label_step, processes = 2)
+    labels = {}
+    for state in states: labels.update(state)
+    print "supersteps: {}".format(str(supersteps))
+    print "components: {}\n".format(str(sorted(set(labels.values()))))
+
+    print "\n### END OF TEST ###\n"
+
+if __name__ == "__main__":
+    __test(GraphIncidenceMap())
@@ -0,0 +1,138 @@
+#Support Data-Structures Imports
+from model.stack import StackArrayList
+from model.graph import DiGraph
+from array import array
+
+def strongly_connected_components(graph):
+    """
+    Labels the strongly connected components of the specified graph with an iterative Tarjan search.
+
+    The search keeps its own call stack, so the depth of the graph is not
+    bounded by the interpreter's recursion limit, and visit indices and
+    lowlinks are stored in arrays indexed by node position. Components are
+    numbered in topological order of the condensation: every arc between two
+    components goes from a lower component id to a higher one.
+
+    strongly_connected_components(graph) -> (labels, sizes)
+
+    @type graph: basegraph
+    @param graph: directed graph (on an undirected graph the components are the connected ones).
+
+    @rtype: tuple
+    @return: node_id -> component_id dictionary and list of component sizes, indexed by component_id.
+    """
+    ids = [node._id for node in graph.get_nodes()]
+    num_nodes = len(ids)
+    position = dict((ids[i], i) for i in xrange(num_nodes))
+    index = array("l", [-1]) * num_nodes
+    lowlink = array("l", [0]) * num_nodes
+    component = array("l", [-1]) * num_nodes
+    on_stack = bytearray(num_nodes)
+    visited = StackArrayList()
+    calls = StackArrayList()
+    counter = 0
+    sizes = []
+    for root in xrange(num_nodes):
+        if index[root] != -1: continue
+        index[root] = lowlink[root] = counter
+        counter += 1
+        visited.push(root)
+        on_stack[root] = 1
+        calls.push((root, iter(graph.get_incident_arcs(ids[root]))))
+        while not calls.is_empty():
+            node, arcs = calls.top()
+            for arc in arcs:
+                head = position.get(arc._head)
+                if head is None: continue
+                if index[head] == -1:
+                    index[head] = lowlink[head] = counter
+                    counter += 1
+                    visited.push(head)
+                    on_stack[head] = 1
+                    calls.push((head, iter(graph.get_incident_arcs(ids[head]))))
+                    break
+                if on_stack[head] and index[head] < lowlink[node]: lowlink[node] = index[head]
+            else:
+                calls.pop()
+                if lowlink[node] == index[node]:
+                    size = 0
+                    member = -1
+                    while member != node:
+                        member = visited.pop()
+                        on_stack[member] = 0
+                        component[member] = len(sizes)
+                        size += 1
+                    sizes.append(size)
+                if not calls.is_empty():
+                    father = calls.top()[0]
+                    if lowlink[node] < lowlink[father]: lowlink[father] = lowlink[node]
+    last = len(sizes) - 1
+    labels = dict((ids[i], last - component[i]) for i in xrange(num_nodes))
+    sizes.reverse()
+    return labels, sizes
+
+def condensation(graph, labels = None):
+    """
+    Builds the condensation of the specified graph: the DAG of its strongly connected components.
+
+    condensation(graph, labels) -> dag
+
+    @type graph: basegraph
+    @param graph: directed graph.
+    @type labels: dict
+    @param labels: node_id -> component_id dictionary, as returned by strongly_connected_components, None to compute it.
+
+    @rtype: DiGraph
+    @return: graph with a node for each component, whose id is the component id and whose element is the list of ids of its members, and an arc between two components if any arc of graph joins them.
+    """
+    if labels is None: labels = strongly_connected_components(graph)[0]
+    members = [[] for i in xrange(len(set(labels.itervalues())))]
+    for node_id, label in labels.iteritems(): members[label].append(node_id)
+    dag = DiGraph()
+    dag.add_nodes_from(members)
+    dag.add_arcs_from(_crossing_arcs(graph, labels))
+    return dag
+
+def _crossing_arcs(graph, labels):
+    for node_id, label in labels.iteritems():
+        for arc in graph.get_incident_arcs(node_id):
+            head_label = labels.get(arc._head)
+            if head_label is not None and head_label != label: yield label, head_label
+
+def __test(graph):
+    """
+    Strongly Connected Components Test.
+
+    __test(graph) -> None
+
+    @type graph: basegraph
+    @param graph: empty graph instance.
+    """
+    print "### iPATH TEST ALGORITHM"
+    print "### Algorithm: Tarjan SCC ({})".format(str(graph.__class__.__name__))
+
+    graph.add_nodes_from(range(10))
+    graph.add_arcs_from([(0, 1), (1, 2), (2, 0), (2, 3), (3, 4), (4, 5), (5, 3), (6, 5), (6, 7), (7, 6), (8, 9)])
+
+    print "\n*** STRONGLY CONNECTED COMPONENTS ***\n"
+    labels, sizes = strongly_connected_components(graph)
+    print "labels: {}".format(str(labels))
+    print "sizes: {}\n".format(str(sizes))
+
+    print "\n*** CONDENSATION ***\n"
+    dag = condensation(graph, labels)
+    for node in sorted(dag.get_nodes(), key = lambda node: node._id):
+        print "{} {}: -> {}".format(str(node._id), str(node.element), str(sorted(dag.get_successors(node._id))))
+
+    print "\n*** DEEP CHAIN ***\n"
+    chain = DiGraph()
+    chain.add_nodes_from(xrange(100000))
+    chain.add_arcs_from((i, i + 1) for i in xrange(99999))
+    chain.add_arc(99999, 0)
+    labels, sizes = strongly_connected_components(chain)
+    print "chain of 100000 nodes closed in a cycle: sizes {}\n".format(str(sizes))
+
+    print "\n### END OF TEST ###\n"
+
+if __name__ == "__main__":
+    __test(DiGraph())
@@ -0,0 +1,323 @@
+#Support Data-Structures Imports
+from model.priority_queue import DHeap
+from model.tree import DictTree
+#Exception Import
+from exception.exceptions import InvalidParameterError
+
+def arc_info(arc):
+    """
+    Default arc weight: the arc's info.
+    
+    arc_info(arc) -> weight
+    
+    @type arc: Arc
+    @param arc: graph arc.
+    
+    @rtype: float
+    @return: arc's weight.
+    """
+    return arc.info
+
+def shortest_paths(graph, source_id, weight = arc_info, target_id = None, deg = 4):
+    """
+    Computes single-source shortest paths with Dijkstra's algorithm on an indexed d-ary heap.
+    
+    shortest_paths(graph, source_id, weight, target_id, deg) -> (distances, predecessors)
+    
+    @type graph: basegraph
+    @param graph: graph with non-negative arc weights.
+    @type source_id: integer
+    @param source_id: source node's id.
+    @type weight: callable
+    @param weight: weight(arc) returns the non-negative weight of the arc.
+    @type target_id: integer
+    @param target_id: if not None, the search stops as soon as the target node is settled.
+    @type deg: integer
+    @param deg: degree of the d-ary heap.
+    
+    @rtype: tuple
+    @return: distances and predecessors of the settled nodes, as dictionaries keyed by node id.
+    """
+    if not graph.is_node_in_graph(source_id): return {}, {}
+    distances = {}
+    predecessors = {}
+    tentative = {source_id: 0}
+    fathers = {source_id: None}
+    heap = DHeap(deg)
+    heap.insert(source_id, 0)
+    while not heap.is_empty():
+        min_node = heap.delete_min()
+        node_id = min_node.element
+        distance = min_node._key
+        distances[node_id] = distance
+        predecessors[node_id] = fathers[node_id]
+        if node_id == target_id: break
+        for arc in graph.get_incident_arcs(node_id):
+            head_id = arc._head
+            if head_id in distances: continue
+            arc_weight = weight(arc)
+            if arc_weight < 0:
+                raise InvalidParameterError("shortest_paths: negative weight on arc {}.".format(str(arc)))
+            new_distance = distance + arc_weight
+            if head_id not in tentative:
+                tentative[head_id] = new_distance
+                fathers[head_id] = node_id
+                heap.insert(head_id, new_distance)
+            elif new_distance < tentative[head_id]:
+                tentative[head_id] = new_distance
+                fathers[head_id] = node_id
+                heap.decrease_key(head_id, new_distance)
+    return distances, predecessors
+
+def get_path(predecessors, target_id):
+    """
+    Returns the path-as-list from the source to the specified target.
+    
+    get_path(predecessors, target_id) -> path
+    
+    @type predecessors: dict
+    @param predecessors: predecessor map computed by a shortest-path search.
+    @type target_id: integer
+    @param target_id: target node's id.
+    
+    @rtype: list
+    @return: node ids from the source to the target, empty if the target has not been reached.
+    """
+    if target_id not in predecessors: return []
+    path = []
+    node_id = target_id
+    while node_id is not None:
+        path.append(node_id)
+        node_id = predecessors[node_id]
+    return path[::-1]
+
+def shortest_path_tree(predecessors, source_id):
+    """
+    Builds the shortest-path tree described by the specified predecessor map.
+    
+    shortest_path_tree(predecessors, source_id) -> tree
+    
+    @type predecessors: dict
+    @param predecessors: predecessor map computed by a shortest-path search.
+    @type source_id: integer
+    @param source_id: source node's id, root of the tree.
+    
+    @rtype: DictTree
+    @return: shortest-path tree rooted at the source.
+    """
+    tree = DictTree(source_id)
+    inserted = set([source_id])
+    for node_id in predecessors:
+        branch = []
+        while node_id not in inserted:
+            branch.append(node_id)
+            node_id = predecessors[node_id]
+        for son_id in reversed(branch):
+            tree.insert(predecessors[son_id], son_id)
+            inserted.add(son_id)
+    return tree
+
+class PointToPointSearch:
+    """
+    Point-to-point shortest-path queries on a graph: bidirectional Dijkstra and A*.
+    
+    The search state (heaps, tentative distances, fathers) belongs to the
+    instance and is cleared at the beginning of each query, so that a long run
+    of queries does not reallocate it. An instance is not thread-safe.
+    
+    On a directed graph the backward search of the bidirectional Dijkstra
+    follows the arcs entering each node, from head to tail.
+    """
+    
+    def __init__(self, graph, weight = arc_info, deg = 4):
+        self._graph = graph
+        self._directed = graph.is_directed()
+        self._weight = weight
+        self._heaps = (DHeap(deg), DHeap(deg))
+        self._distances = ({}, {})
+        self._fathers = ({}, {})
+        self._settled = (set(), set())
+        self._estimates = {}
+        
+    def bidirectional_dijkstra(self, source_id, target_id):
+        """
+        Returns the shortest path between source and target, searching from both ends.
+        
+        bidirectional_dijkstra(source_id, target_id) -> (distance, path)
+        
+        @type source_id: integer
+        @param source_id: source node's id.
+        @type target_id: integer
+        @param target_id: target node's id.
+        
+        @rtype: tuple
+        @return: distance and path-as-list from source to target, (None, []) if target is unreachable.
+        """
+        graph = self._graph
+        if not graph.is_node_in_graph(source_id) or not graph.is_node_in_graph(target_id): return None, []
+        self._reset()
+        heaps = self._heaps
+        distances = self._distances
+        fathers = self._fathers
+        settled = self._settled
+        for side, root_id in ((0, source_id), (1, target_id)):
+            distances[side][root_id] = 0
+            fathers[side][root_id] = None
+            heaps[side].insert(root_id, 0)
+        best = 0 if source_id == target_id else None
+        meeting_id = source_id
+        while not heaps[0].is_empty() and not heaps[1].is_empty():
+            top_0 = heaps[0].find_min()._key
+            top_1 = heaps[1].find_min()._key
+            if best is not None and top_0 + top_1 >= best: break
+            side = 0 if top_0 <= top_1 else 1
+            other_distances = distances[1 - side]
+            min_node = heaps[side].delete_min()
+            node_id = min_node.element
+            settled[side].add(node_id)
+            for head_id in self._relax(side, node_id, min_node._key):
+                if head_id in other_distances:
+                    total = distances[side][head_id] + other_distances[head_id]
+                    if best is None or total < best:
+                        best = total
+                        meeting_id = head_id
+        if best is None: return None, []
+        path = get_path(fathers[0], meeting_id)
+        node_id = fathers[1][meeting_id]
+        while node_id is not None:
+            path.append(node_id)
+            node_id = fathers[1][node_id]
+        return best, path
+    
+    def astar(self, source_id, target_id, heuristic):
+        """
+        Returns the shortest path between source and target, with A* search.
+        
+        astar(source_id, target_id, heuristic) -> (distance, path)
+        
+        @type source_id: integer
+        @param source_id: source node's id.
+        @type target_id: integer
+        @param target_id: target node's id.
+        @type heuristic: callable
+        @param heuristic: heuristic(node, target_node) returns a consistent lower bound of the distance between the nodes, usually computed on their elements.
+        
+        @rtype: tuple
+        @return: distance and path-as-list from source to target, (None, []) if target is unreachable.
+        """
+        graph = self._graph
+        target = graph.get_node_by_id(target_id)
+        if not graph.is_node_in_graph(source_id) or target is None: return None, []
+        self._reset()
+        heap = self._heaps[0]
+        distances = self._distances[0]
+        fathers = self._fathers[0]
+        settled = self._settled[0]
+        estimates = self._estimates
+        distances[source_id] = 0
+        fathers[source_id] = None
+        heap.insert(source_id, heuristic(graph.get_node_by_id(source_id), target))
+        while not heap.is_empty():
+            node_id = heap.delete_min().element
+            if node_id == target_id: return distances[target_id], get_path(fathers, target_id)
+            settled.add(node_id)
+            distance = distances[node_id]
+            for arc in graph.get_incident_arcs(node_id):
+                head_id = arc._head
+                if head_id in settled: continue
+                new_distance = distance + self._arc_weight(arc)
+                if head_id in distances and new_distance >= distances[head_id]: continue
+                if head_id not in estimates: estimates[head_id] = heuristic(graph.get_node_by_id(head_id), target)
+                key = new_distance + estimates[head_id]
+                if head_id in distances: heap.decrease_key(head_id, key)
+                else: heap.insert(head_id, key)
+                distances[head_id] = new_distance
+                fathers[head_id] = node_id
+        return None, []
+    
+    def _relax(self, side, node_id, distance):
+        heap = self._heaps[side]
+        distances = self._distances[side]
+        fathers = self._fathers[side]
+        settled = self._settled[side]
+        backward = side == 1 and self._directed
+        arcs = self._graph.get_in_arcs(node_id) if backward else self._graph.get_incident_arcs(node_id)
+        for arc in arcs:
+            head_id = arc._tail if backward else arc._head
+            if head_id in settled: continue
+            new_distance = distance + self._arc_weight(arc)
+            if head_id not in distances:
+                heap.insert(head_id, new_distance)
+            elif new_distance < distances[head_id]:
+                heap.decrease_key(head_id, new_distance)
+            else:
+                continue
+            distances[head_id] = new_distance
+            fathers[head_id] = node_id
+            yield head_id
+    
+    def _arc_weight(self, arc):
+        arc_weight = self._weight(arc)
+        if arc_weight < 0:
+            raise InvalidParameterError("PointToPointSearch: negative weight on arc {}.".format(str(arc)))
+        return arc_weight
+    
+    def _reset(self):
+        for side in (0, 1):
+            self._heaps[side].clear()
+            self._distances[side].clear()
+            self._fathers[side].clear()
+            self._settled[side].clear()
+        self._estimates.clear()
+
+def __test(graph):
+    """
+    Shortest-Paths Test.
+    
+    __test(graph) -> None
+    
+    @type graph: basegraph
+    @param graph: empty graph instance.    
+    """
+    print "### iPATH TEST ALGORITHM"
+    print "### Algorithm: Dijkstra ({})".format(str(graph.__class__.__name__))
+    
+    graph.add_nodes_from(range(10))
+    for i in range(10):
+        graph.add_arc(i, (i + 1) % 10, 1)
+        graph.add_arc(i, (i + 3) % 10, 2)
+    
+    print "\n*** SHORTEST PATHS ***\n"
+    distances, predecessors = shortest_paths(graph, 0)
+    print "distances: {}".format(str(distances))
+    print "predecessors: {}\n".format(str(predecessors))
+    
+    print "\n*** SHORTEST PATH TREE ***\n"
+    print "{}\n".format(str(shortest_path_tree(predecessors, 0)))
+    
+    print "\n*** EARLY TERMINATION ***\n"
+    distances, predecessors = shortest_paths(graph, 0, target_id = 4)
+    print "path(0, 4): {} ({})".format(str(get_path(predecessors, 4)), str(distances[4]))
+    print "settled: {}\n".format(str(sorted(distances)))
+    
+    print "\n*** POINT TO POINT ***\n"
+    search = PointToPointSearch(graph)
+    for target_id in (4, 5, 7):
+        print "bidirectional_dijkstra(0, {}): {}".format(str(target_id), str(search.bidirectional_dijkstra(0, target_id)))
+        print "astar(0, {}): {}".format(str(target_id), str(search.astar(0, target_id, lambda node, target: 0)))
+    
+    print "\n*** FILTERED VIEW ***\n"
+    view = filtered_graph(graph, lambda arc: arc.info == 1)
+    distances, predecessors = shortest_paths(view, 0)
+    print "path(0, 9): {} ({})".format(str(get_path(predecessors, 9)), str(distances[9]))
+    print "bidirectional_dijkstra(0, 9): {}\n".format(str(PointToPointSearch(view).bidirectional_dijkstra(0, 9)))
+    
+    print "\n### END OF TEST ###\n"
+
+if __name__ == "__main__":
+    from model.graph import GraphIncidenceList, GraphIncidenceSet, GraphIncidenceMap, DiGraph
+    from model.graph_view import filtered_graph
+    __test(GraphIncidenceList())
+    __test(GraphIncidenceSet())
+    __test(GraphIncidenceMap())
+    __test(DiGraph())
@@ -0,0 +1,216 @@
+#Support Data-Structures Imports
+from model.graph import GraphCSR
+from array import array
+import cPickle as pickle
+import mmap
+import struct
+import sys
+#Exception Import
+from exception.exceptions import InvalidSourceError
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+MAGIC = "PYMG"
+VERSION = 2
+HEADER = struct.Struct("<4sHHIxxxxQQ")
+SECTION = struct.Struct("<QQ")
+SECTIONS = ("ids", "offsets", "targets", "info", "status", "elements", "node_status")
+ALIGNMENT = 8
+
+ENCODING_PICKLE = 0
+ENCODING_INT64 = 1
+ENCODING_FLOAT64 = 2
+
+FLAG_DIRECTED = 1
+
+def save_graph(graph, path):
+    """
+    Writes the specified graph in the binary graph format.
+    
+    The file is a header (magic, version, info encoding, flags, number of
+    nodes and of directed arcs), a table of (offset, length) sections, and the sections:
+    node ids, CSR offsets and targets as little-endian int64, arc infos as
+    int64/float64 when they are all numbers (pickled otherwise), and pickled
+    arc status, node elements and node status.
+    
+    save_graph(graph, path) -> None
+    
+    @type graph: basegraph
+    @param graph: graph to be saved, frozen first if it is not a GraphCSR.
+    @type path: string
+    @param path: graph file path.
+    """
+    csr = graph if isinstance(graph, GraphCSR) else graph.freeze()
+    info = list(csr._info)
+    encoding = _info_encoding(info)
+    if encoding == ENCODING_INT64: info_data = _int64_bytes(info)
+    elif encoding == ENCODING_FLOAT64: info_data = _float64_bytes(info)
+    else: info_data = pickle.dumps(info, pickle.HIGHEST_PROTOCOL)
+    sections = [_int64_bytes(csr._ids),
+                _int64_bytes(csr._offsets),
+                _int64_bytes(csr._targets),
+                info_data,
+                pickle.dumps(list(csr._status), pickle.HIGHEST_PROTOCOL),
+                pickle.dumps(list(csr._elements), pickle.HIGHEST_PROTOCOL),
+                pickle.dumps(list(csr._node_status), pickle.HIGHEST_PROTOCOL)]
+    position = _align(HEADER.size + SECTION.size * len(SECTIONS))
+    table = []
+    for data in sections:
+        table.append((position, len(data)))
+        position = _align(position + len(data))
+    with open(path, "wb") as f:
+        f.write(HEADER.pack(MAGIC, VERSION, encoding, FLAG_DIRECTED if csr.is_directed() else 0, len(csr._ids), len(csr._targets)))
+        for section in table: f.write(SECTION.pack(*section))
+        for (offset, length), data in zip(table, sections):
+            f.write("\0" * (offset - f.tell()))
+            f.write(data)
+
+def load_graph(path):
+    """
+    Opens a binary graph file as a frozen graph, through a read-only memory map.
+    
+    Nothing is parsed at load time: with NumPy the id and CSR columns are views
+    on the mapped file (otherwise they are copied as raw bytes), and the pickled
+    columns are only unpickled when first accessed.
+    
+    load_graph(path) -> graph
+    
+    @type path: string
+    @param path: graph file path.
+    
+    @rtype: GraphCSR
+    @return: frozen graph backed by the file.
+    """
+    with open(path, "rb") as f:
+        mapped = mmap.mmap(f.fileno(), 0, access = mmap.ACCESS_READ)
+    if len(mapped) < HEADER.size + SECTION.size * len(SECTIONS):
+        raise InvalidSourceError("load_graph: truncated header.")
+    magic, version, encoding, flags, num_nodes, num_arcs = HEADER.unpack_from(mapped, 0)
+    if magic != MAGIC:
+        raise InvalidSourceError("load_graph: not a graph file.")
+    if version != VERSION:
+        raise InvalidSourceError("load_graph: unsupported version {}.".format(version))
+    table = [SECTION.unpack_from(mapped, HEADER.size + SECTION.size * k) for k in range(len(SECTIONS))]
+    for offset, length in table:
+        if offset + length > len(mapped): raise InvalidSourceError("load_graph: truncated file.")
+    ids = _int64_column(mapped, table[0], num_nodes)
+    offsets = _int64_column(mapped, table[1], num_nodes + 1)
+    targets = _int64_column(mapped, table[2], num_arcs)
+    if encoding == ENCODING_INT64: info = _int64_column(mapped, table[3], num_arcs)
+    elif encoding == ENCODING_FLOAT64: info = _float64_column(mapped, table[3], num_arcs)
+    else: info = _PickledColumn(mapped, table[3])
+    return GraphCSR(ids,
+                    _PickledColumn(mapped, table[5]),
+                    _PickledColumn(mapped, table[6]),
+                    offsets,
+                    targets,
+                    info,
+                    _PickledColumn(mapped, table[4]),
+                    (flags & FLAG_DIRECTED) != 0)
+
+class _PickledColumn:
+    # Column unpickled from the mapped file on its first access.
+    
+    def __init__(self, mapped, section):
+        self._mapped = mapped
+        self._section = section
+        self._values = None
+    
+    def __getitem__(self, k):
+        return self._load()[k]
+    
+    def __len__(self):
+        return len(self._load())
+    
+    def __iter__(self):
+        return iter(self._load())
+    
+    def _load(self):
+        if self._values is None:
+            offset, length = self._section
+            self._values = pickle.loads(self._mapped[offset : offset + length])
+        return self._values
+
+def _info_encoding(info):
+    if all(type(value) in (int, long) for value in info): return ENCODING_INT64
+    if all(type(value) in (int, long, float) for value in info): return ENCODING_FLOAT64
+    return ENCODING_PICKLE
+
+def _align(position):
+    return (position + ALIGNMENT - 1) // ALIGNMENT * ALIGNMENT
+
+def _int64_bytes(column):
+    if np is not None: return np.asarray(column, dtype = "<i8").tostring()
+    if array("l").itemsize != 8: return struct.pack("<{}q".format(len(column)), *column)
+    return _little_endian_bytes(array("l", column))
+
+def _float64_bytes(column):
+    if np is not None: return np.asarray(column, dtype = "<f8").tostring()
+    return _little_endian_bytes(array("d", column))
+
+def _little_endian_bytes(column):
+    if sys.byteorder == "big": column.byteswap()
+    return column.tostring()
+
+def _int64_column(mapped, section, count):
+    offset, length = section
+    if np is not None: return np.frombuffer(mapped, dtype = "<i8", count = count, offset = offset)
+    column = array("l")
+    if column.itemsize != 8: return array("l", struct.unpack_from("<{}q".format(count), mapped, offset))
+    column.fromstring(mapped[offset : offset + length])
+    if sys.byteorder == "big": column.byteswap()
+    return column
+
+def _float64_column(mapped, section, count):
+    offset, length = section
+    if np is not None: return np.frombuffer(mapped, dtype = "<f8", count = count, offset = offset)
+    column = array("d")
+    column.fromstring(mapped[offset : offset + length])
+    if sys.byteorder == "big": column.byteswap()
+    return column
+
+def __test(graph):
+    """
+    Graph Storage Test.
+    
+    __test(graph) -> None
+    
+    @type graph: basegraph
+    @param graph: empty graph instance.    
+    """
+    import os
+    import tempfile
+    
+    print "### iPATH TEST STORAGE"
+    print "### Implementation: {}".format(str(graph.__class__.__name__))
+    
+    graph.add_nodes_from("node{}".format(i) for i in range(10))
+    for i in range(10): graph.add_arc(i, (i + 3) % 10, i)
+    graph.remove_node(4)
+    graph.set_arc_status(0, 3, "visited")
+    
+    handle, path = tempfile.mkstemp()
+    os.close(handle)
+    save_graph(graph, path)
+    loaded = load_graph(path)
+    
+    print "\n*** LOADED GRAPH ***\n"
+    print "\n{}\n".format(str(loaded))
+    print "directed: {} / {}, numArcs: {} / {}\n".format(str(loaded.is_directed()), str(graph.is_directed()), str(loaded.get_num_arcs()), str(graph.get_num_arcs()))
+    
+    print "\n*** SEARCH BFS/DFS ***\n"
+    for i in (0, 4, 5):
+        print "bfs({}): {} / {}".format(str(i), str([node._id for node in loaded.bfs(i)]), str([node._id for node in graph.bfs(i)]))
+        print "dfs({}): {}\n".format(str(i), str([node._id for node in loaded.dfs(i)]))
+    
+    os.remove(path)
+    
+    print "\n### END OF TEST ###\n"
+
+if __name__ == "__main__":
+    from model.graph import GraphIncidenceList, GraphIncidenceMap, DiGraph
+    __test(GraphIncidenceList())
+    __test(GraphIncidenceMap())
+    __test(DiGraph())
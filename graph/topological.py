@@ -0,0 +1,188 @@
+#Support Data-Structures Imports
+from model.queue import QueueDeque
+#Exception Import
+from exception.exceptions import GraphCycleError
+
+def topological_sort(graph):
+    """
+    Returns the ids of the nodes of the specified DAG in topological order, with Kahn's algorithm.
+
+    topological_sort(graph) -> ids_list
+
+    @type graph: basegraph
+    @param graph: directed acyclic graph.
+
+    @rtype: list
+    @return: node ids, each one before the heads of its arcs.
+
+    @raise GraphCycleError: if graph has a cycle, which is attached to the error as a list of node ids.
+    """
+    in_degrees = _in_degrees(graph)
+    q = QueueDeque()
+    for node_id, in_degree in in_degrees.iteritems():
+        if in_degree == 0: q.enqueue(node_id)
+    order = []
+    while not q.is_empty():
+        node_id = q.dequeue()
+        order.append(node_id)
+        for arc in graph.get_incident_arcs(node_id):
+            head_id = arc._head
+            if head_id not in in_degrees: continue
+            in_degrees[head_id] -= 1
+            if in_degrees[head_id] == 0: q.enqueue(head_id)
+    if len(order) < len(in_degrees): _raise_cycle(graph, in_degrees)
+    return order
+
+def topological_levels(graph):
+    """
+    Groups the nodes of the specified DAG into levels of independent nodes.
+
+    A node is in level k when the longest path reaching it from a source has k
+    arcs: the arcs entering a level all leave earlier levels, so the nodes of a
+    level can be processed concurrently once the previous levels are done.
+
+    topological_levels(graph) -> levels
+
+    @type graph: basegraph
+    @param graph: directed acyclic graph.
+
+    @rtype: list
+    @return: list of levels, each one a list of node ids.
+
+    @raise GraphCycleError: if graph has a cycle, which is attached to the error as a list of node ids.
+    """
+    in_degrees = _in_degrees(graph)
+    level = [node_id for node_id, in_degree in in_degrees.iteritems() if in_degree == 0]
+    levels = []
+    num_sorted = 0
+    while level:
+        levels.append(level)
+        num_sorted += len(level)
+        next_level = []
+        for node_id in level:
+            for arc in graph.get_incident_arcs(node_id):
+                head_id = arc._head
+                if head_id not in in_degrees: continue
+                in_degrees[head_id] -= 1
+                if in_degrees[head_id] == 0: next_level.append(head_id)
+        level = next_level
+    if num_sorted < len(in_degrees): _raise_cycle(graph, in_degrees)
+    return levels
+
+def run_levels(graph, task, pool = None):
+    """
+    Executes a task on every node of the specified DAG, one level at a time.
+
+    The nodes of a level are handed to the pool together, and a level starts
+    only when every task of the previous one has completed, so each task runs
+    after the tasks of all its predecessors.
+
+    run_levels(graph, task, pool) -> results
+
+    @type graph: basegraph
+    @param graph: directed acyclic graph of dependencies, with an arc from each node to the nodes depending on it.
+    @type task: callable
+    @param task: task(node_id), a module-level function if pool is a process pool.
+    @type pool: Pool
+    @param pool: multiprocessing.Pool, multiprocessing.pool.ThreadPool or any object with a map method, None to run in the calling thread.
+
+    @rtype: dict
+    @return: node_id -> result of its task.
+
+    @raise GraphCycleError: if graph has a cycle, before any task is executed.
+    """
+    results = {}
+    for level in topological_levels(graph):
+        level_results = map(task, level) if pool is None else pool.map(task, level)
+        results.update(zip(level, level_results))
+    return results
+
+def find_cycle(graph):
+    """
+    Returns a cycle of the specified graph, if any.
+
+    find_cycle(graph) -> cycle
+
+    @type graph: basegraph
+    @param graph: directed graph.
+
+    @rtype: list
+    @return: ids of the nodes of a cycle, each one the tail of an arc to the next one and the last to the first, None if graph is acyclic.
+    """
+    try:
+        topological_sort(graph)
+    except GraphCycleError as err:
+        return err.cycle
+    return None
+
+def _in_degrees(graph):
+    in_degrees = dict((node._id, 0) for node in graph.get_nodes())
+    for node_id in in_degrees:
+        for arc in graph.get_incident_arcs(node_id):
+            if arc._head in in_degrees: in_degrees[arc._head] += 1
+    return in_degrees
+
+def _raise_cycle(graph, in_degrees):
+    # Every node left with a positive in-degree has a predecessor which is left
+    # too, so walking back through predecessors must close a cycle.
+    predecessors = {}
+    for node_id, in_degree in in_degrees.iteritems():
+        if in_degree == 0: continue
+        for arc in graph.get_incident_arcs(node_id):
+            if in_degrees.get(arc._head, 0) > 0: predecessors[arc._head] = node_id
+    node_id = next(node_id for node_id in predecessors)
+    positions = {}
+    walk = []
+    while node_id not in positions:
+        positions[node_id] = len(walk)
+        walk.append(node_id)
+        node_id = predecessors[node_id]
+    cycle = walk[positions[node_id]:]
+    cycle.reverse()
+    raise GraphCycleError("topological_sort: graph has a cycle {}.".format(str(cycle)), cycle)
+
+def _square(node_id):
+    return node_id * node_id
+
+def __test(graph):
+    """
+    Topological Sort Test.
+
+    __test(graph) -> None
+
+    @type graph: basegraph
+    @param graph: empty directed graph instance.
+    """
+    print "### iPATH TEST ALGORITHM"
+    print "### Algorithm: Topological Sort ({})".format(str(graph.__class__.__name__))
+
+    graph.add_nodes_from(range(8))
+    graph.add_arcs_from([(0, 2), (1, 2), (2, 3), (2, 4), (3, 5), (4, 5), (1, 6), (6, 7)])
+
+    print "\n*** TOPOLOGICAL SORT ***\n"
+    print "order: {}\n".format(str(topological_sort(graph)))
+
+    print "\n*** LEVELS ***\n"
+    for k, level in enumerate(topological_levels(graph)):
+        print "level {}: {}".format(str(k), str(level))
+
+    print "\n*** RUN LEVELS ***\n"
+    pool = ThreadPool(4)
+    print "run_levels(square): {}\n".format(str(run_levels(graph, _square, pool)))
+    pool.close()
+    pool.join()
+
+    print "\n*** CYCLE ***\n"
+    print "find_cycle: {}".format(str(find_cycle(graph)))
+    graph.add_arc(5, 1)
+    try:
+        topological_sort(graph)
+    except GraphCycleError as err:
+        print "{} (cycle: {})\n".format(err.message, str(err.cycle))
+
+    print "\n### END OF TEST ###\n"
+
+if __name__ == "__main__":
+    from model.graph import DiGraph
+    from multiprocessing.pool import ThreadPool
+    __test(DiGraph())
@@ -0,0 +1,228 @@
+#Support Data-Structures Imports
+from model.graph import GraphCSR, freeze
+from graph.frontier import as_numpy
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# Maximum number of wedges checked at once by the vectorized kernel.
+CHUNK = 1 << 22
+
+def triangles(graph):
+    """
+    Counts the triangles each node of the specified graph belongs to.
+
+    Nodes are ranked by degree and every arc is oriented from its lower ranked
+    end, so that each triangle is found exactly once, from its lowest ranked
+    node, by intersecting the sorted oriented neighbours of the two ends of an
+    arc. No node has more than O(sqrt(arcs)) higher ranked neighbours, which
+    bounds the work to O(arcs * sqrt(arcs)). The intersections are vectorized
+    when NumPy is available.
+
+    triangles(graph) -> counts
+
+    @type graph: basegraph
+    @param graph: graph to be analyzed, frozen first if it is not a GraphCSR; arc directions, self-loops and parallel arcs are ignored.
+
+    @rtype: dict
+    @return: node_id -> number of triangles.
+    """
+    ids, counts, degrees = _count(graph)
+    return dict(zip(ids, counts))
+
+def local_clustering(graph):
+    """
+    Computes the local clustering coefficient of the nodes of the specified graph.
+
+    local_clustering(graph) -> coefficients
+
+    @type graph: basegraph
+    @param graph: graph to be analyzed, frozen first if it is not a GraphCSR; arc directions, self-loops and parallel arcs are ignored.
+
+    @rtype: dict
+    @return: node_id -> fraction of the pairs of its neighbours which are adjacent, 0 for nodes with less than two neighbours.
+    """
+    ids, counts, degrees = _count(graph)
+    return dict((ids[i], 2.0 * counts[i] / (degrees[i] * (degrees[i] - 1)) if degrees[i] > 1 else 0.0) for i in xrange(len(ids)))
+
+def average_clustering(graph):
+    """
+    Computes the average of the local clustering coefficients of the nodes of the specified graph.
+
+    average_clustering(graph) -> coefficient
+
+    @type graph: basegraph
+    @param graph: graph to be analyzed.
+
+    @rtype: float
+    @return: average local clustering coefficient, 0 for an empty graph.
+    """
+    coefficients = local_clustering(graph)
+    if not coefficients: return 0.0
+    return sum(coefficients.itervalues()) / len(coefficients)
+
+def global_clustering(graph):
+    """
+    Computes the global clustering coefficient (transitivity) of the specified graph.
+
+    global_clustering(graph) -> coefficient
+
+    @type graph: basegraph
+    @param graph: graph to be analyzed, frozen first if it is not a GraphCSR; arc directions, self-loops and parallel arcs are ignored.
+
+    @rtype: float
+    @return: three times the number of triangles over the number of paths of two arcs, 0 if there are none.
+    """
+    ids, counts, degrees = _count(graph)
+    triples = sum(int(degree) * (int(degree) - 1) / 2 for degree in degrees)
+    if triples == 0: return 0.0
+    return float(sum(int(count) for count in counts)) / triples
+
+def forward_triangles(offsets, targets):
+    """
+    Counts triangles on CSR arrays, indexed by dense node index.
+
+    The arcs are turned into a sorted array of oriented arc keys; the pairs of
+    oriented neighbours of each node are then generated in chunks and looked
+    up in it with a binary search.
+
+    forward_triangles(offsets, targets) -> (counts, degrees)
+
+    @type offsets: numpy.ndarray
+    @param offsets: CSR row offsets, one more than the number of nodes.
+    @type targets: numpy.ndarray
+    @param targets: CSR target indices.
+
+    @rtype: tuple
+    @return: number of triangles and number of distinct neighbours of each node.
+    """
+    num_nodes = len(offsets) - 1
+    sources = np.repeat(np.arange(num_nodes, dtype = np.int64), np.diff(offsets))
+    targets = np.asarray(targets, dtype = np.int64)
+    loops = sources == targets
+    keys = np.unique(np.minimum(sources, targets)[~loops] * num_nodes + np.maximum(sources, targets)[~loops])
+    a = keys // num_nodes
+    b = keys % num_nodes
+    degrees = np.bincount(a, minlength = num_nodes) + np.bincount(b, minlength = num_nodes)
+    rank = np.empty(num_nodes, dtype = np.int64)
+    rank[np.lexsort((np.arange(num_nodes), degrees))] = np.arange(num_nodes)
+    keys = np.sort(np.minimum(rank[a], rank[b]) * num_nodes + np.maximum(rank[a], rank[b]))
+    low = keys // num_nodes
+    high = keys % num_nodes
+    num_arcs = len(keys)
+    counts = np.zeros(num_nodes, dtype = np.int64)
+    if num_arcs == 0: return counts, degrees
+    out_degrees = np.bincount(low, minlength = num_nodes)
+    out_offsets = np.concatenate(([0], np.cumsum(out_degrees)))
+    # Each oriented arc pairs with the following arcs of its row.
+    partners = out_offsets[low + 1] - np.arange(num_arcs) - 1
+    ends = np.cumsum(partners)
+    starts = ends - partners
+    first_arc = 0
+    while first_arc < num_arcs:
+        last_arc = max(int(np.searchsorted(ends, starts[first_arc] + CHUNK, side = "right")), first_arc + 1)
+        chunk = partners[first_arc:last_arc]
+        total = int(chunk.sum())
+        if total > 0:
+            first = np.repeat(np.arange(first_arc, last_arc), chunk)
+            second = first + 1 + np.arange(total) - np.repeat(np.cumsum(chunk) - chunk, chunk)
+            x = high[first]
+            y = high[second]
+            wedges = x * num_nodes + y
+            found = np.searchsorted(keys, wedges)
+            found = keys[np.minimum(found, num_arcs - 1)] == wedges
+            counts += np.bincount(low[first][found], minlength = num_nodes)
+            counts += np.bincount(x[found], minlength = num_nodes)
+            counts += np.bincount(y[found], minlength = num_nodes)
+        first_arc = last_arc
+    return counts[rank], degrees
+
+def merge_triangles(offsets, targets):
+    """
+    Counts triangles on CSR arrays, indexed by dense node index, without NumPy.
+
+    merge_triangles(offsets, targets) -> (counts, degrees)
+
+    @type offsets: sequence
+    @param offsets: CSR row offsets, one more than the number of nodes.
+    @type targets: sequence
+    @param targets: CSR target indices.
+
+    @rtype: tuple
+    @return: number of triangles and number of distinct neighbours of each node.
+    """
+    num_nodes = len(offsets) - 1
+    neighbours = [set() for i in xrange(num_nodes)]
+    for i in xrange(num_nodes):
+        for k in xrange(offsets[i], offsets[i + 1]):
+            j = targets[k]
+            if j != i:
+                neighbours[i].add(j)
+                neighbours[j].add(i)
+    degrees = [len(neighbours[i]) for i in xrange(num_nodes)]
+    order = sorted(xrange(num_nodes), key = lambda i: (degrees[i], i))
+    rank = [0] * num_nodes
+    for r in xrange(num_nodes): rank[order[r]] = r
+    out = [sorted(rank[j] for j in neighbours[order[r]] if rank[j] > r) for r in xrange(num_nodes)]
+    counts = [0] * num_nodes
+    for u in xrange(num_nodes):
+        out_u = out[u]
+        for v in out_u:
+            for w in _common(out_u, out[v]):
+                counts[u] += 1
+                counts[v] += 1
+                counts[w] += 1
+    return [counts[rank[i]] for i in xrange(num_nodes)], degrees
+
+def _common(a, b):
+    i = 0
+    j = 0
+    while i < len(a) and j < len(b):
+        if a[i] < b[j]: i += 1
+        elif a[i] > b[j]: j += 1
+        else:
+            yield a[i]
+            i += 1
+            j += 1
+
+def _count(graph):
+    csr = graph if isinstance(graph, GraphCSR) else freeze(graph)
+    ids = list(csr._ids)
+    if np is None:
+        counts, degrees = merge_triangles(csr._offsets, csr._targets)
+    else:
+        counts, degrees = forward_triangles(as_numpy(csr._offsets), as_numpy(csr._targets))
+        counts = counts.tolist()
+        degrees = degrees.tolist()
+    return ids, counts, degrees
+
+def __test(graph):
+    """
+    Triangles Test.
+
+    __test(graph) -> None
+
+    @type graph: basegraph
+    @param graph: empty graph instance.
+    """
+    print "### iPATH TEST ALGORITHM"
+    print "### Algorithm: Triangles/Clustering ({})".format(str(graph.__class__.__name__))
+
+    graph.add_nodes_from(range(7))
+    graph.add_arcs_from([(0, 1), (0, 2), (1, 2), (1, 3), (2, 3), (3, 4), (4, 5), (5, 3), (5, 6), (6, 6)])
+
+    print "\n*** TRIANGLES ***\n"
+    print "{}\n".format(str(triangles(graph)))
+
+    print "\n*** CLUSTERING ***\n"
+    print "local: {}".format(str(dict((node_id, round(coefficient, 4)) for node_id, coefficient in local_clustering(graph).iteritems())))
+    print "average: {}".format(str(round(average_clustering(graph), 4)))
+    print "global: {}\n".format(str(round(global_clustering(graph), 4)))
+
+    print "\n### END OF TEST ###\n"
+
+if __name__ == "__main__":
+    from model.graph import GraphIncidenceSet, DiGraph
+    __test(GraphIncidenceSet())
+    __test(DiGraph())